@@ -4,15 +4,20 @@ Handles CV ranking requests and orchestration
 """
 
 import os
+import asyncio
 import logging
 from typing import List, Optional
 from pathlib import Path
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import aiofiles
+import httpx
 from dotenv import load_dotenv
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
@@ -30,10 +35,13 @@ init_db()
 # Load environment variables
 load_dotenv()
 
-from utils.loaders import DocumentLoader
+from utils.loaders import DocumentLoader, MAX_LOADER_PROCESSES
 from utils.security import SessionManager, SecurityValidator
+from utils.cache import LRUCache, content_hash
 from ingestion import IngestionPipeline
 from agent import CVAnalysisAgent
+from llm_cache import LLMCache
+from embed_cache import EmbeddingCache
 from ranking import RankingEngine
 from auth import auth_router
 from database import engine, Base
@@ -46,7 +54,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="HR AI Agent API",
     description="Production-ready HR Operations AI Agent for CV Ranking",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -65,16 +74,57 @@ app.include_router(auth_router)
 session_manager = SessionManager()
 document_loader = DocumentLoader()
 
+# JD embeddings keyed by JD content hash, reused across ranking requests
+jd_embedding_cache = LRUCache(maxsize=256)
+
+# Chunk size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Text extracted per CV; far beyond any real CV and the analysis token budget,
+# but stops a very long PDF from being decoded page by page to the end
+MAX_CV_CHARS = 60000
+
+# Number of CVs sent to the LLM in one analysis call
+ANALYSIS_GROUP_SIZE = int(os.getenv("ANALYSIS_GROUP_SIZE", "6"))
+
+# Maximum number of concurrent LLM analysis calls per ranking request
+RANK_MAX_CONCURRENCY = int(os.getenv("RANK_MAX_CONCURRENCY", "16"))
+
+# CVs per ranking request that get a full AI analysis, most semantically similar
+# first; the rest are scored on semantic similarity alone (0 analyzes every CV)
+RANK_MAX_LLM_CANDIDATES = int(os.getenv("RANK_MAX_LLM_CANDIDATES", "20"))
+
+# Persistent cache of LLM responses (set LLM_CACHE_ENABLED=false to bypass)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+llm_cache = None
+
+# Persistent cache of embeddings by text content (set EMBED_CACHE_ENABLED=false to bypass)
+EMBED_CACHE_ENABLED = os.getenv("EMBED_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+embed_cache = None
+
+# Worker processes for CPU-bound CV text extraction, kept off the GIL of the
+# event loop process (also keeps PDFium, which is not thread-safe, one per process)
+document_pool = None
+
 # These will be initialized on startup
 ingestion_pipeline = None
 analysis_agent = None
 ranking_engine = None
 
+# Shared HTTP connection pools for OpenAI calls (async for chat, sync for embeddings)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+http_client = None
+sync_http_client = None
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
-    global ingestion_pipeline, analysis_agent, ranking_engine
+    global ingestion_pipeline, analysis_agent, ranking_engine, http_client, sync_http_client, llm_cache, embed_cache
+    global document_pool
+    
+    # Start document workers before any client threads exist in this process
+    document_pool = ProcessPoolExecutor(max_workers=min(MAX_LOADER_PROCESSES, os.cpu_count() or 1))
     
     # Ensure database tables are created
     Base.metadata.create_all(bind=engine)
@@ -95,36 +145,61 @@ async def startup_event():
         return
     
     try:
+        # Keep-alive HTTP/2 pools reused by every OpenAI request
+        http_client = httpx.AsyncClient(limits=HTTP_LIMITS, http2=True)
+        sync_http_client = httpx.Client(limits=HTTP_LIMITS, http2=True)
+        
         # Initialize ingestion pipeline
+        embed_cache = EmbeddingCache(model_name="text-embedding-3-small", enabled=EMBED_CACHE_ENABLED)
         ingestion_pipeline = IngestionPipeline(
             pinecone_api_key=pinecone_api_key,
             pinecone_index_name=pinecone_index_name,
             openai_api_key=openai_api_key,
-            environment=pinecone_environment
+            environment=pinecone_environment,
+            http_client=sync_http_client,
+            embed_cache=embed_cache
         )
         
-        # Log index dimension for verification
-        index_info = ingestion_pipeline.pc.describe_index(pinecone_index_name)
-        logger.info(f"📊 Pinecone Index Dimension: {index_info.dimension} (Expected: 1536)")
-        if index_info.dimension != 1536:
-            logger.error(
-                f"❌ CRITICAL: Index dimension is {index_info.dimension}, but embeddings use 1536. "
-                f"Please recreate the index with dimension 1536."
-            )
-        else:
-            logger.info("✅ Pinecone index dimension verified: 1536")
+        # Log index dimension for verification (cached by the pipeline, no extra round-trip)
+        logger.info(f"📊 Pinecone Index Dimension: {ingestion_pipeline.index_dimension} (Expected: 1536)")
         
         # Initialize analysis agent
-        analysis_agent = CVAnalysisAgent(openai_api_key=openai_api_key)
+        llm_cache = LLMCache(enabled=LLM_CACHE_ENABLED)
+        analysis_agent = CVAnalysisAgent(
+            openai_api_key=openai_api_key,
+            http_client=http_client,
+            llm_cache=llm_cache
+        )
         
         # Initialize ranking engine
-        ranking_engine = RankingEngine(agent_analyzer=analysis_agent)
+        ranking_engine = RankingEngine(
+            agent_analyzer=analysis_agent,
+            analysis_group_size=ANALYSIS_GROUP_SIZE,
+            max_concurrency=RANK_MAX_CONCURRENCY
+        )
         
         logger.info("✅ All services initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing services: {str(e)}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close shared HTTP connection pools, document workers and the local caches"""
+    if document_pool is not None:
+        document_pool.shutdown(cancel_futures=True)
+    if http_client is not None:
+        await http_client.aclose()
+    if sync_http_client is not None:
+        sync_http_client.close()
+    if llm_cache is not None:
+        logger.info(f"LLM cache: {llm_cache.hits} hits, {llm_cache.misses} misses")
+        llm_cache.close()
+    if embed_cache is not None:
+        logger.info(f"Embedding cache: {embed_cache.hits} hits, {embed_cache.misses} misses")
+        embed_cache.close()
+
+
 class RankingResponse(BaseModel):
     """Response model for ranking results"""
     session_id: str
@@ -163,35 +238,47 @@ async def rank_cvs(
     if len(files) > 50:  # Reasonable limit
         raise HTTPException(status_code=400, detail="Maximum 50 CVs allowed per request")
     
+    # Validate all files up front so an invalid upload fails before any disk I/O
+    for file in files:
+        is_valid, error_msg = SecurityValidator.validate_file(
+            file.filename,
+            file.size
+        )
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=f"Invalid file {file.filename}: {error_msg}")
+    
     # Create session
     session_id = session_manager.create_session()
     
     try:
-        # Validate and save files
-        cv_file_paths = []
-        for file in files:
-            # Validate file
-            is_valid, error_msg = SecurityValidator.validate_file(
-                file.filename,
-                file.size
+        # Save files concurrently, each to its own path
+        saved_paths = await asyncio.gather(
+            *(
+                _save_upload(file, session_id, filename)
+                for file, filename in zip(files, _unique_filenames([file.filename for file in files]))
             )
-            if not is_valid:
-                raise HTTPException(status_code=400, detail=f"Invalid file {file.filename}: {error_msg}")
-            
-            # Read file content
-            file_content = await file.read()
-            
-            # Save to session directory
-            file_path = session_manager.save_file(session_id, file.filename, file_content)
-            cv_file_paths.append(str(file_path))
+        )
+        cv_file_paths = [str(file_path) for file_path in saved_paths]
         
         logger.info(f"Processing {len(cv_file_paths)} CVs for session {session_id}")
         
-        # Load documents
-        cv_data = document_loader.batch_load_documents(cv_file_paths)
+        # Load documents in parallel worker processes without blocking the event loop
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(document_pool, DocumentLoader.load_document, p, MAX_CV_CHARS)
+                for p in cv_file_paths
+            ),
+            return_exceptions=True
+        )
         
         # Filter out failed loads
-        cv_data = {k: v for k, v in cv_data.items() if v is not None}
+        cv_data = {}
+        for p, result in zip(cv_file_paths, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to load {p}: {str(result)}")
+            elif result:
+                cv_data[p] = result
         
         if not cv_data:
             raise HTTPException(status_code=500, detail="Failed to load any CV files")
@@ -203,26 +290,56 @@ async def rank_cvs(
                 detail="Services not initialized. Check API keys."
             )
         
-        # Ingest Job Description
-        jd_vector_id = ingestion_pipeline.ingest_job_description(jd_text=job_description, session_id=session_id)
-        
-        # Ingest CVs
-        cv_vector_ids = ingestion_pipeline.ingest_cvs(cv_data=cv_data, session_id=session_id)
-        
-        # Calculate semantic similarity scores
-        semantic_scores = await _calculate_semantic_scores(
-            ingestion_pipeline,
-            jd_text=job_description,
-            cv_data=cv_data,
-            session_id=session_id
+        # Extract structured JD requirements once for all CV analyses; the call
+        # runs while the blocking embedding/ingestion steps below are in threads
+        jd_requirements_task = asyncio.create_task(
+            analysis_agent.extract_jd_requirements(job_description)
         )
+        try:
+            # Embed the JD once and reuse it for ingestion and scoring
+            jd_embedding = await asyncio.to_thread(_get_jd_embedding, ingestion_pipeline, job_description)
+            
+            # Ingest Job Description
+            jd_vector_id = await asyncio.to_thread(
+                ingestion_pipeline.ingest_job_description,
+                jd_text=job_description,
+                session_id=session_id,
+                jd_embedding=jd_embedding
+            )
+            
+            # Ingest CVs
+            cv_vector_ids = await asyncio.to_thread(
+                ingestion_pipeline.ingest_cvs,
+                cv_data=cv_data,
+                session_id=session_id
+            )
+            
+            # Calculate semantic similarity scores
+            semantic_scores = await _calculate_semantic_scores(
+                ingestion_pipeline,
+                jd_embedding=jd_embedding,
+                cv_data=cv_data,
+                session_id=session_id
+            )
+            
+            jd_requirements = await jd_requirements_task
+        finally:
+            # Don't leave the LLM call running (and billing) if an earlier step failed
+            if not jd_requirements_task.done():
+                jd_requirements_task.cancel()
+            elif not jd_requirements_task.cancelled():
+                jd_requirements_task.exception()  # Mark any failure as retrieved
         
         # Rank candidates
-        ranked_candidates = ranking_engine.rank_candidates(
+        ranked_candidates = await ranking_engine.rank_candidates(
             jd_text=job_description,
             cv_data=cv_data,
             semantic_scores=semantic_scores,
-            session_id=session_id
+            session_id=session_id,
+            jd_requirements=jd_requirements,
+            max_llm_candidates=RANK_MAX_LLM_CANDIDATES or None,
+            jd_embedding=jd_embedding,
+            top_n=top_n
         )
         
         # Get top N candidates
@@ -237,6 +354,7 @@ async def rank_cvs(
                 "matched_skills": c.matched_skills,
                 "missing_skills": c.missing_skills,
                 "explanation": c.explanation,
+                "ai_analyzed": c.ai_analyzed,
                 "detailed_scores": {
                     "skill_match": c.skill_match_score,
                     "experience": c.experience_score,
@@ -255,7 +373,7 @@ async def rank_cvs(
         return RankingResponse(
             session_id=session_id,
             top_candidates=top_candidates_dict,
-            total_candidates=len(ranked_candidates),
+            total_candidates=len(cv_data),
             processing_time_seconds=round(processing_time, 2)
         )
     
@@ -270,9 +388,80 @@ async def rank_cvs(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+def _unique_filenames(filenames: List[str]) -> List[str]:
+    """
+    Make upload filenames unique within a request, so concurrent saves never share a path
+    
+    Args:
+        filenames: Original upload filenames
+        
+    Returns:
+        Filenames in the same order; the first occurrence keeps its name (the
+        candidate name is read from it), later duplicates get a numeric suffix
+    """
+    # Compare case-insensitively: "cv.pdf" and "CV.pdf" are one file on some filesystems
+    taken = {filename.lower() for filename in filenames}
+    seen = set()
+    unique = []
+    for filename in filenames:
+        candidate = filename
+        if candidate.lower() in seen:
+            path = Path(filename)
+            counter = 2
+            while True:
+                candidate = f"{path.stem}_{counter}{path.suffix}"
+                if candidate.lower() not in taken:
+                    break
+                counter += 1
+            taken.add(candidate.lower())
+        seen.add(candidate.lower())
+        unique.append(candidate)
+    return unique
+
+
+async def _save_upload(file: UploadFile, session_id: str, filename: str) -> Path:
+    """
+    Stream an uploaded file to the session directory in fixed-size chunks
+    
+    Args:
+        file: Uploaded file
+        session_id: Session identifier
+        filename: Name to save under (unique within the session)
+        
+    Returns:
+        Path to saved file
+    """
+    file_path = session_manager.path_for(session_id, filename)
+    async with aiofiles.open(file_path, 'wb') as out:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await out.write(chunk)
+    logger.info(f"Saved file {file.filename} as {filename} in session {session_id}")
+    return file_path
+
+
+def _get_jd_embedding(ingestion_pipeline: IngestionPipeline, jd_text: str) -> List[float]:
+    """
+    Embed a job description, reusing a cached vector for a repeated JD
+    
+    Args:
+        ingestion_pipeline: Initialized ingestion pipeline
+        jd_text: Job description text
+        
+    Returns:
+        JD embedding vector (text-embedding-3-small produces 1536 dimensions)
+    """
+    jd_text = jd_text[:8000]  # Limit length
+    jd_hash = content_hash(jd_text)
+    jd_embedding = jd_embedding_cache.get(jd_hash)
+    if jd_embedding is None:
+        jd_embedding = ingestion_pipeline.embeddings.embed_query(jd_text)
+        jd_embedding_cache.set(jd_hash, jd_embedding)
+    return jd_embedding
+
+
 async def _calculate_semantic_scores(
     ingestion_pipeline: IngestionPipeline,
-    jd_text: str,
+    jd_embedding: List[float],
     cv_data: dict,
     session_id: str
 ) -> dict:
@@ -281,38 +470,33 @@ async def _calculate_semantic_scores(
     
     Args:
         ingestion_pipeline: Initialized ingestion pipeline
-        jd_text: Job description text
+        jd_embedding: Precomputed JD embedding
         cv_data: Dict of CV texts
         session_id: Session identifier
         
     Returns:
         Dict mapping file_path -> similarity score (0-1)
     """
-    from langchain.text_splitter import RecursiveCharacterTextSplitter
+    file_paths = [file_path for file_path, cv_text in cv_data.items() if cv_text is not None]
+    if not file_paths:
+        return {}
     
-    # Generate JD embedding (text-embedding-3-small produces 1536 dimensions)
-    jd_embedding = ingestion_pipeline.embeddings.embed_query(jd_text[:8000])  # Limit length
-    
-    scores = {}
+    # Embed all CVs in a single request
+    cv_embeddings = await asyncio.to_thread(
+        ingestion_pipeline.embed_documents,
+        [cv_data[file_path][:8000] for file_path in file_paths]  # Limit length
+    )
     
-    # Query Pinecone for each CV
-    for file_path, cv_text in cv_data.items():
-        if cv_text is None:
-            continue
-        
-        # Generate CV embedding (text-embedding-3-small produces 1536 dimensions)
-        cv_embedding = ingestion_pipeline.embeddings.embed_query(cv_text[:8000])
-        
-        # Calculate cosine similarity
-        import numpy as np
-        similarity = np.dot(jd_embedding, cv_embedding) / (
-            np.linalg.norm(jd_embedding) * np.linalg.norm(cv_embedding)
-        )
-        
-        # Normalize to 0-1 range (cosine similarity is already -1 to 1, but typically 0-1)
-        scores[file_path] = max(0.0, similarity)
+    # Calculate cosine similarity for all CVs at once
+    jd_vec = np.asarray(jd_embedding, dtype=np.float32)
+    jd_vec /= np.linalg.norm(jd_vec) or 1.0
+    cv_mat = np.asarray(cv_embeddings, dtype=np.float32)
+    norms = np.linalg.norm(cv_mat, axis=1, keepdims=True)
+    cv_mat /= np.where(norms == 0, 1.0, norms)
+    similarities = cv_mat @ jd_vec
     
-    return scores
+    # Normalize to 0-1 range (cosine similarity is already -1 to 1, but typically 0-1)
+    return dict(zip(file_paths, np.clip(similarities, 0.0, 1.0).tolist()))
 
 
 @app.get("/download-cv/{session_id}/{filename:path}")
@@ -0,0 +1,36 @@
+"""
+Recommended Skills per Domain for the JD generator
+Defined in an imported module so the tables are built once per process rather
+than on every Streamlit rerun of the app script
+"""
+
+from types import MappingProxyType
+
+# Read-only mapping of domain -> recommended skills (tuples are shared, never copied)
+DOMAIN_SKILLS = MappingProxyType({
+    "Data Science": (
+        "Python", "SQL", "Statistics", "Probability", "Linear Algebra",
+        "Pandas", "NumPy", "Scikit-learn", "Machine Learning", "Deep Learning",
+        "Data Visualization", "Matplotlib", "Seaborn", "Jupyter", "R"
+    ),
+    "GenAI": (
+        "LLMs", "Prompt Engineering", "LangChain", "Vector Databases", "RAG",
+        "OpenAI APIs", "Pinecone", "Embeddings", "Transformers", "Hugging Face",
+        "Fine-tuning", "Tokenization", "Semantic Search", "Chroma", "Weaviate"
+    ),
+    "Backend": (
+        "Python", "Java", "REST APIs", "Microservices", "SQL", "NoSQL",
+        "Docker", "Kubernetes", "FastAPI", "Flask", "Spring Boot", "Node.js",
+        "PostgreSQL", "MongoDB", "Redis", "AWS", "GCP", "Azure"
+    ),
+    "AI Platform": (
+        "MLOps", "Model Deployment", "CI/CD", "Monitoring", "AWS", "GCP",
+        "Azure", "Airflow", "Kubeflow", "MLflow", "TensorFlow Serving",
+        "Model Registry", "A/B Testing", "Feature Stores", "Data Pipelines"
+    ),
+    "HR Analytics": (
+        "Python", "SQL", "Data Analysis", "Statistics", "Tableau", "Power BI",
+        "Excel", "HRIS", "People Analytics", "Predictive Analytics",
+        "Dashboard Design", "Reporting", "Workday", "SuccessFactors"
+    )
+})
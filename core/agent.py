@@ -1,58 +1,45 @@
 """
-LangChain Agent for CV Analysis and Matching
+Agent for CV Analysis and Matching
 Uses GPT-4.1 for intelligent CV-JD comparison
 """
 
 import os
 import json
-from typing import Dict, List, Optional
+import asyncio
+import re
+import orjson
+import httpx
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
 import logging
 
-from langchain.chat_models import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
+from openai import AsyncOpenAI
+
+from utils.cache import LRUCache, content_hash
+from utils.tokens import count_tokens, get_encoding, middle_trim
+from llm_cache import LLMCache
 
 logger = logging.getLogger(__name__)
 
+# Token budgets per input, leaving room for instructions, schema and output
+MAX_INPUT_TOKENS = 4000
+MAX_EXTRACTION_TOKENS = 2500
 
-class CVAnalysisAgent:
-    """
-    LangChain-based agent for analyzing CVs against Job Descriptions
-    Extracts skills, evaluates match, and provides explanations
-    """
-    
-    def __init__(self, openai_api_key: str, model_name: str = "gpt-4.1"):
-        """
-        Initialize CV Analysis Agent
-        
-        Args:
-            openai_api_key: OpenAI API key
-            model_name: Model to use (default: gpt-4.1, closest to GPT-4.1)
-        """
-        self.llm = ChatOpenAI(
-            openai_api_key=openai_api_key,
-            model_name=model_name,
-            temperature=0  # Lower temperature for more consistent analysis
-        )
-        
-        # Initialize analysis chain
-        self.analysis_chain = self._create_analysis_chain()
-        
-        logger.info(f"Initialized CV Analysis Agent with model: {model_name}")
-    
-    def _create_analysis_chain(self) -> LLMChain:
-        """Create LangChain chain for CV analysis"""
-        
-        analysis_prompt = PromptTemplate(
-            input_variables=["job_description", "cv_text"],
-            template="""
-You are an expert HR analyst specializing in candidate evaluation. Analyze the CV against the Job Description and provide a comprehensive assessment.
+# Output caps; a full analysis is a few hundred tokens, so these only bound the
+# tokens the rate limiter reserves per request instead of the model default
+MAX_ANALYSIS_OUTPUT_TOKENS = 1000
+MAX_EXTRACTION_OUTPUT_TOKENS = 1000
+
+# Upper bound on the combined CV tokens packed into one grouped analysis call
+MAX_GROUP_INPUT_TOKENS = 16000
 
-Job Description:
-{job_description}
 
-Candidate CV:
-{cv_text}
+# Static instructions, JD (or its extracted requirements) and output schema form
+# the system message. Only the CV changes between calls, so this prefix stays byte-identical across a
+# ranking request and is eligible for automatic prompt caching (>1024 tokens).
+ANALYSIS_SYSTEM_PROMPT = """
+You are an expert HR analyst specializing in candidate evaluation. You will be given candidate CVs in the user message. Analyze the CV against the job context below and provide a comprehensive assessment.
+
+{job_context}
 
 Analyze and provide a JSON response with the following structure:
 {{
@@ -67,25 +54,375 @@ Analyze and provide a JSON response with the following structure:
 }}
 
 Focus on:
-1. Extract all required skills from JD and check presence in CV
+1. Identify the required skills for the role and check presence in CV
 2. Evaluate years and relevance of experience
 3. Match tools, technologies, frameworks mentioned
 4. Assess seniority level alignment
 5. Provide clear, actionable explanation
 
+Grading rubric (apply consistently to every candidate):
+
+candidate_name:
+- Use the full name as written at the top of the CV or in the contact section.
+- Do not invent a name. If none can be found, use "Unknown".
+
+skill_match_score:
+- Use the required skills given (or, for a full JD, every skill it marks as required, mandatory or essential), then any preferred or nice-to-have skills.
+- Score the share of required skills clearly evidenced in the CV; preferred skills may add at most 10 points.
+- Count a skill only when the CV shows it in a role, project, certification or skills section. Close synonyms count (e.g. "Postgres" for "PostgreSQL"); unrelated technologies in the same family do not.
+- 90-100: all required skills present with depth. 70-89: most required skills present. 40-69: about half present. 0-39: few or none present.
+
+experience_score:
+- Compare total relevant years with the years requested in the JD; unrelated experience counts for little.
+- Weigh recency: hands-on work in the last three years matters more than older roles.
+- Reward comparable domain, industry, scale and scope of responsibility.
+- 90-100: meets or exceeds the requested years in directly relevant roles. 60-89: slightly short or partially relevant. 30-59: clearly short or only adjacent experience. 0-29: no relevant experience.
+
+tool_tech_score:
+- Consider only tools, platforms, frameworks, languages and methodologies named in the JD.
+- Credit practical usage described in roles or projects above a bare keyword list.
+- 90-100: uses nearly all named tools in practice. 60-89: uses most. 30-59: uses some. 0-29: uses few or none.
+
+seniority_score:
+- Infer the JD level (intern, junior, mid, senior, lead, manager, director or above) from title, years and responsibilities.
+- Infer the candidate level from titles, team leadership, ownership and impact.
+- 90-100: same level. 60-89: one level apart. 30-59: two levels apart. 0-29: more than two levels apart.
+
+matched_skills and missing_skills:
+- Use the skill names as written in the JD so results are comparable across candidates.
+- missing_skills lists only required or clearly important JD skills absent from the CV, most critical first.
+- Keep each list to at most 15 entries and do not repeat a skill in both lists.
+
+explanation:
+- Two to three sentences written for a recruiter.
+- Mention the strongest match, the most important gap, and an overall recommendation.
+- Do not restate the scores or include personal data beyond the candidate name.
+
+General rules:
+- Judge only what the CV states; do not assume skills that are not written.
+- Ignore formatting quality, photos, age, gender, nationality and other protected attributes.
+- Scores are numbers, not strings, and must stay within 0-100.
+
 Return ONLY valid JSON, no additional text.
 """
+
+# User message for grouped analysis; the system prompt stays the same as for single CVs
+GROUP_ANALYSIS_PROMPT = """
+The {count} numbered candidate CVs below are independent. Analyze each one separately against the job context.
+Return a JSON object whose "analyses" array has exactly {count} entries, one per CV, in the same order as the CVs.
+
+{cvs}
+"""
+
+JD_EXTRACTION_PROMPT = """
+Extract key requirements from the following Job Description:
+
+{job_description}
+
+Provide a JSON response with:
+{{
+    "required_skills": ["skill1", "skill2", ...],
+    "required_tools": ["tool1", "tool2", ...],
+    "required_experience_years": <number>,
+    "seniority_level": "junior/mid/senior/lead",
+    "key_responsibilities": ["responsibility1", ...]
+}}
+
+Return ONLY valid JSON, no additional text.
+"""
+
+# Structured output schemas; strict mode guarantees every field is present and typed
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+
+_CV_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "candidate_name": {"type": "string"},
+        "skill_match_score": {"type": "number"},
+        "experience_score": {"type": "number"},
+        "tool_tech_score": {"type": "number"},
+        "seniority_score": {"type": "number"},
+        "matched_skills": _STRING_LIST,
+        "missing_skills": _STRING_LIST,
+        "explanation": {"type": "string"}
+    },
+    "required": [
+        "candidate_name", "skill_match_score", "experience_score", "tool_tech_score",
+        "seniority_score", "matched_skills", "missing_skills", "explanation"
+    ],
+    "additionalProperties": False
+}
+
+CV_ANALYSIS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "cv_analysis",
+        "strict": True,
+        "schema": _CV_ANALYSIS_SCHEMA
+    }
+}
+
+# Strict mode requires an object at the root, so grouped analyses are wrapped
+CV_GROUP_ANALYSIS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "cv_group_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "analyses": {"type": "array", "items": _CV_ANALYSIS_SCHEMA}
+            },
+            "required": ["analyses"],
+            "additionalProperties": False
+        }
+    }
+}
+
+JD_REQUIREMENTS_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "jd_requirements",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "required_skills": _STRING_LIST,
+                "required_tools": _STRING_LIST,
+                "required_experience_years": {"type": "number"},
+                "seniority_level": {"type": "string"},
+                "key_responsibilities": _STRING_LIST
+            },
+            "required": [
+                "required_skills", "required_tools", "required_experience_years",
+                "seniority_level", "key_responsibilities"
+            ],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Markdown code fence around a JSON response (not expected with strict schemas,
+# but cheap to tolerate)
+FENCE_PATTERN = re.compile(r'^\s*```[a-zA-Z]*[ \t]*\n?|\n?```\s*$')
+
+
+def _parse_llm_json(raw: str) -> Dict:
+    """
+    Parse a JSON object from raw LLM output
+    
+    Args:
+        raw: Response text, optionally wrapped in a ``` fence
+        
+    Returns:
+        Parsed object
+        
+    Raises:
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    if raw.lstrip().startswith("```"):
+        raw = FENCE_PATTERN.sub("", raw)
+    return orjson.loads(raw)
+
+
+# Scalar analysis fields that can be surfaced before the full response finishes
+# streaming. A value only counts as final once it is followed by "," or "}".
+PARTIAL_FIELD_PATTERN = re.compile(
+    r'"(candidate_name|skill_match_score|experience_score|tool_tech_score|seniority_score)"'
+    r'\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?)\s*[,}]'
+)
+
+
+class CVAnalysisAgent:
+    """
+    LLM-based agent for analyzing CVs against Job Descriptions
+    Extracts skills, evaluates match, and provides explanations
+    """
+    
+    def __init__(
+        self,
+        openai_api_key: str,
+        model_name: str = "gpt-4.1",
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = 5,
+        llm_cache: Optional[LLMCache] = None
+    ):
+        """
+        Initialize CV Analysis Agent
+        
+        Args:
+            openai_api_key: OpenAI API key
+            model_name: Model to use (default: gpt-4.1, closest to GPT-4.1)
+            http_client: Optional shared async HTTP client for connection reuse
+            max_retries: Retries for rate-limited (429) and transient errors;
+                the client backs off exponentially and honors Retry-After
+            llm_cache: Optional persistent cache of raw responses; calls run at
+                temperature 0, so identical prompts are served from it
+        """
+        self.client = AsyncOpenAI(api_key=openai_api_key, http_client=http_client, max_retries=max_retries)
+        self.model_name = model_name
+        self.llm_cache = llm_cache
+        self.encoding = get_encoding(model_name)
+        
+        # Extracted JD requirements keyed by JD content hash
+        self._requirements_cache = LRUCache(maxsize=256)
+        
+        logger.info(f"Initialized CV Analysis Agent with model: {model_name}")
+    
+    async def _complete_json(
+        self,
+        system_prompt: str,
+        user_prompt: Optional[str] = None,
+        on_partial: Optional[Callable[[str, object], None]] = None,
+        response_format: Dict = CV_ANALYSIS_FORMAT,
+        max_tokens: int = MAX_ANALYSIS_OUTPUT_TOKENS
+    ) -> str:
+        """
+        Run a single streamed structured-output chat completion
+        
+        Args:
+            system_prompt: System message content
+            user_prompt: Optional user message content
+            on_partial: Optional callback invoked as on_partial(field, value)
+                as soon as each scalar analysis field is complete in the stream
+            response_format: Strict JSON schema the response must follow
+            max_tokens: Maximum number of output tokens
+            
+        Returns:
+            Raw JSON string returned by the model
+        """
+        cache_key = None
+        if self.llm_cache is not None and self.llm_cache.enabled:
+            cache_key = LLMCache.make_key(
+                self.model_name,
+                response_format["json_schema"]["name"],
+                system_prompt,
+                user_prompt or ""
+            )
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                if on_partial:
+                    self._emit_partial_fields(cached, set(), on_partial)
+                return cached
+        
+        messages = [{"role": "system", "content": system_prompt}]
+        if user_prompt is not None:
+            messages.append({"role": "user", "content": user_prompt})
+        
+        stream = await self.client.chat.completions.create(
+            model=self.model_name,
+            temperature=0,  # Lower temperature for more consistent analysis
+            max_tokens=max_tokens,
+            response_format=response_format,
+            messages=messages,
+            stream=True,
+            # Sent as raw body fields so older SDK releases accept them: route calls
+            # sharing a system prompt to the same prompt cache, and report usage
+            # (including cached prompt tokens) in the final chunk
+            extra_body={
+                "prompt_cache_key": content_hash(system_prompt),
+                "stream_options": {"include_usage": True}
+            }
         )
         
-        return LLMChain(llm=self.llm, prompt=analysis_prompt)
+        parts = []
+        seen_fields = set()
+        finish_reason = None
+        async for chunk in stream:
+            if getattr(chunk, "usage", None):
+                self._log_usage(chunk.usage)
+            if not chunk.choices:
+                continue
+            finish_reason = chunk.choices[0].finish_reason or finish_reason
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            
+            # Only rescan when a value may have just been terminated
+            if on_partial and ("," in delta or "}" in delta):
+                self._emit_partial_fields("".join(parts), seen_fields, on_partial)
+        
+        result = "".join(parts)
+        if finish_reason != "stop":
+            # Cut off (e.g. "length"): the JSON is incomplete, so never cache it
+            logger.warning(f"LLM response ended with finish_reason={finish_reason}")
+        elif cache_key is not None and result:
+            self.llm_cache.set(cache_key, result)
+        return result
     
-    def analyze_cv_match(self, jd_text: str, cv_text: str) -> Dict:
+    @staticmethod
+    def _log_usage(usage) -> None:
+        """Log prompt token usage, including how much was served from the prompt cache"""
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+        logger.info(
+            f"LLM usage: {usage.prompt_tokens} prompt tokens ({cached_tokens} cached), "
+            f"{usage.completion_tokens} completion tokens"
+        )
+    
+    @staticmethod
+    def _emit_partial_fields(
+        buffer: str,
+        seen_fields: set,
+        on_partial: Callable[[str, object], None]
+    ) -> None:
+        """Report newly completed scalar fields found in a partial JSON buffer"""
+        for match in PARTIAL_FIELD_PATTERN.finditer(buffer):
+            field = match.group(1)
+            if field in seen_fields:
+                continue
+            seen_fields.add(field)
+            try:
+                on_partial(field, orjson.loads(match.group(2)))
+            except Exception as e:
+                logger.warning(f"Partial field callback failed for {field}: {str(e)}")
+    
+    def _build_analysis_prompt(self, jd_text: str, jd_requirements: Optional[Dict] = None) -> str:
+        """
+        Build the system prompt for CV analysis against a single Job Description
+        
+        The job context is baked into the system message up front so every CV
+        call for the same request shares an identical, cacheable prompt prefix
+        and only the user message (the CV) varies. When structured requirements
+        have already been extracted they replace the much longer raw JD.
+        """
+        if self._has_requirements(jd_requirements):
+            requirements_json = orjson.dumps(
+                jd_requirements,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            ).decode()
+            job_context = f"Job Requirements (extracted from the Job Description):\n{requirements_json}"
+        else:
+            job_context = f"Job Description:\n{self._truncate(jd_text)}"
+        
+        return ANALYSIS_SYSTEM_PROMPT.format(job_context=job_context)
+    
+    @staticmethod
+    def _has_requirements(jd_requirements: Optional[Dict]) -> bool:
+        """Check whether extracted requirements contain usable skills or tools"""
+        return bool(
+            jd_requirements
+            and (jd_requirements.get("required_skills") or jd_requirements.get("required_tools"))
+        )
+    
+    async def analyze_cv_match(
+        self,
+        jd_text: str,
+        cv_text: str,
+        on_partial: Optional[Callable[[str, object], None]] = None,
+        jd_requirements: Optional[Dict] = None
+    ) -> Dict:
         """
         Analyze CV against Job Description
         
         Args:
             jd_text: Job description text
             cv_text: CV/resume text
+            on_partial: Optional callback receiving (field, value) for scalar
+                fields (name and scores) as soon as they finish streaming
+            jd_requirements: Optional output of extract_jd_requirements, used
+                in place of the raw JD for a smaller prompt
             
         Returns:
             Dictionary with analysis results
@@ -100,64 +437,245 @@ Return ONLY valid JSON, no additional text.
                 logger.error("Empty CV text provided")
                 return self._get_default_analysis("Please provide a CV.")
             
-            # Truncate texts if too long (to avoid token limits)
-            max_chars = 15000
-            jd_text = jd_text[:max_chars] if len(jd_text) > max_chars else jd_text
-            cv_text = cv_text[:max_chars] if len(cv_text) > max_chars else cv_text
-            
-            # Run analysis chain
-            result = self.analysis_chain.run(
-                job_description=jd_text,
-                cv_text=cv_text
+            result = await self._complete_json(
+                self._build_analysis_prompt(jd_text, jd_requirements),
+                self._truncate(cv_text),
+                on_partial=on_partial
             )
             
-            # Validate result is not empty
-            if not result:
-                logger.error("LLM returned empty response")
-                return self._get_default_analysis("LLM returned empty output. Please try again.")
+            return self._parse_analysis(result)
+        except Exception as e:
+            logger.error(f"Error analyzing CV: {str(e)}")
+            return self._get_default_analysis("Analysis could not be completed. Please try again.")
+    
+    async def analyze_cv_match_stream(
+        self,
+        jd_text: str,
+        cv_text: str,
+        jd_requirements: Optional[Dict] = None
+    ) -> AsyncIterator[Tuple[str, object]]:
+        """
+        Analyze CV against Job Description, yielding results as they stream
+        
+        Args:
+            jd_text: Job description text
+            cv_text: CV/resume text
+            jd_requirements: Optional output of extract_jd_requirements, used
+                in place of the raw JD for a smaller prompt
             
-            # Clean result (remove markdown code blocks if present)
-            result = result.strip()
+        Yields:
+            (field, value) for the candidate name and each score as soon as it
+            is complete, then ("analysis", full analysis dict) once the
+            response has finished (the same dict analyze_cv_match returns)
+        """
+        updates = asyncio.Queue()
+        task = asyncio.create_task(self.analyze_cv_match(
+            jd_text,
+            cv_text,
+            on_partial=lambda field, value: updates.put_nowait((field, value)),
+            jd_requirements=jd_requirements
+        ))
+        task.add_done_callback(lambda _: updates.put_nowait(None))
+        
+        try:
+            while True:
+                update = await updates.get()
+                if update is None:
+                    break
+                yield update
+            yield "analysis", task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+    
+    async def analyze_cvs_batch(
+        self,
+        jd_text: str,
+        cv_items: List[str],
+        max_concurrency: int = 16,
+        on_partial: Optional[Callable[[int, str, object], None]] = None,
+        jd_requirements: Optional[Dict] = None,
+        group_size: int = 1
+    ) -> List[Dict]:
+        """
+        Analyze multiple CVs against the same Job Description concurrently
+        
+        Args:
+            jd_text: Job description text
+            cv_items: List of CV/resume texts
+            max_concurrency: Maximum number of in-flight LLM requests
+            on_partial: Optional callback receiving (cv_index, field, value)
+                as each CV's scalar fields finish streaming (single-CV calls only)
+            jd_requirements: Optional output of extract_jd_requirements, used
+                in place of the raw JD for a smaller prompt
+            group_size: Maximum number of CVs packed into one LLM call, so the
+                instructions and job context are sent once per group instead
+                of once per CV (groups are also capped by MAX_GROUP_INPUT_TOKENS)
             
-            if result.startswith("```json"):
-                result = result[7:]
-            elif result.startswith("```"):
-                result = result[3:]
+        Returns:
+            List of analysis dictionaries, in the same order as cv_items
+        """
+        if not jd_text or not jd_text.strip():
+            logger.error("Empty job description provided")
+            return [self._get_default_analysis("Please provide a Job Description.") for _ in cv_items]
+        
+        analyses = [None] * len(cv_items)
+        pending = []
+        for i, cv_text in enumerate(cv_items):
+            if not cv_text or not cv_text.strip():
+                logger.error("Empty CV text provided")
+                analyses[i] = self._get_default_analysis("Please provide a CV.")
+            else:
+                pending.append(i)
+        
+        if pending:
+            system_prompt = self._build_analysis_prompt(jd_text, jd_requirements)
+            semaphore = asyncio.Semaphore(max_concurrency)
             
-            if result.endswith("```"):
-                result = result[:-3]
+            if group_size > 1:
+                await self._analyze_groups(system_prompt, cv_items, pending, analyses, group_size, semaphore)
+                logger.info(f"Analyzed {len(pending)} CVs in groups of up to {group_size} (max concurrency: {max_concurrency})")
+                return analyses
             
-            result = result.strip()
+            async def _analyze(index: int) -> str:
+                callback = None
+                if on_partial:
+                    callback = lambda field, value: on_partial(index, field, value)
+                async with semaphore:
+                    return await self._complete_json(
+                        system_prompt,
+                        self._truncate(cv_items[index]),
+                        on_partial=callback
+                    )
             
-            # Validate cleaned result is not empty
-            if not result:
-                logger.error("LLM returned empty output after cleaning")
-                return self._get_default_analysis("LLM returned empty output. Please try again.")
+            outputs = await asyncio.gather(
+                *(_analyze(i) for i in pending),
+                return_exceptions=True
+            )
             
-            # Validate before parsing JSON
-            if not result or not result.strip():
-                logger.error("Empty response received before JSON parsing")
-                return self._get_default_analysis("Empty response received. Please try again.")
+            for i, output in zip(pending, outputs):
+                if isinstance(output, Exception):
+                    logger.error(f"Error analyzing CV: {str(output)}")
+                    analyses[i] = self._get_default_analysis("Analysis could not be completed. Please try again.")
+                else:
+                    analyses[i] = self._parse_analysis(output)
+        
+        logger.info(f"Analyzed {len(pending)} CVs in batch (max concurrency: {max_concurrency})")
+        return analyses
+    
+    def analyze_cvs_batch_sync(self, jd_text: str, cv_items: List[str], **kwargs) -> List[Dict]:
+        """
+        Blocking wrapper around analyze_cvs_batch for callers without an event loop
+        
+        Args:
+            jd_text: Job description text
+            cv_items: List of CV/resume texts
+            **kwargs: Passed through to analyze_cvs_batch
             
-            # Parse JSON response
-            analysis = json.loads(result)
+        Returns:
+            List of analysis dictionaries, in the same order as cv_items
+        """
+        return asyncio.run(self.analyze_cvs_batch(jd_text, cv_items, **kwargs))
+    
+    async def _analyze_groups(
+        self,
+        system_prompt: str,
+        cv_items: List[str],
+        pending: List[int],
+        analyses: List[Optional[Dict]],
+        group_size: int,
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """
+        Analyze CVs several at a time, filling analyses in place
+        
+        Args:
+            system_prompt: Shared analysis system prompt
+            cv_items: List of CV/resume texts
+            pending: Indices of the CVs to analyze
+            analyses: Result list, indexed like cv_items
+            group_size: Maximum number of CVs per call
+            semaphore: Limits the number of in-flight calls
+        """
+        # Split into groups by count and by combined token size
+        groups = []
+        current, current_tokens = [], 0
+        truncated = {}
+        for i in pending:
+            text = self._truncate(cv_items[i])
+            tokens = count_tokens(text, self.encoding)
+            if current and (len(current) >= group_size or current_tokens + tokens > MAX_GROUP_INPUT_TOKENS):
+                groups.append(current)
+                current, current_tokens = [], 0
+            truncated[i] = text
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        
+        async def _analyze_group(group: List[int]) -> str:
+            if len(group) == 1:
+                user_prompt, response_format = truncated[group[0]], CV_ANALYSIS_FORMAT
+            else:
+                cvs = "\n\n".join(f"CV [{n}]:\n{truncated[i]}" for n, i in enumerate(group, 1))
+                user_prompt = GROUP_ANALYSIS_PROMPT.format(count=len(group), cvs=cvs)
+                response_format = CV_GROUP_ANALYSIS_FORMAT
+            async with semaphore:
+                return await self._complete_json(
+                    system_prompt,
+                    user_prompt,
+                    response_format=response_format,
+                    max_tokens=MAX_ANALYSIS_OUTPUT_TOKENS * len(group)
+                )
+        
+        outputs = await asyncio.gather(*(_analyze_group(g) for g in groups), return_exceptions=True)
+        
+        for group, output in zip(groups, outputs):
+            if isinstance(output, Exception):
+                logger.error(f"Error analyzing CV group: {str(output)}")
+                for i in group:
+                    analyses[i] = self._get_default_analysis("Analysis could not be completed. Please try again.")
+                continue
+            if len(group) == 1:
+                analyses[group[0]] = self._parse_analysis(output)
+                continue
             
-            # Validate and set defaults
-            analysis.setdefault("candidate_name", "Unknown")
-            analysis.setdefault("skill_match_score", 0.0)
-            analysis.setdefault("experience_score", 0.0)
-            analysis.setdefault("tool_tech_score", 0.0)
-            analysis.setdefault("seniority_score", 0.0)
-            analysis.setdefault("matched_skills", [])
-            analysis.setdefault("missing_skills", [])
-            analysis.setdefault("explanation", "Analysis completed.")
+            try:
+                items = _parse_llm_json(output)["analyses"]
+            except Exception as e:
+                logger.error(f"Failed to parse grouped analysis response: {str(e)}")
+                items = []
+            if len(items) != len(group):
+                logger.error(f"Grouped analysis returned {len(items)} results for {len(group)} CVs")
+                items = []
+            for n, i in enumerate(group):
+                analyses[i] = (
+                    self._validate_analysis(items[n]) if items
+                    else self._get_default_analysis("Analysis could not be completed. Please try again.")
+                )
+    
+    def _truncate(self, text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
+        """Trim text to a token budget, keeping its start and end (to avoid token limits)"""
+        return middle_trim(text, max_tokens, self.encoding)
+    
+    def _parse_analysis(self, result: str) -> Dict:
+        """
+        Parse and validate raw LLM output for a CV analysis
+        
+        Args:
+            result: Raw JSON response text
             
-            # Ensure scores are in valid range
-            for score_key in ["skill_match_score", "experience_score", "tool_tech_score", "seniority_score"]:
-                analysis[score_key] = max(0.0, min(100.0, float(analysis[score_key])))
+        Returns:
+            Dictionary with analysis results
+        """
+        try:
+            # Validate result is not empty
+            if not result:
+                logger.error("LLM returned empty response")
+                return self._get_default_analysis("LLM returned empty output. Please try again.")
             
-            logger.info(f"Analyzed CV for candidate: {analysis.get('candidate_name')}")
-            return analysis
+            # Parse JSON response (schema-valid, so every field is present)
+            return self._validate_analysis(_parse_llm_json(result))
             
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {str(e)}")
@@ -168,6 +686,26 @@ Return ONLY valid JSON, no additional text.
             logger.error(f"Error analyzing CV: {str(e)}")
             return self._get_default_analysis("Analysis could not be completed. Please try again.")
     
+    def _validate_analysis(self, analysis: Dict) -> Dict:
+        """
+        Clamp scores of a parsed analysis to the 0-100 range
+        
+        Args:
+            analysis: Schema-valid analysis dictionary
+            
+        Returns:
+            The same dictionary, with scores clamped
+        """
+        try:
+            for score_key in ["skill_match_score", "experience_score", "tool_tech_score", "seniority_score"]:
+                analysis[score_key] = max(0.0, min(100.0, float(analysis[score_key])))
+        except Exception as e:
+            logger.error(f"Invalid analysis result: {str(e)}")
+            return self._get_default_analysis("Analysis could not be completed. Please try again.")
+        
+        logger.info(f"Analyzed CV for candidate: {analysis.get('candidate_name')}")
+        return analysis
+    
     def _get_default_analysis(self, explanation: str = "Analysis could not be completed. Please try again.") -> Dict:
         """Return default analysis structure on error"""
         return {
@@ -178,10 +716,11 @@ Return ONLY valid JSON, no additional text.
             "seniority_score": 0.0,
             "matched_skills": [],
             "missing_skills": [],
-            "explanation": explanation
+            "explanation": explanation,
+            "analysis_failed": True
         }
     
-    def extract_jd_requirements(self, jd_text: str) -> Dict[str, List[str]]:
+    async def extract_jd_requirements(self, jd_text: str) -> Dict[str, List[str]]:
         """
         Extract key requirements from Job Description
         
@@ -191,109 +730,48 @@ Return ONLY valid JSON, no additional text.
         Returns:
             Dictionary with extracted requirements
         """
-        extraction_prompt = PromptTemplate(
-            input_variables=["job_description"],
-            template="""
-Extract key requirements from the following Job Description:
-
-{job_description}
-
-Provide a JSON response with:
-{{
-    "required_skills": ["skill1", "skill2", ...],
-    "required_tools": ["tool1", "tool2", ...],
-    "required_experience_years": <number>,
-    "seniority_level": "junior/mid/senior/lead",
-    "key_responsibilities": ["responsibility1", ...]
-}}
-
-Return ONLY valid JSON, no additional text.
-"""
-        )
-        
-        extraction_chain = LLMChain(llm=self.llm, prompt=extraction_prompt)
-        
         try:
             # Validate input
             if not jd_text or not jd_text.strip():
                 logger.error("Empty job description provided for extraction")
-                return {
-                    "required_skills": [],
-                    "required_tools": [],
-                    "required_experience_years": 0,
-                    "seniority_level": "unknown",
-                    "key_responsibilities": []
-                }
-            
-            result = extraction_chain.run(job_description=jd_text[:10000])
-            
-            # Validate result is not empty
-            if not result:
-                logger.error("LLM returned empty response for JD extraction")
-                return {
-                    "required_skills": [],
-                    "required_tools": [],
-                    "required_experience_years": 0,
-                    "seniority_level": "unknown",
-                    "key_responsibilities": []
-                }
+                return self._get_default_requirements()
             
-            # Clean and parse JSON
-            result = result.strip()
+            jd_hash = content_hash(jd_text)
+            cached = self._requirements_cache.get(jd_hash)
+            if cached is not None:
+                logger.info("Using cached JD requirements")
+                return dict(cached)
             
-            if result.startswith("```json"):
-                result = result[7:]
-            elif result.startswith("```"):
-                result = result[3:]
-            
-            if result.endswith("```"):
-                result = result[:-3]
-            
-            result = result.strip()
-            
-            # Validate cleaned result is not empty
-            if not result:
-                logger.error("LLM returned empty output after cleaning for JD extraction")
-                return {
-                    "required_skills": [],
-                    "required_tools": [],
-                    "required_experience_years": 0,
-                    "seniority_level": "unknown",
-                    "key_responsibilities": []
-                }
+            result = await self._complete_json(
+                JD_EXTRACTION_PROMPT.format(job_description=self._truncate(jd_text, MAX_EXTRACTION_TOKENS)),
+                response_format=JD_REQUIREMENTS_FORMAT,
+                max_tokens=MAX_EXTRACTION_OUTPUT_TOKENS
+            )
             
-            # Validate before parsing JSON
+            # Validate result is not empty
             if not result or not result.strip():
-                logger.error("Empty response received before JSON parsing for JD extraction")
-                return {
-                    "required_skills": [],
-                    "required_tools": [],
-                    "required_experience_years": 0,
-                    "seniority_level": "unknown",
-                    "key_responsibilities": []
-                }
+                logger.error("LLM returned empty response for JD extraction")
+                return self._get_default_requirements()
             
             # Parse JSON response
-            requirements = json.loads(result)
-            return requirements
+            requirements = _parse_llm_json(result)
+            self._requirements_cache.set(jd_hash, requirements)
+            return dict(requirements)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response for JD extraction: {str(e)}")
             if 'result' in locals():
                 logger.error(f"Raw response: {result[:500] if result else 'None'}")
-            return {
-                "required_skills": [],
-                "required_tools": [],
-                "required_experience_years": 0,
-                "seniority_level": "unknown",
-                "key_responsibilities": []
-            }
+            return self._get_default_requirements()
         except Exception as e:
             logger.error(f"Error extracting JD requirements: {str(e)}")
-            return {
-                "required_skills": [],
-                "required_tools": [],
-                "required_experience_years": 0,
-                "seniority_level": "unknown",
-                "key_responsibilities": []
-            }
-
+            return self._get_default_requirements()
+    
+    def _get_default_requirements(self) -> Dict:
+        """Return empty requirements structure on error"""
+        return {
+            "required_skills": [],
+            "required_tools": [],
+            "required_experience_years": 0,
+            "seniority_level": "unknown",
+            "key_responsibilities": []
+        }
@@ -0,0 +1,135 @@
+"""
+Persistent Embedding Cache
+SQLite-backed store of embedding vectors keyed by text content and model
+Vectors are stored int8-quantized (one float32 scale per vector), a quarter of
+the float32 size; cosine similarity is practically unaffected
+"""
+
+import os
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, List
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Cache file lives next to the other local databases
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+EMBED_CACHE_PATH = os.path.join(BASE_DIR, "embed_cache.db")
+
+# SQLite limits the number of bound parameters per statement
+_SELECT_BATCH_SIZE = 500
+
+# Bytes of the float32 scale stored in front of each quantized vector
+_SCALE_BYTES = 4
+
+
+def quantize(vector: List[float]) -> bytes:
+    """
+    Quantize a vector to int8 with a per-vector scale
+
+    Args:
+        vector: Embedding vector
+
+    Returns:
+        float32 scale followed by the int8 components
+    """
+    values = np.asarray(vector, dtype=np.float32)
+    max_abs = float(np.max(np.abs(values))) if values.size else 0.0
+    scale = np.float32(max_abs / 127.0 if max_abs else 1.0)
+    quantized = np.round(values / scale).astype(np.int8)
+    return scale.tobytes() + quantized.tobytes()
+
+
+def dequantize(blob: bytes) -> np.ndarray:
+    """
+    Restore a float32 vector from quantize() output
+
+    Args:
+        blob: float32 scale followed by int8 components
+
+    Returns:
+        float32 vector
+    """
+    scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+    return np.frombuffer(blob, dtype=np.int8, offset=_SCALE_BYTES).astype(np.float32) * scale
+
+
+class EmbeddingCache:
+    """
+    Cache of embedding vectors so identical texts are embedded only once
+    Safe to share between threads of one process
+    """
+
+    def __init__(self, model_name: str, path: str = EMBED_CACHE_PATH, enabled: bool = True):
+        """
+        Initialize embedding cache
+
+        Args:
+            model_name: Embedding model; vectors of different models never mix
+            path: SQLite database file
+            enabled: When False every lookup misses and nothing is stored
+        """
+        self.model_name = model_name
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if enabled:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_int8 (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+            logger.info(f"Embedding cache enabled at {path}")
+
+    def make_key(self, text: str) -> str:
+        """Key for text under this cache's model (SHA-256 hex digest)"""
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up vectors for many keys at once
+
+        Args:
+            keys: Keys from make_key
+
+        Returns:
+            Dict mapping each cached key to its vector (missing keys are absent)
+        """
+        if not self.enabled or not keys:
+            return {}
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _SELECT_BATCH_SIZE):
+                batch = keys[start:start + _SELECT_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings_int8 WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = dequantize(blob).tolist()
+        self.hits += len(found)
+        self.misses += len(set(keys)) - len(found)
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """Store vectors keyed by make_key, keeping any existing entries"""
+        if not self.enabled or not items:
+            return
+        rows = [(key, quantize(vector)) for key, vector in items.items()]
+        with self._lock:
+            self._conn.executemany("INSERT OR IGNORE INTO embeddings_int8 (key, vector) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self.enabled = False
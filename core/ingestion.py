@@ -4,17 +4,51 @@ Handles document loading, chunking, and embedding generation
 """
 
 import os
+import re
 from typing import List, Dict, Optional
 from pathlib import Path
 import logging
 
+import httpx
 from langchain_openai import OpenAIEmbeddings
 from pinecone import Pinecone, ServerlessSpec
 from utils.loaders import DocumentLoader
 from utils.splitter import CVTextSplitter
+from embed_cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
+# gRPC client (the pinecone[grpc] extra) multiplexes concurrent upserts over
+# one HTTP/2 connection; the REST client is used when it is not installed
+try:
+    from pinecone.grpc import PineconeGRPC
+    PINECONE_GRPC_AVAILABLE = True
+except ImportError:
+    PINECONE_GRPC_AVAILABLE = False
+
+# Pinecone supports up to 100 vectors per upsert; batches are sent in parallel
+UPSERT_BATCH_SIZE = 100
+UPSERT_POOL_THREADS = 30
+
+# Vector IDs fetched per request when reading stored vectors back
+FETCH_BATCH_SIZE = 100
+
+# CV chunks embedded per request; each slice is upserted while the next is embedded
+EMBED_BATCH_SIZE = 512
+
+
+# Candidate names: up to three words of letters (dots allowed in text, e.g. "J. Smith")
+_LETTERS = r"[^\W\d_]+"
+_NAME_WORD = r"(?:\.*[^\W\d_])+\.*"
+FILENAME_NAME_PATTERN = re.compile(rf" *{_LETTERS}(?: +{_LETTERS}){{0,2}} *")
+NAME_LINE_PATTERN = re.compile(
+    rf"^[^\S\n]*({_NAME_WORD}(?:[^\S\n]+{_NAME_WORD}){{0,2}})[^\S\n]*$",
+    re.MULTILINE
+)
+
+# Only the first lines of a CV are searched for a name
+NAME_SEARCH_LINES = 5
+
 
 class IngestionPipeline:
     """
@@ -27,7 +61,10 @@ class IngestionPipeline:
         pinecone_api_key: str,
         pinecone_index_name: str,
         openai_api_key: str,
-        environment: str = "us-east-1"
+        environment: str = "us-east-1",
+        http_client: Optional[httpx.Client] = None,
+        embed_cache: Optional[EmbeddingCache] = None,
+        assume_dimension: bool = True
     ):
         """
         Initialize ingestion pipeline
@@ -37,21 +74,35 @@ class IngestionPipeline:
             pinecone_index_name: Name of Pinecone index
             openai_api_key: OpenAI API key for embeddings
             environment: Pinecone environment/region
+            http_client: Optional shared HTTP client for embedding requests
+            embed_cache: Optional persistent cache so identical texts (e.g. a CV
+                uploaded again in a later session) are not re-embedded
+            assume_dimension: Trust an existing index to match the embedding
+                dimension instead of calling describe_index at startup; the
+                dimension is checked only if an upsert later fails
         """
         # Initialize OpenAI embeddings with text-embedding-3-small (1536 dimensions)
         self.embeddings = OpenAIEmbeddings(
             openai_api_key=openai_api_key,
-            model="text-embedding-3-small"
+            model="text-embedding-3-small",
+            http_client=http_client
         )
         self.embedding_dimension = 1536
+        self.embed_cache = embed_cache
+        self.assume_dimension = assume_dimension
         
         # Initialize Pinecone
-        self.pc = Pinecone(api_key=pinecone_api_key)
+        self.use_grpc = PINECONE_GRPC_AVAILABLE
+        self.pc = PineconeGRPC(api_key=pinecone_api_key) if self.use_grpc else Pinecone(api_key=pinecone_api_key)
         self.index_name = pinecone_index_name
         
         # Get or create index with dimension 1536
         index_dimension = self._ensure_index_exists(environment)
-        self.index = self.pc.Index(self.index_name)
+        self.index_dimension = index_dimension
+        if self.use_grpc:
+            self.index = self.pc.Index(self.index_name)
+        else:
+            self.index = self.pc.Index(self.index_name, pool_threads=UPSERT_POOL_THREADS)
         
         # Verify dimension matches
         if index_dimension != 1536:
@@ -72,7 +123,8 @@ class IngestionPipeline:
         
         logger.info(
             f"✅ Initialized ingestion pipeline - Index: {pinecone_index_name}, "
-            f"Model: text-embedding-3-small, Dimension: {index_dimension}"
+            f"Model: text-embedding-3-small, Dimension: {index_dimension}, "
+            f"Transport: {'gRPC' if self.use_grpc else 'REST'}"
         )
     
     def _ensure_index_exists(self, environment: str) -> int:
@@ -99,6 +151,9 @@ class IngestionPipeline:
             )
             logger.info(f"✅ Created Pinecone index '{self.index_name}' with dimension {dimension}")
             return dimension
+        elif self.assume_dimension:
+            logger.info(f"✅ Using existing Pinecone index '{self.index_name}' (assumed dimension {self.embedding_dimension})")
+            return self.embedding_dimension
         else:
             # Get existing index dimension
             index_info = self.pc.describe_index(self.index_name)
@@ -106,22 +161,89 @@ class IngestionPipeline:
             logger.info(f"✅ Using existing Pinecone index '{self.index_name}' with dimension {dimension}")
             return dimension
     
-    def ingest_job_description(self, jd_text: str, session_id: str) -> str:
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, serving repeats from the embedding cache when configured
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding vector per text, in order
+        """
+        if self.embed_cache is None or not self.embed_cache.enabled:
+            return self.embeddings.embed_documents(texts)
+        
+        keys = [self.embed_cache.make_key(text) for text in texts]
+        cached = self.embed_cache.get_many(keys)
+        
+        # Embed each distinct missing text once
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        if missing:
+            new_embeddings = self.embeddings.embed_documents(list(missing.values()))
+            fresh = dict(zip(missing.keys(), new_embeddings))
+            self.embed_cache.set_many(fresh)
+            cached.update(fresh)
+        
+        logger.info(f"Embedded {len(missing)} texts ({len(texts) - len(missing)} served from cache)")
+        return [cached[key] for key in keys]
+    
+    def _check_dimension_after_failure(self) -> None:
+        """
+        After a failed upsert, verify the index dimension that was assumed at startup
+        
+        Raises:
+            ValueError: If the index dimension does not match the embeddings
+        """
+        if not self.assume_dimension:
+            return
+        try:
+            dimension = self.pc.describe_index(self.index_name).dimension
+        except Exception as e:
+            logger.error(f"Could not describe Pinecone index '{self.index_name}': {str(e)}")
+            return
+        self.index_dimension = dimension
+        self.assume_dimension = False
+        if dimension != self.embedding_dimension:
+            logger.error(
+                f"Pinecone index dimension mismatch! Index has {dimension} dimensions, "
+                f"but embeddings use {self.embedding_dimension} dimensions. Please recreate the index with dimension 1536."
+            )
+            raise ValueError(
+                f"Index dimension ({dimension}) does not match embedding dimension ({self.embedding_dimension}). "
+                f"Please delete and recreate the index with dimension 1536."
+            )
+    
+    def ingest_job_description(
+        self,
+        jd_text: str,
+        session_id: str,
+        jd_embedding: Optional[List[float]] = None
+    ) -> str:
         """
         Ingest job description into vector database
         
         Args:
             jd_text: Job description text
             session_id: Session identifier for isolation
+            jd_embedding: Optional precomputed embedding of the whole JD; when
+                given it is stored as a single vector and no embedding call is made
             
         Returns:
             Vector ID for the JD
         """
-        # Split JD into chunks
-        chunks = self.splitter.split_text(jd_text)
-        
-        # Generate embeddings (text-embedding-3-small produces 1536 dimensions)
-        embeddings_list = self.embeddings.embed_documents(chunks)
+        if jd_embedding is not None:
+            chunks = [jd_text]
+            embeddings_list = [jd_embedding]
+        else:
+            # Split JD into chunks
+            chunks = self.splitter.split_text(jd_text)
+            
+            # Generate embeddings (text-embedding-3-small produces 1536 dimensions)
+            embeddings_list = self.embed_documents(chunks)
         
         # Store in Pinecone
         vectors = []
@@ -139,7 +261,11 @@ class IngestionPipeline:
             })
         
         # Upsert in batch
-        self.index.upsert(vectors=vectors)
+        try:
+            self.index.upsert(vectors=vectors)
+        except Exception:
+            self._check_dimension_after_failure()
+            raise
         logger.info(f"Ingested JD with {len(vectors)} chunks for session {session_id}")
         
         return f"jd_{session_id}"
@@ -159,29 +285,40 @@ class IngestionPipeline:
         Returns:
             Dict mapping file_path -> list of vector IDs
         """
-        all_vectors = []
+        all_chunks = []
+        chunk_meta = []
         cv_vector_ids = {}
         
+        # First pass: split every CV and collect all chunks
         for file_path, text in cv_data.items():
             if text is None:
                 continue
             
             # Extract candidate name from filename or text
             candidate_name = self._extract_candidate_name(file_path, text)
+            stem = Path(file_path).stem
             
             # Split CV into chunks
             chunks = self.splitter.split_text(text)
             
-            # Generate embeddings (text-embedding-3-small produces 1536 dimensions)
-            embeddings_list = self.embeddings.embed_documents(chunks)
-            
-            # Prepare vectors
             vector_ids = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings_list)):
-                vector_id = f"cv_{session_id}_{Path(file_path).stem}_{i}"
+            for i, chunk in enumerate(chunks):
+                vector_id = f"cv_{session_id}_{stem}_{i}"
                 vector_ids.append(vector_id)
-                
-                all_vectors.append({
+                all_chunks.append(chunk)
+                chunk_meta.append((vector_id, file_path, candidate_name, i))
+            
+            cv_vector_ids[file_path] = vector_ids
+        
+        # Embed chunks in large slices and start upserting each slice as soon as
+        # it is embedded, so Pinecone writes overlap with the next embedding call
+        async_results = []
+        for start in range(0, len(all_chunks), EMBED_BATCH_SIZE):
+            chunk_batch = all_chunks[start:start + EMBED_BATCH_SIZE]
+            embeddings_list = self.embed_documents(chunk_batch)
+            
+            vectors = [
+                {
                     "id": vector_id,
                     "values": embedding,
                     "metadata": {
@@ -192,19 +329,28 @@ class IngestionPipeline:
                         "chunk_index": i,
                         "text": chunk[:500]  # Store first 500 chars for reference
                     }
-                })
+                }
+                for chunk, embedding, (vector_id, file_path, candidate_name, i)
+                in zip(chunk_batch, embeddings_list, chunk_meta[start:start + EMBED_BATCH_SIZE])
+            ]
             
-            cv_vector_ids[file_path] = vector_ids
+            # Submit upsert batches without waiting for them
+            async_results.extend(
+                self.index.upsert(vectors=vectors[i:i + UPSERT_BATCH_SIZE], async_req=True)
+                for i in range(0, len(vectors), UPSERT_BATCH_SIZE)
+            )
         
-        # Batch upsert all vectors
-        if all_vectors:
-            # Pinecone supports up to 100 vectors per upsert
-            batch_size = 100
-            for i in range(0, len(all_vectors), batch_size):
-                batch = all_vectors[i:i + batch_size]
-                self.index.upsert(vectors=batch)
+        # Wait for every upsert to finish
+        if async_results:
+            try:
+                for async_result in async_results:
+                    # gRPC returns futures, REST returns thread-pool async results
+                    async_result.result() if self.use_grpc else async_result.get()
+            except Exception:
+                self._check_dimension_after_failure()
+                raise
             
-            logger.info(f"Ingested {len(cv_data)} CVs with {len(all_vectors)} total chunks")
+            logger.info(f"Ingested {len(cv_data)} CVs with {len(all_chunks)} total chunks")
         
         return cv_vector_ids
     
@@ -225,17 +371,19 @@ class IngestionPipeline:
         name = filename.replace("_", " ").replace("-", " ").title()
         
         # If filename looks like a name, use it
-        if len(name.split()) <= 3 and name.replace(" ", "").isalpha():
+        if FILENAME_NAME_PATTERN.fullmatch(name):
             return name
         
-        # Otherwise, try to extract from text (first line or common patterns)
-        lines = text.split("\n")[:5]
-        for line in lines:
-            line = line.strip()
-            if line and len(line.split()) <= 3:
-                # Check if it looks like a name
-                if all(word.replace(".", "").isalpha() for word in line.split()):
-                    return line
+        # Otherwise, take the first of the leading lines that looks like a name
+        end = -1
+        for _ in range(NAME_SEARCH_LINES):
+            end = text.find("\n", end + 1)
+            if end == -1:
+                end = len(text)
+                break
+        match = NAME_LINE_PATTERN.search(text, 0, end)
+        if match:
+            return match.group(1)
         
         # Fallback to filename
         return filename
@@ -250,17 +398,19 @@ class IngestionPipeline:
         Returns:
             List of embedding vectors
         """
-        # Query all JD vectors for this session (using 1536-dim dummy vector)
-        results = self.index.query(
-            vector=[0.0] * 1536,  # Dummy vector for metadata filter
-            filter={"session_id": {"$eq": session_id}, "type": {"$eq": "job_description"}},
-            top_k=100,
-            include_metadata=True
-        )
+        # Enumerate the session's JD vector IDs by prefix (no similarity search)
+        prefix = f"jd_{session_id}_"
+        vector_ids = [vector_id for page in self.index.list(prefix=prefix) for vector_id in page]
+        vector_ids.sort(key=lambda vector_id: int(vector_id[len(prefix):]))
+        
+        # Fetch values in batches, keeping chunk order
+        embeddings = []
+        for i in range(0, len(vector_ids), FETCH_BATCH_SIZE):
+            batch = vector_ids[i:i + FETCH_BATCH_SIZE]
+            fetched = self.index.fetch(ids=batch).vectors
+            embeddings.extend(fetched[vector_id].values for vector_id in batch if vector_id in fetched)
         
-        # Extract embeddings (would need to fetch by ID)
-        # For now, return empty - embeddings are stored, not retrieved this way
-        return []
+        return embeddings
     
     def cleanup_session_vectors(self, session_id: str):
         """
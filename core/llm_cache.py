@@ -0,0 +1,94 @@
+"""
+Persistent LLM Response Cache
+SQLite-backed exact-match cache for deterministic (temperature=0) completions
+"""
+
+import os
+import hashlib
+import sqlite3
+import threading
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Cache file lives next to the other local databases
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LLM_CACHE_PATH = os.path.join(BASE_DIR, "llm_cache.db")
+
+
+class LLMCache:
+    """
+    Exact-match cache of raw LLM responses keyed by a hash of model and prompt
+    Safe to share between threads and coroutines of one process
+    """
+
+    def __init__(self, path: str = LLM_CACHE_PATH, enabled: bool = True):
+        """
+        Initialize LLM cache
+
+        Args:
+            path: SQLite database file
+            enabled: When False every lookup misses and nothing is stored
+        """
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+        if enabled:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+            self._conn.commit()
+            logger.info(f"LLM response cache enabled at {path}")
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from everything that determines the response
+
+        Args:
+            *parts: Model name, prompts, response format name, ...
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """Store (or replace) the response for key"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, response) VALUES (?, ?)", (key, response)
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self.enabled = False
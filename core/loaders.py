@@ -4,18 +4,35 @@ Supports PDF, DOC, and DOCX formats with error handling
 """
 
 import os
-from typing import List, Dict, Optional
+import time
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Text extraction is CPU-bound pure Python, so batches use worker processes
+MAX_LOADER_PROCESSES = 8
+
+# PDFium is not thread-safe; every pypdfium2 call in a process goes through this lock
+_PDFIUM_LOCK = threading.Lock()
+
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+    logger.info("pypdfium2 not available. Falling back to PyPDF2 for PDFs.")
+
 try:
     import PyPDF2
     PDF_AVAILABLE = True
 except ImportError:
     PDF_AVAILABLE = False
-    logger.warning("PyPDF2 not available. PDF support disabled.")
+    if not PDFIUM_AVAILABLE:
+        logger.warning("PyPDF2 not available. PDF support disabled.")
 
 try:
     from docx import Document
@@ -36,36 +53,67 @@ class DocumentLoader:
     """Handles loading and extraction of text from various document formats"""
     
     @staticmethod
-    def load_pdf(file_path: str) -> str:
-        """Extract text from PDF file"""
+    def iter_pdf(file_path: str) -> Iterator[str]:
+        """Yield the text of a PDF one page at a time (native PDFium when installed, else PyPDF2)"""
+        if PDFIUM_AVAILABLE:
+            try:
+                with _PDFIUM_LOCK:
+                    pdf = pdfium.PdfDocument(file_path)
+                    page_count = len(pdf)
+                try:
+                    for index in range(page_count):
+                        # Hold the lock per page only, never across a yield
+                        with _PDFIUM_LOCK:
+                            page = pdf[index]
+                            textpage = page.get_textpage()
+                            text = textpage.get_text_range()
+                            textpage.close()
+                            page.close()
+                        yield text
+                finally:
+                    with _PDFIUM_LOCK:
+                        pdf.close()
+            except Exception as e:
+                logger.error(f"Error reading PDF {file_path}: {str(e)}")
+                raise
+            return
+        
         if not PDF_AVAILABLE:
-            raise ImportError("PyPDF2 is required for PDF processing")
+            raise ImportError("pypdfium2 or PyPDF2 is required for PDF processing")
         
-        text = ""
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                    yield page.extract_text() or ""
         except Exception as e:
             logger.error(f"Error reading PDF {file_path}: {str(e)}")
             raise
-        return text.strip()
     
     @staticmethod
-    def load_docx(file_path: str) -> str:
-        """Extract text from DOCX file"""
+    def load_pdf(file_path: str) -> str:
+        """Extract text from PDF file"""
+        return "\n".join(DocumentLoader.iter_pdf(file_path)).strip()
+    
+    @staticmethod
+    def iter_docx(file_path: str) -> Iterator[str]:
+        """Yield the text of a DOCX file one paragraph at a time"""
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx is required for DOCX processing")
         
         try:
             doc = Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text.strip()
+            for paragraph in doc.paragraphs:
+                yield paragraph.text
         except Exception as e:
             logger.error(f"Error reading DOCX {file_path}: {str(e)}")
             raise
     
+    @staticmethod
+    def load_docx(file_path: str) -> str:
+        """Extract text from DOCX file"""
+        return "\n".join(DocumentLoader.iter_docx(file_path)).strip()
+    
     @staticmethod
     def load_doc(file_path: str) -> str:
         """Extract text from DOC file"""
@@ -80,8 +128,47 @@ class DocumentLoader:
             raise
     
     @staticmethod
-    def load_document(file_path: str) -> str:
-        """Auto-detect file type and load document"""
+    def iter_document(file_path: str) -> Iterator[str]:
+        """Auto-detect file type and yield the document text in pieces (pages/paragraphs)"""
+        file_ext = Path(file_path).suffix.lower()
+        
+        if file_ext == '.pdf':
+            return DocumentLoader.iter_pdf(file_path)
+        elif file_ext == '.docx':
+            return DocumentLoader.iter_docx(file_path)
+        elif file_ext == '.doc':
+            return iter([DocumentLoader.load_doc(file_path)])
+        else:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+    
+    @staticmethod
+    def load_document(file_path: str, max_chars: Optional[int] = None) -> str:
+        """
+        Auto-detect file type and load document
+        
+        Args:
+            file_path: Path to the document
+            max_chars: If set, stop extracting once this many characters have
+                been read, so huge documents cost O(max_chars) instead of O(file)
+            
+        Returns:
+            Extracted text
+        """
+        if max_chars is not None:
+            parts = []
+            total = 0
+            pieces = DocumentLoader.iter_document(file_path)
+            try:
+                for piece in pieces:
+                    parts.append(piece)
+                    total += len(piece) + 1
+                    if total >= max_chars:
+                        break
+            finally:
+                if hasattr(pieces, "close"):
+                    pieces.close()
+            return "\n".join(parts)[:max_chars].strip()
+        
         file_ext = Path(file_path).suffix.lower()
         
         if file_ext == '.pdf':
@@ -93,22 +180,47 @@ class DocumentLoader:
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
+    @staticmethod
+    def _timed_load(file_path: str) -> Tuple[str, float]:
+        """Load a document in a worker process, returning (text, seconds taken)"""
+        start = time.perf_counter()
+        text = DocumentLoader.load_document(file_path)
+        return text, time.perf_counter() - start
+    
     @staticmethod
     def batch_load_documents(file_paths: List[str]) -> Dict[str, str]:
         """
-        Load multiple documents in parallel
-        Returns dict mapping file_path -> extracted_text
+        Load multiple documents in parallel worker processes
+        Returns dict mapping file_path -> extracted_text (None on failure)
         """
         results = {}
-        for file_path in file_paths:
-            try:
-                results[file_path] = DocumentLoader.load_document(file_path)
-                logger.info(f"Successfully loaded: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {str(e)}")
-                results[file_path] = None
+        workers = min(MAX_LOADER_PROCESSES, os.cpu_count() or 1, len(file_paths))
+        if workers <= 1:
+            for file_path in file_paths:
+                try:
+                    results[file_path] = DocumentLoader.load_document(file_path)
+                    logger.info(f"Successfully loaded: {file_path}")
+                except Exception as e:
+                    logger.error(f"Failed to load {file_path}: {str(e)}")
+                    results[file_path] = None
+            return results
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(DocumentLoader._timed_load, file_path): file_path
+                for file_path in file_paths
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    results[file_path], elapsed = future.result()
+                    logger.info(f"Successfully loaded: {file_path} ({elapsed:.2f}s)")
+                except Exception as e:
+                    logger.error(f"Failed to load {file_path}: {str(e)}")
+                    results[file_path] = None
         
-        return results
+        # Keep the input order
+        return {file_path: results[file_path] for file_path in file_paths}
 
 
 
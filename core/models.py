@@ -2,7 +2,7 @@
 Database models for authentication
 """
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.sql import func
 from database import Base
 
@@ -19,4 +19,14 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     reset_token = Column(String, nullable=True)
     reset_token_expiry = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        # Reset links look users up by token; only rows with a pending reset are indexed
+        Index(
+            "ix_users_reset_token_active",
+            reset_token,
+            sqlite_where=reset_token.isnot(None),
+            postgresql_where=reset_token.isnot(None)
+        ),
+    )
 
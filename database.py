@@ -3,7 +3,7 @@ Database configuration for authentication
 SQLAlchemy setup for SQLite database
 """
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -15,12 +15,28 @@ DATABASE_PATH = os.path.join(BASE_DIR, "auth.db")
 # Database URL - use absolute path
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-# Create engine
+# Create engine (file-based SQLite uses a QueuePool of connections)
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={
+        "check_same_thread": False,  # Needed for SQLite
+        "timeout": 30  # Wait for a competing writer instead of failing with "database is locked"
+    },
+    pool_size=5,
+    max_overflow=10
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Enable WAL so readers do not block on a writer, and relax fsync to WAL checkpoints"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -52,6 +68,11 @@ def init_db():
     
     # Create all tables (will not recreate if they exist with correct schema)
     Base.metadata.create_all(bind=engine)
+    
+    # create_all skips existing tables, so add any indexes declared since they were created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def get_db():
@@ -5,6 +5,7 @@ Uses SMTP to send password reset links
 
 import smtplib
 import os
+import queue
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
@@ -12,6 +13,56 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+# Idle authenticated SMTP connections kept for reuse, so consecutive emails
+# skip the TCP + TLS handshake and login
+SMTP_POOL_SIZE = 4
+_smtp_pool = queue.LifoQueue(maxsize=SMTP_POOL_SIZE)
+
+
+def _open_smtp_connection(smtp_server: str, smtp_port: int, smtp_username: str, smtp_password: str) -> smtplib.SMTP:
+    """Open a new TLS-secured, logged-in SMTP connection"""
+    server = smtplib.SMTP(smtp_server, smtp_port)
+    try:
+        server.starttls()  # Use TLS encryption
+        server.login(smtp_username, smtp_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _acquire_smtp_connection(smtp_server: str, smtp_port: int, smtp_username: str, smtp_password: str) -> smtplib.SMTP:
+    """Take a live pooled SMTP connection, or open a new one"""
+    while True:
+        try:
+            server = _smtp_pool.get_nowait()
+        except queue.Empty:
+            return _open_smtp_connection(smtp_server, smtp_port, smtp_username, smtp_password)
+        
+        # Servers drop idle connections; check before reuse
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_smtp_connection(server)
+
+
+def _release_smtp_connection(server: smtplib.SMTP) -> None:
+    """Return an SMTP connection to the pool (closing it if the pool is full)"""
+    try:
+        _smtp_pool.put_nowait(server)
+    except queue.Full:
+        _close_smtp_connection(server)
+
+
+def _close_smtp_connection(server: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors from an already dropped one"""
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
 
 def send_reset_email(email: str, reset_token: str) -> bool:
     """
@@ -62,11 +113,23 @@ HR AI Agent Team
 """
         msg.attach(MIMEText(body, "plain"))
         
-        # Send email via SMTP with TLS
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()  # Use TLS encryption
-            server.login(smtp_username, smtp_password)
+        # Send email via a pooled SMTP connection with TLS
+        server = _acquire_smtp_connection(smtp_server, smtp_port, smtp_username, smtp_password)
+        try:
             server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Dropped between the keepalive check and the send; retry once on a fresh connection
+            server.close()
+            server = _open_smtp_connection(smtp_server, smtp_port, smtp_username, smtp_password)
+            try:
+                server.send_message(msg)
+            except Exception:
+                _close_smtp_connection(server)
+                raise
+        except Exception:
+            _close_smtp_connection(server)
+            raise
+        _release_smtp_connection(server)
         
         return True
     except Exception as e:
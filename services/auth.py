@@ -5,10 +5,8 @@ Handles signup, login, and password reset
 
 import os
 import secrets
-import string
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from typing import Optional
@@ -24,9 +22,6 @@ init_db()
 # Create router
 auth_router = APIRouter(prefix="/auth", tags=["authentication"])
 
-# Security scheme (not used for session-based auth, but kept for compatibility)
-security = HTTPBasic()
-
 
 # Request/Response models
 class SignupRequest(BaseModel):
@@ -58,8 +53,8 @@ class AuthResponse(BaseModel):
 
 def generate_reset_token() -> str:
     """Generate a secure random token for password reset"""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(32))
+    # 24 random bytes -> 32 URL-safe characters, safe to embed in the reset link
+    return secrets.token_urlsafe(24)
 
 
 @auth_router.post("/signup", response_model=AuthResponse)
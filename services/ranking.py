@@ -8,8 +8,84 @@ from pathlib import Path
 import logging
 from dataclasses import dataclass
 
+import numpy as np
+
+from utils.cache import LRUCache, content_hash
+
 logger = logging.getLogger(__name__)
 
+# Cosine similarity between JD embeddings (text-embedding-3-small) above which a
+# stored analysis of the same CV is reused. Embeddings of unrelated JDs for
+# similar roles already score ~0.8-0.9 with this model, so the bar sits well
+# above that and only catches re-runs with lightly edited JDs.
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+
+class SemanticAnalysisCache:
+    """
+    Reuses a CV's analysis when it is ranked again against a near-identical JD
+    CVs are matched exactly by content hash, JDs by embedding similarity
+    """
+    
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_cvs: int = 1024,
+        max_jds_per_cv: int = 8
+    ):
+        """
+        Initialize semantic analysis cache
+        
+        Args:
+            threshold: Minimum JD cosine similarity for a hit
+            max_cvs: Number of CVs kept (least recently used are evicted)
+            max_jds_per_cv: Number of JD analyses kept per CV
+        """
+        self.threshold = threshold
+        self.max_jds_per_cv = max_jds_per_cv
+        self._entries = LRUCache(maxsize=max_cvs)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def normalize(vector: List[float]) -> np.ndarray:
+        """Return the L2-normalized float32 copy of a vector"""
+        vec = np.asarray(vector, dtype=np.float32)
+        return vec / (np.linalg.norm(vec) or 1.0)
+    
+    def get(self, cv_text: str, jd_vec: np.ndarray) -> Optional[Dict]:
+        """
+        Look up an analysis of this CV against a similar JD
+        
+        Args:
+            cv_text: CV text
+            jd_vec: Normalized JD embedding
+            
+        Returns:
+            Copy of the stored analysis, or None
+        """
+        entry = self._entries.get(content_hash(cv_text))
+        if entry is not None:
+            jd_matrix, analyses = entry
+            sims = jd_matrix @ jd_vec
+            best = int(np.argmax(sims))
+            if sims[best] >= self.threshold:
+                self.hits += 1
+                return dict(analyses[best])
+        self.misses += 1
+        return None
+    
+    def set(self, cv_text: str, jd_vec: np.ndarray, analysis: Dict) -> None:
+        """Store an analysis of a CV against a JD"""
+        key = content_hash(cv_text)
+        entry = self._entries.get(key)
+        if entry is None:
+            jd_matrix, analyses = jd_vec[np.newaxis, :], [analysis]
+        else:
+            jd_matrix = np.vstack([entry[0], jd_vec])[-self.max_jds_per_cv:]
+            analyses = (entry[1] + [analysis])[-self.max_jds_per_cv:]
+        self._entries.set(key, (jd_matrix, analyses))
+
 
 @dataclass
 class CandidateScore:
@@ -25,6 +101,7 @@ class CandidateScore:
     tool_tech_score: float
     seniority_score: float
     semantic_score: float
+    ai_analyzed: bool = True  # False when scored on semantic similarity only (not shortlisted)
 
 
 class RankingEngine:
@@ -42,22 +119,44 @@ class RankingEngine:
         "semantic": 0.05          # Overall semantic similarity
     }
     
-    def __init__(self, agent_analyzer):
+    # WEIGHTS as a vector, in the column order of the score matrix in rank_candidates
+    WEIGHT_VECTOR = np.array(
+        [WEIGHTS["skill_match"], WEIGHTS["experience"], WEIGHTS["tool_tech"], WEIGHTS["seniority"], WEIGHTS["semantic"]],
+        dtype=np.float64
+    )
+    
+    def __init__(
+        self,
+        agent_analyzer,
+        analysis_group_size: int = 1,
+        max_concurrency: int = 16,
+        analysis_cache: Optional[SemanticAnalysisCache] = None
+    ):
         """
         Initialize ranking engine
         
         Args:
-            agent_analyzer: LangChain agent for CV analysis
+            agent_analyzer: CVAnalysisAgent (async OpenAI client) for CV analysis
+            analysis_group_size: Number of CVs analyzed per LLM call
+            max_concurrency: Maximum number of in-flight LLM analysis calls
+            analysis_cache: Cache of analyses for re-ranked CVs (a new one by default)
         """
         self.agent_analyzer = agent_analyzer
+        self.analysis_group_size = analysis_group_size
+        self.max_concurrency = max_concurrency
+        self.analysis_cache = analysis_cache if analysis_cache is not None else SemanticAnalysisCache()
         logger.info("Initialized ranking engine")
     
-    def rank_candidates(
+    async def rank_candidates(
         self,
         jd_text: str,
         cv_data: Dict[str, str],
         semantic_scores: Dict[str, float],
-        session_id: str
+        session_id: str,
+        jd_requirements: Optional[Dict] = None,
+        max_llm_candidates: Optional[int] = None,
+        jd_embedding: Optional[List[float]] = None,
+        top_n: Optional[int] = None
     ) -> List[CandidateScore]:
         """
         Rank candidates based on multiple factors
@@ -67,46 +166,101 @@ class RankingEngine:
             cv_data: Dict mapping file_path -> CV text
             semantic_scores: Dict mapping file_path -> semantic similarity score
             session_id: Session identifier
+            jd_requirements: Optional requirements extracted from the JD
+            max_llm_candidates: If set, only this many candidates with the highest
+                semantic similarity get a full AI analysis; the rest are scored on
+                semantic similarity alone
+            jd_embedding: Optional JD embedding; when given, CVs already analyzed
+                against a near-identical JD reuse that analysis instead of an LLM call
+            top_n: If set, only the top_n candidates are returned (selected
+                with a partial sort instead of sorting every candidate)
             
         Returns:
             List of CandidateScore objects, sorted by match_score (descending)
         """
         candidate_scores = []
         
-        for file_path, cv_text in cv_data.items():
-            if cv_text is None:
-                continue
-            
-            logger.info(f"Ranking candidate: {file_path}")
-            
-            # Get AI agent analysis
-            analysis = self.agent_analyzer.analyze_cv_match(jd_text, cv_text)
-            
-            # Extract scores from analysis
-            skill_match_score = analysis.get("skill_match_score", 0.0)
-            experience_score = analysis.get("experience_score", 0.0)
-            tool_tech_score = analysis.get("tool_tech_score", 0.0)
-            seniority_score = analysis.get("seniority_score", 0.0)
-            
-            # Get semantic score (normalize to 0-100)
-            semantic_score = semantic_scores.get(file_path, 0.0) * 100
-            
-            # Calculate weighted final score
-            final_score = (
-                skill_match_score * self.WEIGHTS["skill_match"] +
-                experience_score * self.WEIGHTS["experience"] +
-                tool_tech_score * self.WEIGHTS["tool_tech"] +
-                seniority_score * self.WEIGHTS["seniority"] +
-                semantic_score * self.WEIGHTS["semantic"]
+        valid_cvs = [(file_path, cv_text) for file_path, cv_text in cv_data.items() if cv_text is not None]
+        logger.info(f"Ranking {len(valid_cvs)} candidates")
+        
+        # Shortlist by semantic similarity so only plausible candidates reach the LLM
+        skipped_cvs = []
+        if max_llm_candidates is not None and semantic_scores and len(valid_cvs) > max_llm_candidates:
+            valid_cvs.sort(key=lambda item: semantic_scores.get(item[0], 0.0), reverse=True)
+            valid_cvs, skipped_cvs = valid_cvs[:max_llm_candidates], valid_cvs[max_llm_candidates:]
+            logger.info(
+                f"Shortlisted {len(valid_cvs)} candidates for AI analysis, "
+                f"{len(skipped_cvs)} scored on semantic similarity only"
             )
-            
-            # Ensure score is in 0-100 range
-            final_score = max(0.0, min(100.0, final_score))
+        
+        # Serve repeat CVs against a near-identical JD from the analysis cache
+        analyses = [None] * len(valid_cvs)
+        jd_vec = SemanticAnalysisCache.normalize(jd_embedding) if jd_embedding is not None else None
+        if jd_vec is not None:
+            for i, (_, cv_text) in enumerate(valid_cvs):
+                analyses[i] = self.analysis_cache.get(cv_text, jd_vec)
+        pending = [i for i, analysis in enumerate(analyses) if analysis is None]
+        if len(pending) < len(valid_cvs):
+            logger.info(f"Reused {len(valid_cvs) - len(pending)} cached analyses")
+        
+        # Get AI agent analysis for the remaining shortlisted candidates concurrently
+        if pending:
+            fresh = await self.agent_analyzer.analyze_cvs_batch(
+                jd_text,
+                [valid_cvs[i][1] for i in pending],
+                jd_requirements=jd_requirements,
+                group_size=self.analysis_group_size,
+                max_concurrency=self.max_concurrency
+            )
+            for i, analysis in zip(pending, fresh):
+                analyses[i] = analysis
+                if jd_vec is not None and not analysis.get("analysis_failed"):
+                    self.analysis_cache.set(valid_cvs[i][1], jd_vec, analysis)
+        
+        analyses += [self._get_semantic_only_analysis(file_path) for file_path, _ in skipped_cvs]
+        
+        ranked_cvs = valid_cvs + skipped_cvs
+        if not ranked_cvs:
+            return []
+        
+        # One row per candidate: four analysis scores plus semantic score (normalized to 0-100)
+        score_matrix = np.array(
+            [
+                [
+                    analysis.get("skill_match_score", 0.0),
+                    analysis.get("experience_score", 0.0),
+                    analysis.get("tool_tech_score", 0.0),
+                    analysis.get("seniority_score", 0.0),
+                    semantic_scores.get(file_path, 0.0) * 100
+                ]
+                for (file_path, _), analysis in zip(ranked_cvs, analyses)
+            ],
+            dtype=np.float64
+        )
+        
+        # Calculate weighted final scores, clamped to the 0-100 range
+        match_scores = [round(score, 2) for score in np.clip(score_matrix @ self.WEIGHT_VECTOR, 0.0, 100.0).tolist()]
+        
+        # Order by match score (descending, ties keep input order); for a small
+        # top_n, partition first and sort only the candidates scoring at least
+        # the top_n-th best score (all of them, so ties at the cut keep input order)
+        ranking_keys = -np.asarray(match_scores)
+        if top_n is not None and 0 < 4 * top_n < len(match_scores):
+            cutoff = np.partition(ranking_keys, top_n - 1)[top_n - 1]
+            order = np.flatnonzero(ranking_keys <= cutoff)
+            order = order[np.argsort(ranking_keys[order], kind="stable")][:top_n]
+        else:
+            order = np.argsort(ranking_keys, kind="stable")[:top_n]
+        
+        rows = score_matrix.tolist()
+        for i in order.tolist():
+            (file_path, _), analysis = ranked_cvs[i], analyses[i]
+            skill_match_score, experience_score, tool_tech_score, seniority_score, semantic_score = rows[i]
             
             candidate_score = CandidateScore(
                 candidate_name=analysis.get("candidate_name", Path(file_path).stem),
                 file_path=file_path,
-                match_score=round(final_score, 2),
+                match_score=match_scores[i],
                 matched_skills=analysis.get("matched_skills", []),
                 missing_skills=analysis.get("missing_skills", []),
                 explanation=analysis.get("explanation", ""),
@@ -114,17 +268,28 @@ class RankingEngine:
                 experience_score=round(experience_score, 2),
                 tool_tech_score=round(tool_tech_score, 2),
                 seniority_score=round(seniority_score, 2),
-                semantic_score=round(semantic_score, 2)
+                semantic_score=round(semantic_score, 2),
+                ai_analyzed=i < len(valid_cvs)
             )
             
             candidate_scores.append(candidate_score)
         
-        # Sort by match score (descending)
-        candidate_scores.sort(key=lambda x: x.match_score, reverse=True)
-        
-        logger.info(f"Ranked {len(candidate_scores)} candidates")
+        logger.info(f"Ranked {len(ranked_cvs)} candidates, returning {len(candidate_scores)}")
         return candidate_scores
     
+    def _get_semantic_only_analysis(self, file_path: str) -> Dict:
+        """Return analysis placeholder for a candidate that was not shortlisted"""
+        return {
+            "candidate_name": Path(file_path).stem,
+            "skill_match_score": 0.0,
+            "experience_score": 0.0,
+            "tool_tech_score": 0.0,
+            "seniority_score": 0.0,
+            "matched_skills": [],
+            "missing_skills": [],
+            "explanation": "Not analyzed in detail: semantic similarity to the Job Description was below the shortlist."
+        }
+    
     def get_top_candidates(
         self,
         ranked_candidates: List[CandidateScore],
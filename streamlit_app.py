@@ -5,35 +5,70 @@ Professional HR dashboard for intelligent CV ranking
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import os
 import time
 import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 from openai import OpenAI
 import base64
+import re
+
+from theme import THEME_CONFIG, get_auth_css, get_theme_css
+from skills import DOMAIN_SKILLS
 
 
 
 logger = logging.getLogger(__name__)
 
+# Strips a leading ```lang fence and trailing ``` fence from LLM output
+FENCE_PATTERN = re.compile(r'^\s*```[a-zA-Z]*[ \t]*\n?|\n?```\s*$')
+
+# Reset tokens issued by the backend are opaque random URL-safe strings
+RESET_TOKEN_PATTERN = re.compile(r'[A-Za-z0-9_-]{32,64}')
+
+# st.fragment (Streamlit >= 1.37; experimental_fragment since 1.33) reruns only
+# the decorated function on interaction; older versions call it as a plain function
+auth_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# st.html (Streamlit >= 1.33) inserts raw HTML without a markdown parse pass
+_ST_HTML = getattr(st, "html", None)
+
+
+def emit_style(style_html: str) -> None:
+    """
+    Inject a <style> block into the page
+    
+    Args:
+        style_html: HTML containing only <style> elements
+    """
+    if _ST_HTML is not None:
+        _ST_HTML(style_html)
+    else:
+        st.markdown(style_html, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
 def img_to_base64(path):
+    """Read and base64-encode an image (cached; logo files do not change at runtime)"""
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
 
 
-def get_ey_logo_path() -> Optional[str]:
+@st.cache_data(show_spinner=False)
+def _resolve_ey_logo_path(current_theme: str) -> Optional[str]:
     """
-    Get the EY logo path based on current theme
+    Get the EY logo path for a theme (cached per theme)
     
     Returns:
         Path to EY logo file, or None if no logo is available
     """
-    current_theme = st.session_state.get("theme", "dark")
-    
     if current_theme == "dark":
         dark_logo = "assets/ey_logo_dark.png"
         if os.path.exists(dark_logo):
@@ -57,1949 +92,238 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-st.markdown("""
-<style>
-/* FIX: Force header height parity between dark & light */
-header[data-testid="stHeader"] {
-    height: 64px !important;
-    padding-top: 0 !important;
-    margin-top: 0 !important;
-}
-</style>
-""", unsafe_allow_html=True)
-
-
 # Load environment variables
 load_dotenv()
 
 # ============================================
 # AUTHENTICATION STATE INITIALIZATION
 # ============================================
-if "authenticated" not in st.session_state:
-    st.session_state.authenticated = False
+# Theme must be initialized before CSS injection
+_SESSION_DEFAULTS = {"authenticated": False, "page": "login", "theme": "dark"}
+for _key, _value in _SESSION_DEFAULTS.items():
+    st.session_state.setdefault(_key, _value)
 
-if "page" not in st.session_state:
-    st.session_state.page = "login"
-
-# Initialize theme in session state (must be before CSS injection)
-if "theme" not in st.session_state:
-    st.session_state.theme = "dark"
-
-# Centralized theme configuration
-THEME_CONFIG = {
-    "dark": {
-        "app_bg": "linear-gradient(135deg, #0f1419 0%, #1a1f2e 50%, #0f1419 100%)",
-        "sidebar_bg": "linear-gradient(180deg, #1a1f2e 0%, #0f1419 100%)",
-        "text_primary": "#e8eaed",
-        "text_secondary": "#9aa0a6",
-        "text_muted": "#9aa0a6",
-        "input_bg": "#1e293b",
-        "input_border": "#3d4043",
-        "input_text": "#e8eaed",
-        "card_bg": "linear-gradient(135deg, #1e293b 0%, #0f172a 100%)",
-        "card_border": "#334155",
-        "expander_header_bg": "#1e293b",
-        "expander_content_bg": "#0f172a",
-        "info_bg": "#1e293b",
-        "success_bg": "#1e293b",
-        "warning_bg": "#1e293b",
-        "error_bg": "#1e293b",
-        "dataframe_bg": "#1e293b",
-        "dataframe_text": "#e0e0e0",
-        "radio_bg": "#1e293b",
-        "radio_border": "#334155",
-        "uploader_bg": "#1e293b",
-        "uploader_border": "#3d4043",
-        "multiselect_bg": "#1e293b",
-        "multiselect_border": "#3d4043",
-        "multiselect_text": "#e8eaed",
-        "accent": "#0a66c2",
-        "accent_hover": "#004182",
-        "accent_light": "#3b82f6",
-        "score_high": "#10b981",
-        "score_medium": "#f59e0b",
-        "score_low": "#ef4444",
-        "border": "#3d4043",
-        "icon_color": "#9aa0a6",
-        "surface": "#1e293b",
-        "background": "#0f1419",
-        "button_disabled_bg": "#3d4043",
-        "button_disabled_text": "#9aa0a6",
-        "tooltip_bg": "#1e293b",
-        "tooltip_text": "#e8eaed",
-    },
-    "light": {
-        "app_bg": "#FFFFFF",
-        "sidebar_bg": "#F1F5F9",
-        "text_primary": "#111827",
-        "text_secondary": "#4B5563",
-        "text_muted": "#6B7280",
-        "input_bg": "#FFFFFF",
-        "input_border": "#D1D5DB",
-        "input_text": "#111827",
-        "card_bg": "#FFFFFF",
-        "card_border": "#D1D5DB",
-        "expander_header_bg": "#FFFFFF",
-        "expander_content_bg": "#FFFFFF",
-        "info_bg": "#FFFFFF",
-        "success_bg": "#FFFFFF",
-        "warning_bg": "#FFFFFF",
-        "error_bg": "#FFFFFF",
-        "dataframe_bg": "#FFFFFF",
-        "dataframe_text": "#111827",
-        "radio_bg": "#FFFFFF",
-        "radio_border": "#D1D5DB",
-        "uploader_bg": "#FFFFFF",
-        "uploader_border": "#D1D5DB",
-        "multiselect_bg": "#FFFFFF",
-        "multiselect_border": "#D1D5DB",
-        "multiselect_text": "#111827",
-        "accent": "#2563EB",
-        "accent_hover": "#1d4ed8",
-        "accent_light": "#3b82f6",
-        "score_high": "#10b981",
-        "score_medium": "#f59e0b",
-        "score_low": "#ef4444",
-        "border": "#D1D5DB",
-        "icon_color": "#4B5563",
-        "surface": "#F9FAFB",
-        "background": "#FFFFFF",
-        "button_disabled_bg": "#E5E7EB",
-        "button_disabled_text": "#6B7280",
-        "tooltip_bg": "#111827",
-        "tooltip_text": "#FFFFFF",
-    }
-}
-
-def get_theme() -> dict:
+
+# Resolved once per rerun; theme changes always trigger a rerun, which rebinds it
+_CURRENT_THEME_COLORS = THEME_CONFIG.get(st.session_state.get("theme", "dark"), THEME_CONFIG["dark"])
+
+
+def get_theme(_colors=_CURRENT_THEME_COLORS) -> dict:
     """Get current theme configuration"""
-    theme = st.session_state.get("theme", "dark")
-    return THEME_CONFIG.get(theme, THEME_CONFIG["dark"])
+    return _colors
 
-def get_theme_css(theme: str) -> str:
+
+def apply_theme_css():
     """
-    Get CSS based on selected theme
-    Uses centralized THEME_CONFIG for consistent colors
+    Inject the current theme's stylesheet as a single <style> element
     
-    Args:
-        theme: "dark" or "light"
-        
-    Returns:
-        CSS string for the selected theme
+    This runs on every rerun on purpose: Streamlit removes any element a rerun
+    does not emit again, so skipping "unchanged" reruns would drop the styles.
+    The stylesheet for a theme is identical on every rerun, so Streamlit's
+    forward-message cache sends it as a hash reference once the browser has it.
     """
-    colors = THEME_CONFIG.get(theme, THEME_CONFIG["dark"])
-    
-    return f"""
-<style>
-    /* Import professional font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-    
-    /* Main background */
-    .stApp {{
-        background: {colors["app_bg"]};
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
-
-    /* Streamlit top header bar */
-    header[data-testid="stHeader"] {{
-        background-color: {colors["app_bg"]} !important;
-        box-shadow: none !important;
-        border-bottom: 1px solid {colors["border"]} !important;
-    }}
-
-    /* ==================================================
-    BASEWEB SELECT & MULTISELECT
-    ================================================== */
-
-    /* Select / Multiselect main input */
-    div[data-baseweb="select"] {{
-        background-color: {colors["input_bg"]} !important;
-        color: {colors["input_text"]} !important;
-        border: 1px solid {colors["input_border"]} !important;
-    }}
-
-    /* Ensure text inside select is correct */
-    div[data-baseweb="select"] *,
-    div[data-baseweb="select"] > div,
-    div[data-baseweb="select"] > div > div {{
-        color: {colors["input_text"]} !important;
-        background-color: {colors["input_bg"]} !important;
-    }}
-
-    /* Dropdown popup container */
-    div[data-baseweb="popover"],
-    div[data-baseweb="popover"] > div,
-    div[data-baseweb="popover"] [role="listbox"] {{
-        background-color: {colors["input_bg"]} !important;
-        border: 1px solid {colors["input_border"]} !important;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08) !important;
-    }}
-    
-    /* Dropdown container inner elements */
-    div[data-baseweb="popover"] > div *,
-    div[data-baseweb="popover"] [role="listbox"] > * {{
-        background-color: {colors["input_bg"]} !important;
-    }}
-
-    /* Dropdown options */
-    div[data-baseweb="popover"] li,
-    div[data-baseweb="popover"] [role="option"],
-    div[data-baseweb="popover"] ul,
-    div[data-baseweb="popover"] [role="listbox"],
-    div[data-baseweb="popover"] [role="listbox"] li {{
-        background-color: {colors["input_bg"]} !important;
-        color: {colors["input_text"]} !important;
-    }}
-    
-    /* Dropdown option text content - comprehensive override */
-    div[data-baseweb="popover"] li *,
-    div[data-baseweb="popover"] [role="option"] *,
-    div[data-baseweb="popover"] [role="listbox"] *,
-    div[data-baseweb="popover"] [role="listbox"] li *,
-    div[data-baseweb="popover"] li span,
-    div[data-baseweb="popover"] [role="option"] span,
-    div[data-baseweb="popover"] li div,
-    div[data-baseweb="popover"] [role="option"] div {{
-        color: {colors["input_text"]} !important;
-        background-color: transparent !important;
-    }}
-
-    /* Hover state */
-    div[data-baseweb="popover"] li:hover,
-    div[data-baseweb="popover"] [role="option"]:hover,
-    div[data-baseweb="popover"] [role="listbox"] li:hover {{
-        background-color: {colors["surface"]} !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Hover state text content */
-    div[data-baseweb="popover"] li:hover *,
-    div[data-baseweb="popover"] [role="option"]:hover *,
-    div[data-baseweb="popover"] [role="listbox"] li:hover * {{
-        color: {colors["text_primary"]} !important;
-    }}
-
-    /* Selected option */
-    div[data-baseweb="popover"] [aria-selected="true"],
-    div[data-baseweb="popover"] [aria-selected="true"] *,
-    div[data-baseweb="popover"] li[aria-selected="true"],
-    div[data-baseweb="popover"] li[aria-selected="true"] *,
-    div[data-baseweb="popover"] [role="option"][aria-selected="true"],
-    div[data-baseweb="popover"] [role="option"][aria-selected="true"] * {{
-        background-color: {colors["accent"]} !important;
-        color: white !important;
-    }}
-
-    /* Dropdown arrow */
-    div[data-baseweb="select"] svg {{
-        fill: {colors["icon_color"]} !important;
-        color: {colors["icon_color"]} !important;
-    }}
-
-    /* Multiselect text input */
-    .stMultiSelect input {{
-        background-color: {colors["input_bg"]} !important;
-        color: {colors["input_text"]} !important;
-    }}
-    
-    /* Multiselect container and inner elements */
-    .stMultiSelect [data-baseweb="select"] > div,
-    .stMultiSelect [data-baseweb="select"] > div > div,
-    .stMultiSelect [data-baseweb="select"] > div > div > div {{
-        background-color: {colors["multiselect_bg"]} !important;
-        color: {colors["multiselect_text"]} !important;
-    }}
-
-
-
-
-    /* Sidebar styling */
-    [data-testid="stSidebar"] {{
-        background: {colors["sidebar_bg"]};
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
-    
-    /* Headers - professional styling */
-    h1, h2, h3 {{
-        color: {colors["text_primary"]} !important;
-        font-weight: 600;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        letter-spacing: -0.02em;
-    }}
-    
-    /* Body text */
-    p, div, span {{
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        color: {colors["text_primary"]};
-    }}
-    
-    /* Labels - ensure visibility in both themes */
-    label,
-    [data-testid="stWidgetLabel"],
-    [data-testid="stWidgetLabel"] p {{
-        color: {colors["text_primary"]} !important;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
-    
-        /* Placeholder text */
-        input::placeholder,
-        textarea::placeholder,
-        div[data-baseweb="select"] input::placeholder {{
-            color: {colors["text_muted"]} !important;
-            opacity: 1 !important;
-        }}
-        
-        /* BaseWeb select placeholder */
-        div[data-baseweb="select"] [placeholder],
-        .stMultiSelect input::placeholder {{
-            color: {colors["text_muted"]} !important;
-            opacity: 1 !important;
-        }}
-    
-    /* Text areas - professional styling */
-    .stTextArea > div > div > textarea {{
-        background-color: {colors["input_bg"]};
-        color: {colors["input_text"]};
-        border: 1px solid {colors["input_border"]};
-        border-radius: 6px;
-        padding: 12px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        font-size: 0.95rem;
-    }}
-    
-    .stTextArea > div > div > textarea:focus {{
-        border-color: {colors["accent"]};
-        box-shadow: 0 0 0 2px rgba(10, 102, 194, 0.15);
-        outline: none;
-    }}
-    
-    /* Text inputs - professional styling */
-    .stTextInput > div > div > input {{
-        background-color: {colors["input_bg"]};
-        color: {colors["input_text"]};
-        border: 1px solid {colors["input_border"]};
-        border-radius: 6px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        font-size: 0.95rem;
-    }}
-    
-    .stTextInput > div > div > input:focus {{
-        border-color: {colors["accent"]};
-        box-shadow: 0 0 0 2px rgba(10, 102, 194, 0.15);
-        outline: none;
-    }}
-    
-    /* Select boxes - professional styling */
-    .stSelectbox > div > div > select {{
-        background-color: {colors["input_bg"]} !important;
-        color: {colors["input_text"]} !important;
-        border: 1px solid {colors["input_border"]} !important;
-        border-radius: 6px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        font-size: 0.95rem;
-    }}
-    
-    /* Selectbox dropdown arrow - theme-aware */
-    .stSelectbox svg,
-    .stSelectbox [data-baseweb="select"] svg {{
-        fill: {colors["icon_color"]} !important;
-        color: {colors["icon_color"]} !important;
-        opacity: 1 !important;
-    }}
-    
-    /* Selectbox label and text */
-    .stSelectbox label,
-    .stSelectbox [data-baseweb="select"] {{
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Selectbox selected value */
-    .stSelectbox [data-baseweb="select"] > div,
-    .stSelectbox [data-baseweb="select"] > div > div {{
-        color: {colors["input_text"]} !important;
-        background-color: {colors["input_bg"]} !important;
-    }}
-    
-    /* Selectbox selected value text */
-    .stSelectbox [data-baseweb="select"] > div *,
-    .stSelectbox [data-baseweb="select"] > div > div * {{
-        color: {colors["input_text"]} !important;
-    }}
-    
-    /* Premium Buttons - LinkedIn/Workday style */
-    .stButton > button {{
-        background: {colors["accent"]} !important;
-        color: white !important;
-        border: none;
-        border-radius: 6px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        font-size: 0.95rem;
-        transition: all 0.2s ease;
-        box-shadow: 0 2px 4px rgba(10, 102, 194, 0.2);
-    }}
-    
-    /* Ensure button text and inner elements are white */
-    .stButton > button *,
-    .stButton > button span,
-    .stButton > button div {{
-        color: white !important;
-        background-color: transparent !important;
-    }}
-    
-    .stButton > button:hover {{
-        background: {colors["accent_hover"]} !important;
-        color: white !important;
-        transform: translateY(-1px);
-        box-shadow: 0 4px 8px rgba(10, 102, 194, 0.3);
-    }}
-    
-    .stButton > button:hover * {{
-        color: white !important;
-        background-color: transparent !important;
-    }}
-    
-    .stButton > button:disabled {{
-        background: {colors["button_disabled_bg"]} !important;
-        color: {colors["button_disabled_text"]} !important;
-        cursor: not-allowed;
-        transform: none;
-        box-shadow: none;
-    }}
-    
-    .stButton > button:disabled * {{
-        color: {colors["button_disabled_text"]} !important;
-        background-color: transparent !important;
-    }}
-    
-    /* Metrics - professional styling */
-    [data-testid="stMetricValue"] {{
-        color: {colors["accent"]} !important;
-        font-size: 2rem;
-        font-weight: 600;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        background-color: transparent !important;
-    }}
-    
-    [data-testid="stMetricLabel"] {{
-        color: {colors["text_secondary"]} !important;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        font-size: 0.9rem;
-        background-color: transparent !important;
-    }}
-    
-    /* Expanders - professional styling */
-    .streamlit-expanderHeader {{
-        background-color: {colors["expander_header_bg"]} !important;
-        color: {colors["text_primary"]} !important;
-        border-radius: 6px;
-        padding: 1rem;
-        border: 1px solid {colors["input_border"]} !important;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        font-weight: 500;
-    }}
-    
-    /* Expander header nested elements - transparent background, inherit text */
-    .streamlit-expanderHeader *,
-    .streamlit-expanderHeader > *,
-    .streamlit-expanderHeader div,
-    .streamlit-expanderHeader span,
-    .streamlit-expanderHeader p,
-    .streamlit-expanderHeader label {{
-        background-color: transparent !important;
-        background: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Dark expander headers - white text */
-    .streamlit-expanderHeader[style*="background"][style*="#0f"],
-    .streamlit-expanderHeader[style*="background"][style*="#1a"],
-    .streamlit-expanderHeader[style*="background"][style*="#1e"],
-    .streamlit-expanderHeader[style*="background-color"][style*="#0f"],
-    .streamlit-expanderHeader[style*="background-color"][style*="#1a"],
-    .streamlit-expanderHeader[style*="background-color"][style*="#1e"] {{
-        color: white !important;
-    }}
-    
-    .streamlit-expanderHeader[style*="background"][style*="#0f"] *,
-    .streamlit-expanderHeader[style*="background"][style*="#1a"] *,
-    .streamlit-expanderHeader[style*="background"][style*="#1e"] *,
-    .streamlit-expanderHeader[style*="background-color"][style*="#0f"] *,
-    .streamlit-expanderHeader[style*="background-color"][style*="#1a"] *,
-    .streamlit-expanderHeader[style*="background-color"][style*="#1e"] * {{
-        color: white !important;
-        background-color: transparent !important;
-    }}
-    
-    /* Expander arrow/chevron - theme-aware */
-    .streamlit-expanderHeader svg,
-    .streamlit-expanderHeader [data-testid="stExpanderToggleIcon"],
-    [data-testid="stExpanderToggleIcon"] {{
-        fill: {colors["icon_color"]} !important;
-        color: {colors["icon_color"]} !important;
-        opacity: 1 !important;
-        stroke: {colors["icon_color"]} !important;
-    }}
-    
-    .streamlit-expanderContent {{
-        background-color: {colors["expander_content_bg"]} !important;
-        border-radius: 0 0 6px 6px;
-        padding: 1.5rem;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        line-height: 1.6;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* ALL nested elements in expander content - transparent background */
-    .streamlit-expanderContent *,
-    .streamlit-expanderContent > *,
-    .streamlit-expanderContent div,
-    .streamlit-expanderContent span,
-    .streamlit-expanderContent p,
-    .streamlit-expanderContent label {{
-        background-color: transparent !important;
-        background: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Exclude actual inputs and buttons - they need their own styling */
-    .streamlit-expanderContent input[type="text"],
-    .streamlit-expanderContent input[type="number"],
-    .streamlit-expanderContent textarea,
-    .streamlit-expanderContent button,
-    .streamlit-expanderContent [data-testid="stButton"] > button,
-    .streamlit-expanderContent [data-testid="stDownloadButton"] > button {{
-        background-color: {colors["input_bg"]} !important;
-    }}
-    
-    /* Sidebar expander arrows */
-    [data-testid="stSidebar"] .streamlit-expanderHeader svg {{
-        fill: {colors["icon_color"]} !important;
-        color: {colors["icon_color"]} !important;
-        opacity: 1 !important;
-    }}
-    
-    /* Info boxes - professional styling - FLAT like button */
-    .stInfo {{
-        background-color: {colors["info_bg"]} !important;
-        border: 1px solid {colors["card_border"]} !important;
-        border-left: 3px solid {colors["accent"]} !important;
-        border-radius: 6px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* ALL nested elements - transparent background, inherit text color */
-    .stInfo *,
-    .stInfo > *,
-    .stInfo div,
-    .stInfo span,
-    .stInfo p,
-    .stInfo label {{
-        background-color: transparent !important;
-        background: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Exclude actual inputs and buttons - they need their own styling */
-    .stInfo input[type="text"],
-    .stInfo input[type="number"],
-    .stInfo textarea,
-    .stInfo button,
-    .stInfo [data-testid="stButton"] > button,
-    .stInfo [data-testid="stDownloadButton"] > button {{
-        background-color: {colors["input_bg"]} !important;
-    }}
-    
-    .stSuccess {{
-        background-color: {colors["success_bg"]} !important;
-        border: 1px solid {colors["card_border"]} !important;
-        border-left: 3px solid #0d7377 !important;
-        border-radius: 6px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* ALL nested elements - transparent background, inherit text color */
-    .stSuccess *,
-    .stSuccess > *,
-    .stSuccess div,
-    .stSuccess span,
-    .stSuccess p,
-    .stSuccess label {{
-        background-color: transparent !important;
-        background: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Exclude actual inputs and buttons - they need their own styling */
-    .stSuccess input[type="text"],
-    .stSuccess input[type="number"],
-    .stSuccess textarea,
-    .stSuccess button,
-    .stSuccess [data-testid="stButton"] > button,
-    .stSuccess [data-testid="stDownloadButton"] > button {{
-        background-color: {colors["input_bg"]} !important;
-    }}
-    
-    .stWarning {{
-        background-color: {colors["warning_bg"]} !important;
-        border: 1px solid {colors["card_border"]} !important;
-        border-left: 3px solid #f59e0b !important;
-        border-radius: 6px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* ALL nested elements - transparent background, inherit text color */
-    .stWarning *,
-    .stWarning > *,
-    .stWarning div,
-    .stWarning span,
-    .stWarning p,
-    .stWarning label {{
-        background-color: transparent !important;
-        background: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Exclude actual inputs and buttons - they need their own styling */
-    .stWarning input[type="text"],
-    .stWarning input[type="number"],
-    .stWarning textarea,
-    .stWarning button,
-    .stWarning [data-testid="stButton"] > button,
-    .stWarning [data-testid="stDownloadButton"] > button {{
-        background-color: {colors["input_bg"]} !important;
-    }}
-    
-    .stError {{
-        background-color: {colors["error_bg"]} !important;
-        border: 1px solid {colors["card_border"]} !important;
-        border-left: 3px solid #d93025 !important;
-        border-radius: 6px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* ALL nested elements - transparent background, inherit text color */
-    .stError *,
-    .stError > *,
-    .stError div,
-    .stError span,
-    .stError p,
-    .stError label {{
-        background-color: transparent !important;
-        background: transparent !important;
-        border: none !important;
-        box-shadow: none !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Exclude actual inputs and buttons - they need their own styling */
-    .stError input[type="text"],
-    .stError input[type="number"],
-    .stError textarea,
-    .stError button,
-    .stError [data-testid="stButton"] > button,
-    .stError [data-testid="stDownloadButton"] > button {{
-        background-color: {colors["input_bg"]} !important;
-    }}
-    
-    /* Dataframes */
-    .dataframe,
-    .dataframe *,
-    .dataframe th,
-    .dataframe td,
-    .dataframe thead,
-    .dataframe tbody {{
-        background-color: {colors["dataframe_bg"]} !important;
-        color: {colors["dataframe_text"]} !important;
-    }}
-    
-    /* File uploader - professional styling */
-    [data-testid="stFileUploader"] {{
-        background-color: {colors["uploader_bg"]} !important;
-        border-radius: 6px;
-        padding: 1rem;
-        border: 2px dashed {colors["uploader_border"]} !important;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
-    
-    /* File uploader inner section */
-    [data-testid="stFileUploader"] section,
-    [data-testid="stFileUploader"] > div,
-    [data-testid="stFileUploader"] > div > div,
-    [data-testid="stFileUploader"] section *,
-    [data-testid="stFileUploader"] > div * {{
-        background-color: {colors["uploader_bg"]} !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Progress bar */
-    .stProgress > div > div > div {{
-        background-color: {colors["accent_light"]};
-    }}
-    
-    /* Main content area */
-    .main .block-container {{
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }}
-    
-    /* Custom card styling */
-    .enterprise-card {{
-        background: {colors["card_bg"]} !important;
-        border: 1px solid {colors["card_border"]} !important;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Text inside enterprise cards - no background override */
-    .enterprise-card p,
-    .enterprise-card div:not([class*="st"]):not([data-testid]),
-    .enterprise-card span:not([class*="st"]):not([data-testid]) {{
-        color: {colors["text_primary"]} !important;
-        background-color: transparent !important;
-    }}
-    
-    /* Exclude inputs and buttons from background inheritance */
-    .enterprise-card input,
-    .enterprise-card button,
-    .enterprise-card [data-testid="stButton"],
-    .enterprise-card [data-testid="stDownloadButton"],
-    .enterprise-card [data-testid="stNumberInput"] {{
-        background-color: {colors["input_bg"]} !important;
-    }}
-    
-    /* Score badges */
-    .score-high {{
-        color: {colors["score_high"]};
-        font-weight: 700;
-        font-size: 1.2rem;
-    }}
-    
-    .score-medium {{
-        color: {colors["score_medium"]};
-        font-weight: 700;
-        font-size: 1.2rem;
-    }}
-    
-    .score-low {{
-        color: {colors["score_low"]};
-        font-weight: 700;
-        font-size: 1.2rem;
-    }}
-
-    
-    /* Multiselect - professional styling to match theme */
-    .stMultiSelect > div > div {{
-        background-color: {colors["multiselect_bg"]} !important;
-        border: 1px solid {colors["multiselect_border"]} !important;
-        border-radius: 6px;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }}
-    
-    /* Multiselect tags container */
-    .stMultiSelect [data-baseweb="select"] > div,
-    .stMultiSelect [data-baseweb="select"] > div > div {{
-        background-color: {colors["multiselect_bg"]} !important;
-        color: {colors["multiselect_text"]} !important;
-    }}
-    
-    /* Multiselect dropdown arrow - theme-aware */
-    .stMultiSelect svg,
-    .stMultiSelect [data-baseweb="select"] svg {{
-        fill: {colors["icon_color"]} !important;
-        color: {colors["icon_color"]} !important;
-        opacity: 1 !important;
-    }}
-    
-    /* Multiselect label */
-    .stMultiSelect label {{
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Selected items (tags/chips) - dark background with white text */
-    .stMultiSelect [data-baseweb="tag"],
-    .stMultiSelect [data-baseweb="tag"] * {{
-        background-color: #111827 !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 4px !important;
-        padding: 4px 8px !important;
-        font-size: 0.875rem !important;
-        font-weight: 500 !important;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif !important;
-    }}
-    
-    .stMultiSelect [data-baseweb="tag"]:hover {{
-        background-color: #1f2937 !important;
-    }}
-    
-    /* Remove button (X) in tags */
-    .stMultiSelect [data-baseweb="tag"] [role="button"],
-    .stMultiSelect [data-baseweb="tag"] button,
-    .stMultiSelect [data-baseweb="tag"] svg {{
-        color: white !important;
-        fill: white !important;
-        opacity: 0.9 !important;
-    }}
-    
-    .stMultiSelect [data-baseweb="tag"] [role="button"]:hover,
-    .stMultiSelect [data-baseweb="tag"] button:hover {{
-        opacity: 1 !important;
-        background-color: rgba(255, 255, 255, 0.2) !important;
-        border-radius: 3px !important;
-    }}
-    
-    /* Alternative selectors for multiselect tags */
-    .stMultiSelect span[data-testid="stMarkdownContainer"] span,
-    .stMultiSelect div[style*="background"] {{
-        background-color: #111827 !important;
-        color: white !important;
-    }}
-    
-    /* Target any chip-like elements in multiselect */
-    .stMultiSelect > div > div > div > div[style*="rgb"] {{
-        background-color: #111827 !important;
-        color: white !important;
-    }}
-    
-    /* Ensure no white backgrounds inside chips */
-    .stMultiSelect [data-baseweb="tag"] span,
-    .stMultiSelect [data-baseweb="tag"] div,
-    .stMultiSelect [data-baseweb="tag"] > * {{
-        background-color: transparent !important;
-        color: white !important;
-    }}
-    
-    /* Multiselect dropdown */
-    .stMultiSelect [data-baseweb="select"] {{
-        background-color: {colors["multiselect_bg"]} !important;
-        color: {colors["multiselect_text"]} !important;
-        border: 1px solid {colors["multiselect_border"]} !important;
-        border-radius: 6px !important;
-    }}
-    
-    /* Multiselect input */
-    .stMultiSelect input {{
-        background-color: {colors["multiselect_bg"]} !important;
-        color: {colors["multiselect_text"]} !important;
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif !important;
-    }}
-    
-    
-    /* Style for selected option chips/tags - dark background with white text */
-    div[data-baseweb="select"] [data-baseweb="tag"],
-    div[data-baseweb="select"] span[style*="background-color: rgb"],
-    .stMultiSelect div[style*="background-color: rgb(255"] {{
-        background-color: #111827 !important;
-        color: white !important;
-        border-color: #111827 !important;
-    }}
-    
-    /* Ensure chip inner elements have no white backgrounds */
-    div[data-baseweb="select"] [data-baseweb="tag"] *,
-    div[data-baseweb="select"] [data-baseweb="tag"] span,
-    div[data-baseweb="select"] [data-baseweb="tag"] div {{
-        background-color: transparent !important;
-        color: white !important;
-    }}
-
-    /* ============================================
-       DROPDOWN OPTIONS MENU
-       ============================================ */
-    
-    /* Selectbox dropdown menu/popover */
-    div[data-baseweb="popover"] {{
-        background-color: {colors["input_bg"]} !important;
-        border: 1px solid {colors["input_border"]} !important;
-        border-radius: 6px !important;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1) !important;
-    }}
-    
-    /* Dropdown option items */
-    div[data-baseweb="popover"] ul,
-    div[data-baseweb="popover"] li,
-    div[data-baseweb="popover"] [role="option"] {{
-        background-color: {colors["input_bg"]} !important;
-        color: {colors["input_text"]} !important;
-    }}
-    
-    /* Dropdown option hover state */
-    div[data-baseweb="popover"] [role="option"]:hover,
-    div[data-baseweb="popover"] li:hover,
-    div[data-baseweb="popover"] [role="listbox"] li:hover {{
-        background-color: {colors["surface"]} !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Dropdown option hover state text */
-    div[data-baseweb="popover"] [role="option"]:hover *,
-    div[data-baseweb="popover"] li:hover *,
-    div[data-baseweb="popover"] [role="listbox"] li:hover * {{
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Dropdown option selected state */
-    div[data-baseweb="popover"] [role="option"][aria-selected="true"],
-    div[data-baseweb="popover"] li[aria-selected="true"],
-    div[data-baseweb="popover"] [role="listbox"] li[aria-selected="true"],
-    div[data-baseweb="popover"] [role="option"][aria-selected="true"] *,
-    div[data-baseweb="popover"] li[aria-selected="true"] *,
-    div[data-baseweb="popover"] [role="listbox"] li[aria-selected="true"] * {{
-        background-color: {colors["accent"]} !important;
-        color: white !important;
-    }}
-    
-    /* Multiselect dropdown menu */
-    .stMultiSelect div[data-baseweb="popover"],
-    .stMultiSelect div[data-baseweb="popover"] ul,
-    .stMultiSelect div[data-baseweb="popover"] li {{
-        background-color: {colors["input_bg"]} !important;
-        color: {colors["input_text"]} !important;
-        border: 1px solid {colors["input_border"]} !important;
-    }}
-    
-    /* Multiselect option hover */
-    .stMultiSelect div[data-baseweb="popover"] [role="option"]:hover {{
-        background-color: {colors["surface"]} !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Multiselect option selected/checked */
-    .stMultiSelect div[data-baseweb="popover"] [role="option"][aria-selected="true"],
-    .stMultiSelect div[data-baseweb="popover"] [role="option"][aria-selected="true"] * {{
-        background-color: {colors["accent"]} !important;
-        color: white !important;
-    }}
-    
-    section[data-testid="stSidebar"] {{
-    background-color: #f1f5f9 !important;
-    border-right: 1px solid #e5e7eb !important;
-    box-shadow: 4px 0 12px rgba(0, 0, 0, 0.06) !important;
-   }}
-
-    
-    /* Sidebar text */
-    [data-testid="stSidebar"] p,
-    [data-testid="stSidebar"] div,
-    [data-testid="stSidebar"] span,
-    [data-testid="stSidebar"] label {{
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Sidebar expander content */
-    [data-testid="stSidebar"] .streamlit-expanderContent {{
-        background-color: {colors["expander_content_bg"]} !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* ============================================
-       ADDITIONAL FIXES
-       ============================================ */
-    
-    /* Result sections and cards - ensure readable text in light mode */
-    [data-testid="stVerticalBlock"],
-    [data-testid="stHorizontalBlock"],
-    [data-testid="stMarkdownContainer"],
-    [class*="result"],
-    [class*="candidate"],
-    [class*="ranking"] {{
-        background-color: {colors["app_bg"]} !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    [data-testid="stVerticalBlock"] *,
-    [data-testid="stHorizontalBlock"] *,
-    [data-testid="stMarkdownContainer"] * {{
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Download buttons and action buttons */
-    [data-testid="stDownloadButton"] > button,
-    [data-testid="stDownloadButton"] > button *,
-    a[download],
-    a[href*="download"] {{
-        background-color: {colors["accent"]} !important;
-        color: white !important;
-    }}
-    
-    /* Number input */
-    .stNumberInput > div > div > input {{
-        background-color: {colors["input_bg"]} !important;
-        color: {colors["input_text"]} !important;
-        border: 1px solid {colors["input_border"]} !important;
-    }}
-    
-    /* Number input label - ensure visibility */
-    .stNumberInput label,
-    .stNumberInput [data-testid="stWidgetLabel"],
-    .stNumberInput [data-testid="stWidgetLabel"] * {{
-        color: {colors["text_primary"]} !important;
-        background-color: transparent !important;
-        background: transparent !important;
-    }}
-    
-    /* Number input container - remove white boxes */
-    .stNumberInput > div,
-    .stNumberInput > div > div {{
-        background-color: transparent !important;
-        background: transparent !important;
-    }}
-    
-    /* Number input on dark backgrounds - white text */
-    [style*="background"][style*="#0f"] .stNumberInput label,
-    [style*="background"][style*="#1a"] .stNumberInput label,
-    [style*="background"][style*="#1e"] .stNumberInput label,
-    [style*="background-color"][style*="#0f"] .stNumberInput label,
-    [style*="background-color"][style*="#1a"] .stNumberInput label,
-    [style*="background-color"][style*="#1e"] .stNumberInput label {{
-        color: white !important;
-    }}
-    
-    /* File uploader text */
-    [data-testid="stFileUploader"] label,
-    [data-testid="stFileUploader"] p,
-    [data-testid="stFileUploader"] span,
-    [data-testid="stFileUploader"] div,
-    [data-testid="stFileUploader"] button,
-    [data-testid="stFileUploader"] button * {{
-        color: {colors["text_primary"]} !important;
-        background-color: transparent !important;
-    }}
-    
-    /* File uploader helper text */
-    [data-testid="stFileUploader"] small,
-    [data-testid="stFileUploader"] [class*="caption"] {{
-        color: {colors["text_secondary"]} !important;
-    }}
-    
-    /* Result sections and cards - ensure readable text in light mode */
-    [data-testid="stVerticalBlock"],
-    [data-testid="stHorizontalBlock"],
-    [data-testid="stMarkdownContainer"],
-    [class*="result"],
-    [class*="candidate"],
-    [class*="ranking"] {{
-        background-color: {colors["app_bg"]} !important;
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    [data-testid="stVerticalBlock"] *,
-    [data-testid="stHorizontalBlock"] *,
-    [data-testid="stMarkdownContainer"] * {{
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* ============================================
-       TOOLTIP STYLING (GLOBAL FIX)
-       ============================================ */
-    
-    /* BaseWeb tooltip container - comprehensive selectors */
-    div[data-baseweb="tooltip"],
-    [data-baseweb="tooltip"],
-    [data-baseweb="popover"][role="tooltip"],
-    div[role="tooltip"],
-    [role="tooltip"] {{
-        background-color: {colors["tooltip_bg"]} !important;
-        color: {colors["tooltip_text"]} !important;
-        border: 1px solid {colors["border"]} !important;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.2) !important;
-    }}
-    
-    /* Tooltip text content - all nested elements */
-    div[data-baseweb="tooltip"] *,
-    [data-baseweb="tooltip"] *,
-    [data-baseweb="popover"][role="tooltip"] *,
-    div[role="tooltip"] *,
-    [role="tooltip"] *,
-    div[data-baseweb="tooltip"] span,
-    [data-baseweb="tooltip"] span,
-    [data-baseweb="popover"][role="tooltip"] span,
-    div[role="tooltip"] span,
-    [role="tooltip"] span,
-    div[data-baseweb="tooltip"] p,
-    [data-baseweb="tooltip"] p,
-    [data-baseweb="popover"][role="tooltip"] p,
-    div[role="tooltip"] p,
-    [role="tooltip"] p {{
-        color: {colors["tooltip_text"]} !important;
-        background-color: transparent !important;
-    }}
-    
-    /* Streamlit-specific tooltip selectors */
-    [data-testid="stTooltip"],
-    [data-testid="stTooltip"] *,
-    [data-testid="stTooltip"] span,
-    [data-testid="stTooltip"] p {{
-        color: {colors["tooltip_text"]} !important;
-        background-color: {colors["tooltip_bg"]} !important;
-    }}
-    
-    /* Tooltip arrow/pointer styling */
-    div[data-baseweb="tooltip"]::before,
-    [data-baseweb="tooltip"]::before,
-    [data-baseweb="popover"][role="tooltip"]::before,
-    div[role="tooltip"]::before,
-    [role="tooltip"]::before {{
-        border-color: {colors["border"]} transparent transparent transparent !important;
-    }}
-    
-    /* Alternative tooltip selectors for BaseWeb classes */
-    [class*="tooltip"],
-    [class*="Tooltip"],
-    [class*="Popover"][role="tooltip"] {{
-        background-color: {colors["tooltip_bg"]} !important;
-        color: {colors["tooltip_text"]} !important;
-    }}
-    
-    [class*="tooltip"] *,
-    [class*="Tooltip"] *,
-    [class*="Popover"][role="tooltip"] * {{
-        color: {colors["text_primary"]} !important;
-    }}
-    
-    /* Ensure tooltip has high z-index and is visible */
-    div[data-baseweb="tooltip"],
-    [data-baseweb="tooltip"],
-    [role="tooltip"] {{
-        z-index: 9999 !important;
-        opacity: 1 !important;
-    }}
-    
-    /* Success toast animation - professional and subtle */
-    .stSuccess {{
-        animation: slideInDown 0.3s ease-out;
-        position: relative;
-        z-index: 999;
-    }}
-    
-    @keyframes slideInDown {{
-        from {{
-            transform: translateY(-20px);
-            opacity: 0;
-        }}
-        to {{
-            transform: translateY(0);
-            opacity: 1;
-        }}
-    }}
-    
-    {'''
-    /* ============================================
-       LIGHT MODE ONLY FIXES
-       ============================================ */
-    
-    /* TASK 1: Fix 'Other Ranked Candidates' header bar (Light Mode Only) */
-    /* Target the container with toggle button */
-    [data-testid="stVerticalBlock"]:has(button[key*="toggle_other_candidates"]),
-    [data-testid="stHorizontalBlock"]:has(button[key*="toggle_other_candidates"]) {
-        background-color: #F9FAFB !important;
-        border: 1px solid #E5E7EB !important;
-        border-radius: 6px;
-        padding: 1rem;
-    }
-    
-    [data-testid="stVerticalBlock"]:has(button[key*="toggle_other_candidates"]) *,
-    [data-testid="stHorizontalBlock"]:has(button[key*="toggle_other_candidates"]) *,
-    [data-testid="stVerticalBlock"]:has(button[key*="toggle_other_candidates"]) h3,
-    [data-testid="stHorizontalBlock"]:has(button[key*="toggle_other_candidates"]) h3 {
-        color: #111827 !important;
-    }
-    
-    /* Icons in Other Ranked Candidates section */
-    button[key*="toggle_other_candidates"] svg,
-    [data-testid="stVerticalBlock"]:has(button[key*="toggle_other_candidates"]) svg,
-    [data-testid="stHorizontalBlock"]:has(button[key*="toggle_other_candidates"]) svg {
-        fill: #374151 !important;
-        color: #374151 !important;
-        stroke: #374151 !important;
-    }
-    
-    /* TASK 2: Fix Matched Skills / Missing Skills boxes (Light Mode Only) */
-    /* Outlined cards for st.info and st.warning in results section */
-    [data-testid="stExpander"] .stInfo,
-    [data-testid="stExpander"] .stWarning {
-        background-color: #FFFFFF !important;
-        border-radius: 6px;
-        padding: 1rem;
-        color: #111827 !important;
-    }
-    
-    [data-testid="stExpander"] .stInfo {
-        border: 1px solid #2563EB !important;
-        border-left: 1px solid #2563EB !important;
-    }
-    
-    [data-testid="stExpander"] .stWarning {
-        border: 1px solid #F59E0B !important;
-        border-left: 1px solid #F59E0B !important;
-    }
-    
-    [data-testid="stExpander"] .stInfo *,
-    [data-testid="stExpander"] .stWarning * {
-        background-color: transparent !important;
-        color: #111827 !important;
-    }
-    
-    
-    
-    /* TASK 4: Fix Candidate expander headers (Light Mode Only) */
-    /* Candidate result expander headers - light background */
-    /* Target expanders that contain candidate info (not sidebar expanders) */
-    [data-testid="stExpander"]:not([data-testid="stSidebar"] [data-testid="stExpander"]) .streamlit-expanderHeader {
-        background-color: #FFFFFF !important;
-        border: 1px solid #E5E7EB !important;
-        color: #111827 !important;
-        border-radius: 6px;
-        padding: 1rem;
-        font-weight: 600;
-    }
-    
-    [data-testid="stExpander"]:not([data-testid="stSidebar"] [data-testid="stExpander"]) .streamlit-expanderHeader * {
-        background-color: transparent !important;
-        color: #111827 !important;
-    }
-    
-    /* Candidate expander chevron icon */
-    [data-testid="stExpander"]:not([data-testid="stSidebar"] [data-testid="stExpander"]) .streamlit-expanderHeader svg,
-    [data-testid="stExpander"]:not([data-testid="stSidebar"] [data-testid="stExpander"]) [data-testid="stExpanderToggleIcon"] {
-        fill: #374151 !important;
-        color: #374151 !important;
-        stroke: #374151 !important;
-    }
-
-    /* Fix light mode icon (sun) */
-section[data-testid="stSidebar"] img {
-    background: transparent !important;
-    border-radius: 8px !important;
-}
-
-    ''' if theme == "light" else ""}
-</style>
-"""
+    emit_style(get_theme_css(st.session_state.theme))
 
 
 # Apply theme-based CSS
-current_css = get_theme_css(st.session_state.theme)
-st.markdown(current_css, unsafe_allow_html=True)
-
-
-if st.session_state.theme == "light":
-    st.markdown("""
-    <style>
-
-    /* ===============================
-       1. SIDEBAR OPEN / CLOSE ARROW
-       =============================== */
-
-    /* OPEN sidebar button (>>) */
-    button[data-testid="collapsedControl"] {
-        background: #ffffff !important;
-        border: none !important;
-        box-shadow: none !important;
-    }
-
-    
-
-    /* CLOSE sidebar button (<<) */
-    button[data-testid="stSidebarCollapseButton"] svg,
-    button[data-testid="stSidebarCollapseButton"] svg path {
-        fill: #111827 !important;
-        stroke: #111827 !important;
-        opacity: 1 !important;
-    }
-
-    /* ===============================
-       2. OTHER RANKED CANDIDATES TABLE
-       =============================== */
-
-    /* Table wrapper */
-    [data-testid="stDataFrame"] {
-        background-color: #ffffff !important;
-        border: 1px solid #e5e7eb !important;
-        border-radius: 8px !important;
-    }
-
-    /* Header */
-    [data-testid="stDataFrame"] thead th {
-        background-color: #f9fafb !important;
-        color: #111827 !important;
-        border-bottom: 1px solid #e5e7eb !important;
-    }
-
-    /* Rows */
-    [data-testid="stDataFrame"] tbody td {
-        background-color: #ffffff !important;
-        color: #111827 !important;
-        border-bottom: 1px solid #e5e7eb !important;
-    }
-
-    /* Kill dark BaseWeb layers */
-    [data-testid="stDataFrame"] * {
-        background-color: transparent !important;
-        color: #111827 !important;
-    }
-
-    /* Hover */
-    [data-testid="stDataFrame"] tbody tr:hover td {
-        background-color: #f3f4f6 !important;
-    }
-
-    
-
-
-
-/* =========================================
-   LIGHT MODE – DATAFRAME FULLSCREEN (MODAL)
-   ========================================= */
-
-/* Fullscreen modal background */
-[data-baseweb="modal"] {
-    background-color: rgba(255, 255, 255, 0.98) !important;
-}
-
-/* Modal content wrapper */
-[data-baseweb="modal"] [data-testid="stDataFrame"] {
-    background-color: #ffffff !important;
-    border-radius: 8px !important;
-}
-
-/* Table header in fullscreen */
-[data-baseweb="modal"] thead tr th {
-    background-color: #f9fafb !important;
-    color: #111827 !important;
-    border-bottom: 1px solid #e5e7eb !important;
-}
-
-/* Table rows in fullscreen */
-[data-baseweb="modal"] tbody tr td {
-    background-color: #ffffff !important;
-    color: #111827 !important;
-    border-bottom: 1px solid #e5e7eb !important;
-}
-
-/* Remove dark base layers */
-[data-baseweb="modal"] * {
-    background-color: transparent !important;
-    color: #111827 !important;
-}
-
-/* Hover effect */
-[data-baseweb="modal"] tbody tr:hover td {
-    background-color: #f3f4f6 !important;
-}
-
-/* =========================================
-   LIGHT MODE – SIDEBAR TOGGLE ARROW VISIBILITY
-   ========================================= */
-
-/* Sidebar toggle button container */
-button[data-testid="collapsedControl"] {
-    background-color: #ffffff !important;
-    border: 1px solid #e5e7eb !important;
-    border-radius: 8px !important;
-}
-
-/* Arrow icon (OPEN sidebar >>) */
-button[data-testid="collapsedControl"] svg {
-    fill: #111827 !important;      /* dark icon */
-    color: #111827 !important;
-    opacity: 1 !important;
-}
-
-/* Hover state */
-button[data-testid="collapsedControl"]:hover {
-    background-color: #f9fafb !important;
-}
-
-
-
-/* =========================================
-   LIGHT MODE – SIDEBAR OPEN (>>) BUTTON FIX
-   ========================================= */
-
-/* Floating sidebar open button */
-button[data-testid="collapsedControl"] {
-    background-color: #ffffff !important;
-    border: 1px solid #d1d5db !important;
-    border-radius: 8px !important;
-    box-shadow: 0 1px 4px rgba(0, 0, 0, 0.08) !important;
-    opacity: 1 !important;
-}
-
-/* Arrow icon inside the button */
-button[data-testid="collapsedControl"] svg {
-    fill: #111827 !important;
-    stroke: #111827 !important;
-    color: #111827 !important;
-    opacity: 1 !important;
-}
-
-/* Hover state */
-button[data-testid="collapsedControl"]:hover {
-    background-color: #f9fafb !important;
-}
-
-
-/* =========================================
-   LIGHT MODE – SIDEBAR VISUAL SEPARATION
-   ========================================= */
-
-/* Sidebar background */
-section[data-testid="stSidebar"] {
-    background-color: #f8fafc !important;   /* slightly off-white */
-    border-right: 1px solid #e5e7eb !important;
-}
-
-/* Inner sidebar content */
-section[data-testid="stSidebar"] > div {
-    background-color: #f8fafc !important;
-}
-
-/* Add subtle depth so it doesn't merge */
-section[data-testid="stSidebar"] {
-    box-shadow: 2px 0 6px rgba(0, 0, 0, 0.04) !important;
-}
-
-/* Sidebar text */
-section[data-testid="stSidebar"] * {
-    color: #111827 !important;
-}
-
-/* Sidebar buttons/cards */
-section[data-testid="stSidebar"] button,
-section[data-testid="stSidebar"] [role="button"] {
-    background-color: #ffffff !important;
-    border: 1px solid #e5e7eb !important;
-}
-
-
-    /* ===============================
-       FIX EXPANDER HEADER – LIGHT MODE
-       =============================== */
-
-    [data-testid="stExpander"] summary {
-        background-color: #ffffff !important;
-        color: #111827 !important;
-        border: 1px solid #e5e7eb !important;
-        border-radius: 6px !important;
-        padding: 12px 16px !important;
-        font-weight: 600 !important;
-    }
-
-    /* Remove dark inner bars */
-    [data-testid="stExpander"] summary * {
-        background: transparent !important;
-        color: #111827 !important;
-    }
-
-    /* Arrow icon */
-    [data-testid="stExpander"] svg {
-        fill: #374151 !important;
-        color: #374151 !important;
-    }
-
-    /* Hover */
-    [data-testid="stExpander"] summary:hover {
-        background-color: #f9fafb !important;
-    }
-
-    /* ===============================
-       FIX OTHER RANKED CANDIDATES TABLE
-       =============================== */
-
-    section[data-testid="stDataFrame"] {
-        background-color: #ffffff !important;
-        border: 1px solid #e5e7eb !important;
-        border-radius: 8px !important;
-    }
-
-    section[data-testid="stDataFrame"] * {
-        color: #111827 !important;
-        background-color: transparent !important;
-    }
-
-
-    /* ========= SIDEBAR BACKGROUND ========= */
-    section[data-testid="stSidebar"] {
-        background-color: #f8fafc !important;
-        border-right: 1px solid #e5e7eb !important;
-        box-shadow: 2px 0 6px rgba(0,0,0,0.05) !important;
-    }
-
-  
-# =====================================================
-# LIGHT MODE – FIX ALL INFO / WARNING INNER WHITE BOXES
-# =====================================================
-
-
-    /* ================================
-       BASE ALERT CONTAINERS
-       ================================ */
-    .stAlert {
-        border-radius: 8px !important;
-        box-shadow: none !important;
-    }
-
-    /* Selected / Matched Skills (Info) */
-    .stAlert.stInfo {
-        background-color: #dbeafe !important;  /* light blue */
-        border: none !important;
-    }
-
-    /* Missing Skills (Warning) */
-    .stAlert.stWarning {
-        background-color: #fef3c7 !important;  /* light yellow */
-        border: 1px solid #f59e0b !important;
-    }
-
-     /* =========================================
-       4. TEXT CURSOR / CARET VISIBILITY
-       ========================================= */
-    
-    /* Text input caret */
-    .stTextInput input,
-    .stTextInput input[type="text"],
-    .stTextInput input[type="password"],
-    .stTextArea textarea {
-        caret-color: #000000 !important;
-    }
-    
-    /* Number input caret */
-    .stNumberInput input,
-    .stNumberInput input[type="number"] {
-        caret-color: #000000 !important;
-    }
-    
-    /* Chat input caret (if exists) */
-    .stChatInput input,
-    .stChatInput textarea {
-        caret-color: #000000 !important;
-    }
-    
-    /* Expander content inputs */
-    [data-testid="stExpander"] .stTextInput input,
-    [data-testid="stExpander"] .stTextArea textarea {
-        caret-color: #000000 !important;
-    }
-
-    
-
-    /* ================================
-       REMOVE ALL INNER WHITE LAYERS
-       ================================ */
-    .stAlert > div,
-    .stAlert > div > div,
-    .stAlert > div > div > div,
-    .stAlert .stMarkdown,
-    .stAlert .stMarkdownContainer {
-        background-color: transparent !important;
-        padding: 0 !important;
-        margin: 0 !important;
-        box-shadow: none !important;
-    }
-
-    /* ================================
-       TEXT VISIBILITY
-       ================================ */
-    .stAlert p,
-    .stAlert span,
-    .stAlert div {
-        background: transparent !important;
-        color: #111827 !important;
-    }
-
-   
-
-    /* =====================================================
-       LIGHT MODE FIXES REMOVE DARK BASEWEB LAYERS
-       ===================================================== */
-    
-    /* Candidate expander headers (normal + hover) */
-    [data-testid="stExpander"] .streamlit-expanderHeader {
-        background-color: #ffffff !important;
-        color: #111827 !important;
-        border: 1px solid #e5e7eb !important;
-        border-radius: 6px !important;
-    }
-
-    [data-testid="stExpander"] .streamlit-expanderHeader > div {
-        background-color: transparent !important;
-    }
-
-    [data-testid="stExpander"] .streamlit-expanderHeader * {
-    background: transparent !important;
-    color: #111827 !important;
-    }
-
-    /* Number input box */
-    .stNumberInput input {
-        background-color: #ffffff !important;
-        color: #111827 !important;
-        border: 1px solid #d1d5db !important;
-    }
-
-    /* Number input + / - buttons */
-    .stNumberInput button,
-    .stNumberInput button * {
-        background-color: transparent !important;
-        color: #374151 !important;
-    }
-
-    /* “Showing additional candidates…” info text */
-    [data-testid="stMarkdownContainer"] p {
-        background-color: transparent !important;
-        color: #111827 !important;
-    }
-
-    /* Remove any remaining dark containers */
-    [data-testid="stVerticalBlock"],
-    [data-testid="stHorizontalBlock"] {
-        background-color: transparent !important;
-    }
-     
-    /* =====================================================
-   LIGHT MODE – FORCE REMOVE DARK BASEWEB CONTAINERS
-   ===================================================== */
-
-/* 1️⃣ Candidate expander outer header */
-[data-testid="stExpander"] .streamlit-expanderHeader {
-    background-color: #ffffff !important;
-    border: 1px solid #e5e7eb !important;
-    color: #111827 !important;
-}
-
-/* 2️⃣ REMOVE inner dark BaseWeb bar */
-[data-testid="stExpander"] .streamlit-expanderHeader > div,
-[data-testid="stExpander"] .streamlit-expanderHeader > div > div {
-    background-color: transparent !important;
-}
-
-/* 3️⃣ Text inside expander header */
-[data-testid="stExpander"] .streamlit-expanderHeader *,
-[data-testid="stExpander"] .streamlit-expanderHeader span {
-    color: #111827 !important;
-    background: transparent !important;
-}
-
-/* 4️⃣ Fix hover (prevent dark return) */
-[data-testid="stExpander"] .streamlit-expanderHeader:hover {
-    background-color: #f9fafb !important;
-}
-
-/* 5️⃣ “Showing additional candidates…” text block */
-[data-testid="stMarkdownContainer"] {
-    background-color: transparent !important;
-}
-
-[data-testid="stMarkdownContainer"] * {
-    color: #111827 !important;
-}
-
-/* 6️⃣ Remove any leftover dark ranking containers */
-[class*="ranking"],
-[class*="candidate"],
-[data-testid="stVerticalBlock"] > div {
-    background-color: transparent !important;
-}
-
-/* =====================================================
-   LIGHT MODE – FORCE OVERRIDE INLINE DARK BACKGROUNDS
-   ===================================================== */
-
-/* Candidate expander header – FORCE white */
-[data-testid="stExpander"] .streamlit-expanderHeader,
-[data-testid="stExpander"] .streamlit-expanderHeader[style],
-[data-testid="stExpander"] .streamlit-expanderHeader > div[style] {
-    background-color: #ffffff !important;
-    color: #111827 !important;
-    border: 1px solid #e5e7eb !important;
-}
-
-/* Kill ALL inline dark backgrounds inside header */
-[data-testid="stExpander"] .streamlit-expanderHeader *[style*="background"] {
-    background-color: transparent !important;
-}
-
-/* Text inside header */
-[data-testid="stExpander"] .streamlit-expanderHeader *,
-[data-testid="stExpander"] .streamlit-expanderHeader span {
-    color: #111827 !important;
-}
-
-/* Prevent hover from being the only fix */
-[data-testid="stExpander"] .streamlit-expanderHeader:hover,
-[data-testid="stExpander"] .streamlit-expanderHeader:hover * {
-    background-color: #ffffff !important;
-    color: #111827 !important;
-}
-
-/* Other Ranked Candidates header block */
-[data-testid="stVerticalBlock"] h3,
-[data-testid="stVerticalBlock"] h3 + div {
-    background-color: transparent !important;
-    color: #111827 !important;
-}
-
-/* =====================================================
-   FINAL FIX – BASEWEB EXPANDER BUTTON (BLACK BAR)
-   ===================================================== */
-
-/* Expander toggle button itself */
-button[data-testid="stExpanderToggle"] {
-    background-color: #f9fafb !important;
-    color: #111827 !important;
-    border: 1px solid #e5e7eb !important;
-    border-radius: 6px !important;
-}
-
-/* Inner BaseWeb container inside the button */
-button[data-testid="stExpanderToggle"] > div,
-button[data-testid="stExpanderToggle"] div[style] {
-    background-color: transparent !important;
-}
-
-/* Text inside expander button */
-button[data-testid="stExpanderToggle"] span,
-button[data-testid="stExpanderToggle"] p,
-button[data-testid="stExpanderToggle"] div {
-    color: #111827 !important;
-    background: transparent !important;
-}
-
-/* Prevent hover-only behavior */
-button[data-testid="stExpanderToggle"]:hover {
-    background-color: #f3f4f6 !important;
-}
-
-/* Chevron icon */
-button[data-testid="stExpanderToggle"] svg {
-    color: #374151 !important;
-    fill: #374151 !important;
-}
-
-.safe-expander summary {
-    background: #ffffff;
-    border: 1px solid #e5e7eb;
-    border-radius: 6px;
-    padding: 12px 16px;
-    font-weight: 600;
-    color: #111827;
-    cursor: pointer;
-    list-style: none;
-}
-
-/* Arrow for safe expander */
-.safe-expander summary {
-    position: relative;
-    padding-left: 28px;
-}
-
-/* Arrow icon */
-.safe-expander summary::before {
-    content: "▸";
-    position: absolute;
-    left: 10px;
-    top: 50%;
-    transform: translateY(-50%);
-    font-size: 14px;
-    color: #374151;
-    transition: transform 0.2s ease;
-}
-
-/* Rotate arrow when open */
-.safe-expander details[open] summary::before {
-    transform: translateY(-50%) rotate(90deg);
-}
-
-
-.safe-expander summary::-webkit-details-marker {
-    display: none;
-}
-
-.safe-expander details {
-    margin-bottom: 1rem;
-}
-
-.safe-expander details[open] summary {
-    background: #f9fafb;
-}
-
-    </style>
-    """, unsafe_allow_html=True) 
+apply_theme_css()
 
 
 # ============================================
 # AUTHENTICATION PAGE FUNCTIONS
 # ============================================
 
-def get_auth_theme_css() -> str:
-    """Get CSS for authentication pages matching main app theme"""
-    colors = THEME_CONFIG.get(st.session_state.get("theme", "dark"), THEME_CONFIG["dark"])
+def render_auth_title(title: str, subtitle: str):
+    """
+    Render an auth page title, subtitle and separator as one element
     
-    return f"""
-    <style>
-        /* Import professional font */
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-        
-        /* Main background */
-        .stApp {{
-            background: {colors["app_bg"]};
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        }}
-
-        /* Headers */
-        h1, h2, h3 {{
-            color: {colors["text_primary"]} !important;
-            font-weight: 600;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        }}
-        
-        /* Body text */
-        p, div, span {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            color: {colors["text_primary"]};
-        }}
+    Args:
+        title: Page title
+        subtitle: Muted line under the title
+    """
+    st.markdown(
+        f"<div class='auth-title'><h1 style='text-align: center;'>{title}</h1>"
+        f"<p style='text-align: center; color: #9aa0a6;'>{subtitle}</p></div>",
+        unsafe_allow_html=True
+    )
+
+
+def navigate_to(page: str):
+    """
+    Button callback that switches the routed page
+    
+    Callbacks run before the rerun the click triggers, so that rerun already
+    renders the new page instead of needing a second st.rerun()
+    
+    Args:
+        page: Value for st.session_state.page
+    """
+    st.session_state.page = page
+
+
+def _back_to_login():
+    """Reset-password page callback: drop the token from the URL and return to login"""
+    try:
+        st.query_params.clear()
+    except Exception:
+        pass
+    navigate_to("login")
+
+
+def _logout():
+    """Logout button callback (see navigate_to)"""
+    st.session_state.clear()
+    st.session_state.authenticated = False
+    navigate_to("login")
+
+
+@auth_fragment
+def _login_form():
+    """Login form (reruns on its own where fragments are supported)"""
+    with st.form("login_form"):
+        st.markdown("### Sign In")
         
-        /* Labels */
-        label {{
-            color: {colors["text_primary"]} !important;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        }}
+        email = st.text_input("Email", placeholder="your.email@company.com")
+        password = st.text_input("Password", type="password", placeholder="Enter your password")
         
-        /* Text inputs */
-        .stTextInput > div > div > input {{
-            background-color: {colors["input_bg"]};
-            color: {colors["input_text"]};
-            border: 1px solid {colors["input_border"]};
-            border-radius: 6px;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        }}
+        col_btn1, col_btn2 = st.columns(2)
+        with col_btn1:
+            login_button = st.form_submit_button("Login", use_container_width=True, type="primary")
+        with col_btn2:
+            forgot_button = st.form_submit_button("Forgot Password?", use_container_width=True)
         
-        /* Buttons */
-        .stButton > button {{
-            background: {colors["accent"]} !important;
-            color: white !important;
-            border: none;
-            border-radius: 6px;
-            padding: 0.75rem 2rem;
-            font-weight: 600;
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-        }}
+        if forgot_button:
+            st.session_state.page = "forgot"
+            st.rerun()
         
-        .stButton > button:hover {{
-            background: {colors["accent_hover"]} !important;
-        }}
-    </style>
-    """
+        if login_button:
+            if not email or not password:
+                st.error("Please enter both email and password")
+            else:
+                try:
+                    response = post_auth_form(
+                        "login",
+                        "/auth/login",
+                        {"email": email, "password": password}
+                    )
+                    
+                    if response.status_code == 200:
+                        if not response.text or not response.text.strip():
+                            st.error("Login failed. Empty response from server.")
+                        else:
+                            try:
+                                data = response.json()
+                                if data.get("success"):
+                                    # Clear any query params (e.g., reset token)
+                                    try:
+                                        st.query_params.clear()
+                                    except Exception:
+                                        pass
+                                    st.session_state.authenticated = True
+                                    st.session_state.user_email = data.get("user_email", email)
+                                    st.session_state.page = "main"
+                                    st.session_state.reset_completed = False  # Clear reset flag
+                                    st.rerun()
+                                else:
+                                    st.error("Invalid email or password")
+                            except Exception:
+                                st.error("Login failed. Invalid server response.")
+                    else:
+                        st.error("Invalid email or password")
+                except requests.exceptions.ConnectionError:
+                    st.error("Cannot connect to server. Please ensure the backend is running.")
+                except requests.exceptions.Timeout:
+                    st.error("Request timed out. Please try again.")
+                except Exception:
+                    st.error("Invalid email or password")
 
 
 def login_page():
     """Login page"""
+    # One-shot message from a signup that just redirected here
+    signup_message = st.session_state.pop("_signup_success_toast", None)
+    if signup_message:
+        st.toast(signup_message)
+    
     # Render global header with logos
     render_global_header()
     
-    # Hide sidebar completely
-    st.markdown(
-        '''
-        <style>
-            [data-testid="stSidebar"] { display: none; }
-            [data-testid="stSidebarNav"] { display: none; }
-        </style>
-        ''',
-        unsafe_allow_html=True
-    )
+    # Apply auth theme CSS (also hides the sidebar)
+    emit_style(get_auth_css())
     
-    # Apply auth theme CSS
-    auth_css = get_auth_theme_css()
-    st.markdown(auth_css, unsafe_allow_html=True)
+    # Centered layout (width is capped by the auth CSS)
+    render_auth_title("HR AI Agent", "Enterprise Talent Intelligence Platform")
     
-    # Centered layout
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown("<h1 style='text-align: center;'>HR AI Agent</h1>", unsafe_allow_html=True)
-        st.markdown("<p style='text-align: center; color: #9aa0a6;'>Enterprise Talent Intelligence Platform</p>", unsafe_allow_html=True)
-        st.markdown("---")
+    _login_form()
+    
+    st.markdown("<p class='auth-divider' style='text-align: center;'>Don't have an account?</p>", unsafe_allow_html=True)
+    st.button("Create Account", use_container_width=True, on_click=navigate_to, args=("signup",))
+
+
+@auth_fragment
+def _signup_form():
+    """Signup form (reruns on its own where fragments are supported)"""
+    with st.form("signup_form"):
+        st.markdown("### Register")
         
-        with st.form("login_form"):
-            st.markdown("### Sign In")
-            
-            email = st.text_input("Email", placeholder="your.email@company.com")
-            password = st.text_input("Password", type="password", placeholder="Enter your password")
-            
-            col_btn1, col_btn2 = st.columns(2)
-            with col_btn1:
-                login_button = st.form_submit_button("Login", use_container_width=True, type="primary")
-            with col_btn2:
-                forgot_button = st.form_submit_button("Forgot Password?", use_container_width=True)
-            
-            if forgot_button:
-                st.session_state.page = "forgot"
-                st.rerun()
-            
-            if login_button:
-                if not email or not password:
-                    st.error("Please enter both email and password")
-                else:
-                    try:
-                        response = requests.post(
-                            f"{API_BASE_URL}/auth/login",
-                            json={"email": email, "password": password},
-                            timeout=10
-                        )
-                        
-                        if response.status_code == 200:
-                            if not response.text or not response.text.strip():
-                                st.error("Login failed. Empty response from server.")
-                            else:
-                                try:
-                                    data = response.json()
-                                    if data.get("success"):
-                                        # Clear any query params (e.g., reset token)
-                                        try:
-                                            st.query_params.clear()
-                                        except Exception:
-                                            pass
-                                        st.session_state.authenticated = True
-                                        st.session_state.user_email = data.get("user_email", email)
-                                        st.session_state.page = "main"
-                                        st.session_state.reset_completed = False  # Clear reset flag
-                                        st.rerun()
-                                    else:
-                                        st.error("Invalid email or password")
-                                except Exception:
-                                    st.error("Login failed. Invalid server response.")
-                        else:
-                            st.error("Invalid email or password")
-                    except requests.exceptions.ConnectionError:
-                        st.error("Cannot connect to server. Please ensure the backend is running.")
-                    except requests.exceptions.Timeout:
-                        st.error("Request timed out. Please try again.")
-                    except Exception:
-                        st.error("Invalid email or password")
+        col_name1, col_name2 = st.columns(2)
+        with col_name1:
+            first_name = st.text_input("First Name", placeholder="John")
+        with col_name2:
+            last_name = st.text_input("Last Name", placeholder="Doe")
         
-        st.markdown("---")
-        st.markdown("<p style='text-align: center;'>Don't have an account?</p>", unsafe_allow_html=True)
-        if st.button("Create Account", use_container_width=True):
-            st.session_state.page = "signup"
-            st.rerun()
+        email = st.text_input("Email", placeholder="your.email@company.com")
+        password = st.text_input("Password", type="password", placeholder="At least 6 characters")
+        confirm_password = st.text_input("Confirm Password", type="password", placeholder="Re-enter password")
+        
+        create_button = st.form_submit_button("Create Account", use_container_width=True, type="primary")
+        
+        if create_button:
+            if not first_name or not last_name or not email:
+                st.error("All fields are required")
+            elif password != confirm_password:
+                st.error("Passwords do not match")
+            elif not password or len(password) < 6:
+                st.error("Password must be at least 6 characters long")
+            else:
+                try:
+                    response = post_auth_form(
+                        "signup",
+                        "/auth/signup",
+                        {
+                            "first_name": first_name,
+                            "last_name": last_name,
+                            "email": email,
+                            "password": password
+                        }
+                    )
+                    
+                    if response.status_code == 200:
+                        if not response.text or not response.text.strip():
+                            st.session_state._signup_success_toast = "Account created successfully. Please login."
+                            st.session_state.page = "login"
+                            st.rerun()
+                        else:
+                            try:
+                                data = response.json()
+                                if data.get("success"):
+                                    st.session_state._signup_success_toast = "Account created successfully! Please login."
+                                    st.session_state.page = "login"
+                                    st.rerun()
+                                else:
+                                    st.error("Account creation failed. Email may already exist.")
+                            except Exception:
+                                st.session_state._signup_success_toast = "Account created successfully. Please login."
+                                st.session_state.page = "login"
+                                st.rerun()
+                    else:
+                        st.error("Account creation failed. Email may already exist.")
+                except requests.exceptions.ConnectionError:
+                    st.error("Cannot connect to server. Please ensure the backend is running.")
+                except requests.exceptions.Timeout:
+                    st.error("Request timed out. Please try again.")
+                except Exception:
+                    st.error("Account creation failed. Please try again.")
 
 
 def signup_page():
@@ -2007,97 +331,42 @@ def signup_page():
     # Render global header with logos
     render_global_header()
     
-    # Hide sidebar completely (but allow page navigation to show)
-    st.markdown(
-        '''
-        <style>
-            [data-testid="stSidebar"] { display: none; }
-        </style>
-        ''',
-        unsafe_allow_html=True
-    )
+    # Apply auth theme CSS (hides the sidebar but allows page navigation to show)
+    emit_style(get_auth_css(hide_nav=False))
     
-    # Apply auth theme CSS
-    auth_css = get_auth_theme_css()
-    st.markdown(auth_css, unsafe_allow_html=True)
+    # Centered layout (width is capped by the auth CSS)
+    render_auth_title("Create Account", "Join HR AI Agent Platform")
     
-    # Centered layout
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown("<h1 style='text-align: center;'>Create Account</h1>", unsafe_allow_html=True)
-        st.markdown("<p style='text-align: center; color: #9aa0a6;'>Join HR AI Agent Platform</p>", unsafe_allow_html=True)
-        st.markdown("---")
+    _signup_form()
+    
+    st.markdown("<p class='auth-divider' style='text-align: center;'>Already have an account?</p>", unsafe_allow_html=True)
+    st.button("Log in", use_container_width=True, on_click=navigate_to, args=("login",))
+
+
+@auth_fragment
+def _forgot_password_form():
+    """Forgot password form (reruns on its own where fragments are supported)"""
+    with st.form("forgot_password_form"):
+        st.markdown("### Request Password Reset")
         
-        with st.form("signup_form"):
-            st.markdown("### Register")
-            
-            col_name1, col_name2 = st.columns(2)
-            with col_name1:
-                first_name = st.text_input("First Name", placeholder="John")
-            with col_name2:
-                last_name = st.text_input("Last Name", placeholder="Doe")
-            
-            email = st.text_input("Email", placeholder="your.email@company.com")
-            password = st.text_input("Password", type="password", placeholder="At least 6 characters")
-            confirm_password = st.text_input("Confirm Password", type="password", placeholder="Re-enter password")
-            
-            create_button = st.form_submit_button("Create Account", use_container_width=True, type="primary")
-            
-            if create_button:
-                if not first_name or not last_name or not email:
-                    st.error("All fields are required")
-                elif password != confirm_password:
-                    st.error("Passwords do not match")
-                elif not password or len(password) < 6:
-                    st.error("Password must be at least 6 characters long")
-                else:
-                    try:
-                        response = requests.post(
-                            f"{API_BASE_URL}/auth/signup",
-                            json={
-                                "first_name": first_name,
-                                "last_name": last_name,
-                                "email": email,
-                                "password": password
-                            },
-                            timeout=10
-                        )
-                        
-                        if response.status_code == 200:
-                            if not response.text or not response.text.strip():
-                                st.success("Account created successfully. Please login.")
-                                st.session_state.page = "login"
-                                time.sleep(1)
-                                st.rerun()
-                            else:
-                                try:
-                                    data = response.json()
-                                    if data.get("success"):
-                                        st.success("Account created successfully! Redirecting to login...")
-                                        st.session_state.page = "login"
-                                        time.sleep(1)
-                                        st.rerun()
-                                    else:
-                                        st.error("Account creation failed. Email may already exist.")
-                                except Exception:
-                                    st.success("Account created successfully. Please login.")
-                                    st.session_state.page = "login"
-                                    time.sleep(1)
-                                    st.rerun()
-                        else:
-                            st.error("Account creation failed. Email may already exist.")
-                    except requests.exceptions.ConnectionError:
-                        st.error("Cannot connect to server. Please ensure the backend is running.")
-                    except requests.exceptions.Timeout:
-                        st.error("Request timed out. Please try again.")
-                    except Exception:
-                        st.error("Account creation failed. Please try again.")
+        email = st.text_input("Email", placeholder="your.email@company.com")
         
-        st.markdown("---")
-        st.markdown("<p style='text-align: center;'>Already have an account?</p>", unsafe_allow_html=True)
-        if st.button("Log in", use_container_width=True):
-            st.session_state.page = "login"
-            st.rerun()
+        send_button = st.form_submit_button("Send Reset Link", use_container_width=True, type="primary")
+        
+        if send_button:
+            if not email:
+                st.error("Please enter your email")
+            else:
+                # The response is never shown (same message either way, for
+                # security), so send it in the background instead of waiting
+                future = get_background_executor().submit(
+                    get_http_session().post,
+                    f"{API_BASE_URL}/auth/forgot-password",
+                    json={"email": email},
+                    timeout=AUTH_REQUEST_TIMEOUT
+                )
+                future.add_done_callback(_log_background_failure)
+                st.success("If the email exists, a password reset link has been sent.")
 
 
 def forgot_password_page():
@@ -2105,58 +374,86 @@ def forgot_password_page():
     # Render global header with logos
     render_global_header()
     
-    # Hide sidebar completely (but allow page navigation to show)
-    st.markdown(
-        '''
-        <style>
-            [data-testid="stSidebar"] { display: none; }
-        </style>
-        ''',
-        unsafe_allow_html=True
-    )
+    # Apply auth theme CSS (hides the sidebar but allows page navigation to show)
+    emit_style(get_auth_css(hide_nav=False))
     
-    # Apply auth theme CSS
-    auth_css = get_auth_theme_css()
-    st.markdown(auth_css, unsafe_allow_html=True)
+    # Centered layout (width is capped by the auth CSS)
+    render_auth_title("Forgot Password", "Enter your email to receive a reset link")
     
-    # Centered layout
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown("<h1 style='text-align: center;'>Forgot Password</h1>", unsafe_allow_html=True)
-        st.markdown("<p style='text-align: center; color: #9aa0a6;'>Enter your email to receive a reset link</p>", unsafe_allow_html=True)
-        st.markdown("---")
+    _forgot_password_form()
+    
+    st.markdown("---")
+    st.button("Back to Login", use_container_width=True, on_click=navigate_to, args=("login",))
+
+
+@auth_fragment
+def _reset_password_form(token: str):
+    """Reset password form (reruns on its own where fragments are supported)"""
+    # A "Back to Login" click in this fragment cleared the token in its callback,
+    # but a fragment rerun only redraws the form; rerun the app to route to login
+    try:
+        token_cleared = not st.query_params.get("token")
+    except Exception:
+        token_cleared = False
+    if token_cleared:
+        st.rerun()
+    
+    # Token is present and valid format - show reset form
+    # Backend will validate token validity and expiry on submit
+    with st.form("reset_password_form"):
+        st.markdown("### Set New Password")
         
-        with st.form("forgot_password_form"):
-            st.markdown("### Request Password Reset")
-            
-            email = st.text_input("Email", placeholder="your.email@company.com")
-            
-            send_button = st.form_submit_button("Send Reset Link", use_container_width=True, type="primary")
-            
-            if send_button:
-                if not email:
-                    st.error("Please enter your email")
+        new_password = st.text_input("New Password", type="password", placeholder="At least 6 characters")
+        confirm_password = st.text_input("Confirm New Password", type="password", placeholder="Re-enter password")
+        
+        reset_button = st.form_submit_button("Reset Password", use_container_width=True, type="primary")
+    
+    # Handle the submit outside the form: st.button can't be used inside st.form
+    if reset_button:
+        # Frontend validation
+        if not new_password or len(new_password) < 6:
+            st.error("Password must be at least 6 characters long")
+        elif new_password != confirm_password:
+            st.error("Passwords do not match")
+        else:
+            # Call backend API to validate token and reset password
+            try:
+                response = post_auth_form(
+                    "reset_password",
+                    "/auth/reset-password",
+                    {"token": token, "new_password": new_password}
+                )
+                
+                if response.status_code == 200:
+                    # Success - clear query params and redirect to login page
+                    try:
+                        st.query_params.clear()
+                    except Exception:
+                        pass
+                    st.session_state.authenticated = False
+                    st.session_state.page = "login"
+                    st.session_state.reset_completed = True
+                    st.success("Your password has been reset successfully. Redirecting to login...")
+                    st.rerun()
                 else:
+                    # Token is invalid or expired - show error and redirect to login
                     try:
-                        response = requests.post(
-                            f"{API_BASE_URL}/auth/forgot-password",
-                            json={"email": email},
-                            timeout=10
-                        )
-                        
-                        # Always show success message for security
-                        st.success("If the email exists, a password reset link has been sent.")
-                    except requests.exceptions.ConnectionError:
-                        st.error("Cannot connect to server. Please ensure the backend is running.")
-                    except requests.exceptions.Timeout:
-                        st.error("Request timed out. Please try again.")
+                        error_data = response.json()
+                        error_msg = error_data.get("detail", "Invalid or expired reset link")
                     except Exception:
-                        st.success("If the email exists, a password reset link has been sent.")
-        
-        st.markdown("---")
-        if st.button("Back to Login", use_container_width=True):
-            st.session_state.page = "login"
-            st.rerun()
+                        error_msg = "Invalid or expired reset link"
+                    st.error(error_msg)
+                    st.markdown("---")
+                    st.button("Back to Login", use_container_width=True, key="back_to_login_after_error", on_click=_back_to_login)
+                        
+            except requests.exceptions.ConnectionError:
+                st.error("Cannot connect to server. Please ensure the backend is running.")
+            except requests.exceptions.Timeout:
+                st.error("Request timed out. Please try again.")
+            except Exception:
+                st.error("Invalid or expired reset link")
+                st.markdown("---")
+                st.button("Back to Login", use_container_width=True, key="back_to_login_after_exception", on_click=_back_to_login)
 
 
 def reset_password_page(token: str):
@@ -2164,126 +461,96 @@ def reset_password_page(token: str):
     # Render global header with logos
     render_global_header()
     
-    # Hide sidebar completely
-    st.markdown(
-        '''
-        <style>
-            [data-testid="stSidebar"] { display: none; }
-            [data-testid="stSidebarNav"] { display: none; }
-        </style>
-        ''',
-        unsafe_allow_html=True
-    )
-    
-    # Apply auth theme CSS
-    auth_css = get_auth_theme_css()
-    st.markdown(auth_css, unsafe_allow_html=True)
+    # Apply auth theme CSS (also hides the sidebar)
+    emit_style(get_auth_css())
     
-    # Validate token format first
-    if not token or len(token) < 10:
+    # Validate token format first; malformed links never reach the backend
+    if not token or not RESET_TOKEN_PATTERN.fullmatch(token):
         st.error("Invalid or expired reset link")
         st.markdown("---")
-        if st.button("Back to Login", use_container_width=True, key="back_to_login_invalid_token"):
-            try:
-                st.query_params.clear()
-            except Exception:
-                pass
-            st.session_state.page = "login"
-            st.rerun()
+        st.button("Back to Login", use_container_width=True, key="back_to_login_invalid_token", on_click=_back_to_login)
         return
     
-    # Centered layout
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown("<h1 style='text-align: center;'>Reset Password</h1>", unsafe_allow_html=True)
-        st.markdown("<p style='text-align: center; color: #9aa0a6;'>Enter your new password</p>", unsafe_allow_html=True)
-        st.markdown("---")
-        
-        # Token is present and valid format - show reset form
-        # Backend will validate token validity and expiry on submit
-        with st.form("reset_password_form"):
-            st.markdown("### Set New Password")
-            
-            new_password = st.text_input("New Password", type="password", placeholder="At least 6 characters")
-            confirm_password = st.text_input("Confirm New Password", type="password", placeholder="Re-enter password")
-            
-            reset_button = st.form_submit_button("Reset Password", use_container_width=True, type="primary")
-            
-            if reset_button:
-                # Frontend validation
-                if not new_password or len(new_password) < 6:
-                    st.error("Password must be at least 6 characters long")
-                elif new_password != confirm_password:
-                    st.error("Passwords do not match")
-                else:
-                    # Call backend API to validate token and reset password
-                    try:
-                        response = requests.post(
-                            f"{API_BASE_URL}/auth/reset-password",
-                            json={"token": token, "new_password": new_password},
-                            timeout=10
-                        )
-                        
-                        if response.status_code == 200:
-                            # Success - clear query params and redirect to login page
-                            try:
-                                st.query_params.clear()
-                            except Exception:
-                                pass
-                            st.session_state.authenticated = False
-                            st.session_state.page = "login"
-                            st.session_state.reset_completed = True
-                            st.success("Your password has been reset successfully. Redirecting to login...")
-                            st.rerun()
-                        else:
-                            # Token is invalid or expired - show error and redirect to login
-                            try:
-                                error_data = response.json()
-                                error_msg = error_data.get("detail", "Invalid or expired reset link")
-                            except Exception:
-                                error_msg = "Invalid or expired reset link"
-                            st.error(error_msg)
-                            st.markdown("---")
-                            if st.button("Back to Login", use_container_width=True, key="back_to_login_after_error"):
-                                try:
-                                    st.query_params.clear()
-                                except Exception:
-                                    pass
-                                st.session_state.page = "login"
-                                st.rerun()
-                                
-                    except requests.exceptions.ConnectionError:
-                        st.error("Cannot connect to server. Please ensure the backend is running.")
-                    except requests.exceptions.Timeout:
-                        st.error("Request timed out. Please try again.")
-                    except Exception:
-                        st.error("Invalid or expired reset link")
-                        st.markdown("---")
-                        if st.button("Back to Login", use_container_width=True, key="back_to_login_after_exception"):
-                            try:
-                                st.query_params.clear()
-                            except Exception:
-                                pass
-                            st.session_state.page = "login"
-                            st.rerun()
-        
-        st.markdown("---")
-        if st.button("Back to Login", use_container_width=True, key="back_to_login_reset"):
-            try:
-                st.query_params.clear()
-            except Exception:
-                pass
-            st.session_state.page = "login"
-            st.rerun()
+    # Centered layout (width is capped by the auth CSS)
+    render_auth_title("Reset Password", "Enter your new password")
+    
+    _reset_password_form(token)
+    
+    st.markdown("---")
+    st.button("Back to Login", use_container_width=True, key="back_to_login_reset", on_click=_back_to_login)
 
 # API configuration (hardcoded, not exposed to users)
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
 
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session for backend calls
+    Created once per process so keep-alive connections are reused across reruns
+    
+    Returns:
+        requests.Session with a pooled, retrying adapter
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        # Retry only a failed connect (the request never reached the server) and
+        # idempotent GETs; a timed-out login/register POST must not be resent
+        max_retries=Retry(total=1, connect=1, read=0, backoff_factor=0.1, allowed_methods=frozenset({"GET"}))
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
+# (connect, read) timeouts for auth calls: a dead backend fails fast on connect
+AUTH_REQUEST_TIMEOUT = (2, 8)
 
 
+def post_auth_form(
+    form_key: str,
+    path: str,
+    payload: Dict,
+    timeout: Tuple[float, float] = AUTH_REQUEST_TIMEOUT
+) -> requests.Response:
+    """
+    POST an auth form to the backend, ignoring a resubmit while one is in flight
+    
+    Args:
+        form_key: Name of the form, used to key its in-flight flag
+        path: Backend path, e.g. "/auth/login"
+        payload: JSON body
+        timeout: (connect, read) timeouts in seconds
+        
+    Returns:
+        Backend response
+    """
+    state_key = f"_{form_key}_inflight"
+    if st.session_state.get(state_key):
+        st.stop()
+    
+    st.session_state[state_key] = True
+    try:
+        return get_http_session().post(f"{API_BASE_URL}{path}", json=payload, timeout=timeout)
+    finally:
+        st.session_state[state_key] = False
+
+
+@st.cache_resource
+def get_background_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool for fire-and-forget backend calls"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="background-request")
+
+
+def _log_background_failure(future: Future):
+    """Log the outcome of a fire-and-forget request nobody waits on"""
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"Background request failed: {str(error)}")
+
 
 def get_domain_skills(domain: str) -> List[str]:
     """
@@ -2295,35 +562,7 @@ def get_domain_skills(domain: str) -> List[str]:
     Returns:
         List of recommended skills for the domain
     """
-    domain_skills_map = {
-        "Data Science": [
-            "Python", "SQL", "Statistics", "Probability", "Linear Algebra",
-            "Pandas", "NumPy", "Scikit-learn", "Machine Learning", "Deep Learning",
-            "Data Visualization", "Matplotlib", "Seaborn", "Jupyter", "R"
-        ],
-        "GenAI": [
-            "LLMs", "Prompt Engineering", "LangChain", "Vector Databases", "RAG",
-            "OpenAI APIs", "Pinecone", "Embeddings", "Transformers", "Hugging Face",
-            "Fine-tuning", "Tokenization", "Semantic Search", "Chroma", "Weaviate"
-        ],
-        "Backend": [
-            "Python", "Java", "REST APIs", "Microservices", "SQL", "NoSQL",
-            "Docker", "Kubernetes", "FastAPI", "Flask", "Spring Boot", "Node.js",
-            "PostgreSQL", "MongoDB", "Redis", "AWS", "GCP", "Azure"
-        ],
-        "AI Platform": [
-            "MLOps", "Model Deployment", "CI/CD", "Monitoring", "AWS", "GCP",
-            "Azure", "Airflow", "Kubeflow", "MLflow", "TensorFlow Serving",
-            "Model Registry", "A/B Testing", "Feature Stores", "Data Pipelines"
-        ],
-        "HR Analytics": [
-            "Python", "SQL", "Data Analysis", "Statistics", "Tableau", "Power BI",
-            "Excel", "HRIS", "People Analytics", "Predictive Analytics",
-            "Dashboard Design", "Reporting", "Workday", "SuccessFactors"
-        ]
-    }
-    
-    return domain_skills_map.get(domain, [])
+    return list(DOMAIN_SKILLS.get(domain, ()))
 
 
 def combine_skills(selected_skills: List[str], custom_skills_text: str) -> str:
@@ -2338,22 +577,14 @@ def combine_skills(selected_skills: List[str], custom_skills_text: str) -> str:
         Comma-separated string of all unique skills
     """
     # Parse custom skills
-    custom_skills = []
-    if custom_skills_text and custom_skills_text.strip():
-        custom_skills = [skill.strip() for skill in custom_skills_text.split(",") if skill.strip()]
+    custom_skills = [skill.strip() for skill in (custom_skills_text or "").split(",") if skill.strip()]
     
-    # Combine and deduplicate (case-insensitive)
+    # Combine and deduplicate (case-insensitive), keeping the first spelling and position
     all_skills = selected_skills + custom_skills
-    seen = set()
-    unique_skills = []
+    first_position = dict.fromkeys(map(str.lower, all_skills))
+    first_spelling = dict(zip(map(str.lower, reversed(all_skills)), reversed(all_skills)))
     
-    for skill in all_skills:
-        skill_lower = skill.lower()
-        if skill_lower not in seen:
-            seen.add(skill_lower)
-            unique_skills.append(skill)
-    
-    return ", ".join(unique_skills)
+    return ", ".join(first_spelling[skill_lower] for skill_lower in first_position)
 
 
 def initialize_session():
@@ -2373,119 +604,74 @@ def initialize_session():
     if "theme" not in st.session_state:
         st.session_state.theme = "dark"  # Default theme
 
-def render_global_header():
-    """Render global header with SIEI and EY logos - call this on ALL pages"""
+# Candidate locations for the SIEI logo, in order of preference
+SIEI_LOGO_PATHS = (
+    "assets/siei_logo.png",
+    "assets/siei_logo.jpg",
+    "assets/SIEI_logo.png",
+    "assets/SIEI_logo.jpg",
+    "siei_logo.png",
+    "siei_logo.jpg"
+)
+
+
+def _logo_img_html(path: str, style: str) -> str:
+    """Build an <img> tag with the image embedded as a base64 data URI"""
+    mime = "image/jpeg" if path.lower().endswith((".jpg", ".jpeg")) else "image/png"
+    return f'<img src="data:{mime};base64,{img_to_base64(path)}" style="{style}" />'
 
-    # Logo paths
-    siei_logo_path = "assets/siei_logo.png"
-    SIEI_LOGO = Path(siei_logo_path)
-    
-    # Top header bar with left and right branding (ABOVE main title)
-    col_left, col_center, col_right = st.columns([3, 4, 3])
-    
-    with col_left:
 
+@st.cache_data(show_spinner=False)
+def _render_header_html(theme: str) -> str:
+    """
+    Build the global header (SIEI branding left, EY logo right) as one HTML blob
+    
+    Args:
+        theme: "dark" or "light"
         
-        # Left: SIEI Branding - Logo image MUST be visible
-        logo_text_col1, logo_text_col2 = st.columns([0.9, 3.1], gap="small")
-        with logo_text_col1:
-            if SIEI_LOGO.exists():
-                siei_base64 = img_to_base64(SIEI_LOGO)
-                st.markdown(
-                    f"""
-                    <img src="data:image/png;base64,{siei_base64}"
-                         style="
-                            width:56px;
-                            height:auto;
-                            margin-right:-16px;
-                            display:block;
-                        "
-                    />
-                    """,
-              unsafe_allow_html=True
-            )
-            else:
-                # Fallback to st.image if Path doesn't work
-                if os.path.exists(siei_logo_path):
-                    st.image(siei_logo_path, width=52)
-                else:
-                    # Try alternative paths
-                    alt_paths = [
-                        "assets/siei_logo.jpg",
-                        "assets/SIEI_logo.png",
-                        "assets/SIEI_logo.jpg",
-                        "siei_logo.png",
-                        "siei_logo.jpg"
-                    ]
-                    logo_found = False
-                    for alt_path in alt_paths:
-                        if os.path.exists(alt_path):
-                            st.image(alt_path, width=52)
-                            logo_found = True
-                            break
-                    if not logo_found:
-                        theme_colors = get_theme()
-                        input_bg = theme_colors["input_bg"]
-                        accent = theme_colors["accent"]
-                        st.markdown(f'<div style="height:52px;width:52px;background:{input_bg};border-radius:4px;display:flex;align-items:center;justify-content:center;color:{accent};font-size:10px;font-weight:bold;">SIEI</div>', unsafe_allow_html=True)
-        with logo_text_col2:
-            theme_colors = get_theme()
-            accent = theme_colors["accent"]
-            text_muted = theme_colors["text_muted"]
-            st.markdown(f"""
-        <div style="
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: {accent};
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            line-height: 1.1;
-            margin-top: 6px;
-            margin-left: -16px;
-        ">SIEI</div>
-
-        <div style="
-            font-size: 0.75rem;
-            color: {text_muted};
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            margin-top: 2px;
-            white-space: nowrap;
-            margin-left: -16px;
-        ">Snow IT Expert Institute</div>
-    """, unsafe_allow_html=True)
+    Returns:
+        Header HTML with both logos embedded
+    """
+    colors = THEME_CONFIG.get(theme, THEME_CONFIG["dark"])
+    font_family = "'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif"
     
-    with col_right:
+    siei_logo_path = next((path for path in SIEI_LOGO_PATHS if os.path.exists(path)), None)
+    if siei_logo_path:
+        siei_logo = _logo_img_html(siei_logo_path, "width:56px;height:auto;display:block;")
+    else:
+        siei_logo = (
+            f'<div style="height:52px;width:52px;background:{colors["input_bg"]};border-radius:4px;'
+            f'display:flex;align-items:center;justify-content:center;color:{colors["accent"]};'
+            f'font-size:10px;font-weight:bold;">SIEI</div>'
+        )
+    
+    # Right: EY Branding (theme-aware); nothing is shown if the logo is missing
+    ey_logo_path = _resolve_ey_logo_path(theme)
+    ey_logo = _logo_img_html(
+        ey_logo_path,
+        "width:64px;height:auto;display:block;pointer-events:none;user-select:none;"
+    ) if ey_logo_path else ""
+    
+    # Kept free of blank lines so markdown treats it as a single HTML block
+    return (
+        '<div style="display:flex;justify-content:space-between;align-items:flex-start;">'
+        '<div style="display:flex;align-items:flex-start;gap:12px;">'
+        f'{siei_logo}'
+        '<div>'
+        f'<div style="font-size:1.1rem;font-weight:600;color:{colors["accent"]};font-family:{font_family};'
+        'line-height:1.1;margin-top:6px;">SIEI</div>'
+        f'<div style="font-size:0.75rem;color:{colors["text_muted"]};font-family:{font_family};'
+        'margin-top:2px;white-space:nowrap;">Snow IT Expert Institute</div>'
+        '</div>'
+        '</div>'
+        f'{ey_logo}'
+        '</div>'
+    )
 
-        
 
-        # Right: EY Branding - Logo image using Base64 + HTML (theme-aware)
-        ey_logo_path = get_ey_logo_path()
-        
-        if ey_logo_path and os.path.exists(ey_logo_path):
-            ey_base64 = img_to_base64(ey_logo_path)
-            st.markdown(
-                f"""
-                <div style="
-                    display:flex;
-                    justify-content:flex-end;
-                    align-items:flex-start;
-                    margin-right:-32px;
-                ">
-                    <img src="data:image/png;base64,{ey_base64}"
-                         style="
-                            width:64px;
-                            height:auto;
-                            display:block;
-                            pointer-events:none;
-                            user-select:none;
-                        "
-                    />
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
-        else:
-            # Do nothing if logo not found (NO BOX)
-            st.markdown("")
+def render_global_header():
+    """Render global header with SIEI and EY logos - call this on ALL pages"""
+    st.markdown(_render_header_html(st.session_state.get("theme", "dark")), unsafe_allow_html=True)
 
 
 def display_header():
@@ -2510,64 +696,23 @@ def display_header():
     st.markdown("---")
 
 
-def generate_job_description(
-    job_title: str,
-    experience: str,
-    domain: str,
-    seniority: str,
-    location: str,
-    key_skills: str
-) -> str:
+@st.cache_resource
+def get_openai_client(api_key: str) -> OpenAI:
     """
-    Generate job description using OpenAI
+    Get a shared OpenAI client
+    Built once per API key so its HTTP connection pool survives reruns
     
     Args:
-        job_title: Job title
-        experience: Experience range
-        domain: Domain/field
-        seniority: Seniority level
-        location: Location
-        key_skills: Comma-separated key skills
+        api_key: OpenAI API key
         
     Returns:
-        Generated job description text
+        OpenAI client
     """
-    # Validate all required fields are provided
-    if not job_title or not job_title.strip():
-        st.error("❌ Job Title is required. Please fill in all required fields (marked with *).")
-        return ""
-    
-    if not experience or not experience.strip():
-        st.error("❌ Experience is required. Please fill in all required fields (marked with *).")
-        return ""
-    
-    if not domain or not domain.strip():
-        st.error("❌ Domain is required. Please fill in all required fields (marked with *).")
-        return ""
-    
-    if not seniority or not seniority.strip():
-        st.error("❌ Seniority Level is required. Please fill in all required fields (marked with *).")
-        return ""
-    
-    if not location or not location.strip():
-        st.error("❌ Location is required. Please fill in all required fields (marked with *).")
-        return ""
-    
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
-        st.error("OpenAI API key not found. Please configure OPENAI_API_KEY in environment.")
-        return ""
-    
-    client = OpenAI(api_key=openai_api_key)
-    
-    # Prepare skills text - use empty string if not provided
-    skills_text = key_skills.strip() if key_skills else ""
-    
-    # Build skills note for prompt (avoid nested f-strings)
-    skills_note = f"Note: Must include these key skills: {skills_text}" if skills_text else ""
-    skills_rule = f"9. Required Skills must include: {skills_text}" if skills_text else ""
-    
-    prompt = f"""Generate a professional, enterprise-grade Job Description using the following STRICT STRUCTURE.
+    return OpenAI(api_key=api_key)
+
+
+# JD generation prompt, filled in with str.format_map
+_JD_PROMPT_TEMPLATE = """Generate a professional, enterprise-grade Job Description using the following STRICT STRUCTURE.
 
 The output MUST start with a header section in this exact order:
 
@@ -2607,6 +752,65 @@ No code blocks
 
 Generate the complete job description now following this exact structure:"""
 
+
+def generate_job_description(
+    job_title: str,
+    experience: str,
+    domain: str,
+    seniority: str,
+    location: str,
+    key_skills: str
+) -> str:
+    """
+    Generate job description using OpenAI
+    
+    Args:
+        job_title: Job title
+        experience: Experience range
+        domain: Domain/field
+        seniority: Seniority level
+        location: Location
+        key_skills: Comma-separated key skills
+        
+    Returns:
+        Generated job description text
+    """
+    # Validate all required fields are provided (reported together)
+    required_fields = [
+        ("Job Title", job_title),
+        ("Experience", experience),
+        ("Domain", domain),
+        ("Seniority Level", seniority),
+        ("Location", location)
+    ]
+    missing = [label for label, value in required_fields if not (value and value.strip())]
+    if missing:
+        st.error(f"❌ Required: {', '.join(missing)}. Please fill in all required fields (marked with *).")
+        return ""
+    
+    if not OPENAI_API_KEY:
+        st.error("OpenAI API key not found. Please configure OPENAI_API_KEY in environment.")
+        return ""
+    
+    client = get_openai_client(OPENAI_API_KEY)
+    
+    # Prepare skills text - use empty string if not provided
+    skills_text = key_skills.strip() if key_skills else ""
+    
+    # Build skills note for prompt (avoid nested f-strings)
+    skills_note = f"Note: Must include these key skills: {skills_text}" if skills_text else ""
+    skills_rule = f"9. Required Skills must include: {skills_text}" if skills_text else ""
+    
+    prompt = _JD_PROMPT_TEMPLATE.format_map({
+        "job_title": job_title,
+        "location": location,
+        "experience": experience,
+        "domain": domain,
+        "seniority": seniority,
+        "skills_note": skills_note,
+        "skills_rule": skills_rule
+    })
+
     try:
         response = client.chat.completions.create(
             model="gpt-4-turbo-preview",  # Using GPT-4 Turbo for JD generation
@@ -2620,10 +824,8 @@ Generate the complete job description now following this exact structure:"""
         
         generated_text = response.choices[0].message.content.strip()
         
-        # Clean up any markdown that might have been added
-        if generated_text.startswith("```"):
-            lines = generated_text.split("\n")
-            generated_text = "\n".join(lines[1:-1]) if len(lines) > 2 else generated_text
+        # Clean up any markdown fences that might have been added
+        generated_text = FENCE_PATTERN.sub("", generated_text).strip()
         
         return generated_text
     
@@ -2668,7 +870,7 @@ def rank_cvs(jd_text: str, uploaded_files: List) -> Dict:
         }
         
         # Make API request
-        response = requests.post(
+        response = get_http_session().post(
             f"{API_BASE_URL}/rank-cvs",
             files=files,
             data=data,
@@ -2705,10 +907,6 @@ def rank_cvs(jd_text: str, uploaded_files: List) -> Dict:
         return None
 
 
-
-
-
-
 def display_results(results: Dict):
     """
     Display ranking results in enterprise format with dynamic Top-K selection
@@ -2803,8 +1001,9 @@ def display_results(results: Dict):
             else "score-low"
         )
         
+        not_analyzed_note = "" if candidate.get("ai_analyzed", True) else " (semantic match only, not AI-analyzed)"
         with st.expander(
-            f"#{idx} {candidate['candidate_name']} - Match Score: {displayed_score:.1f}%",
+            f"#{idx} {candidate['candidate_name']} - Match Score: {displayed_score:.1f}%{not_analyzed_note}",
             expanded=True
         ):
 
@@ -2865,7 +1064,7 @@ def display_results(results: Dict):
                 download_url = f"{API_BASE_URL}/download-cv/{session_id}/{filename}"
                 
                 try:
-                    response = requests.get(download_url, timeout=30)
+                    response = get_http_session().get(download_url, timeout=30)
                     if response.status_code == 200:
                         st.download_button(
                             label=f"📥 Download CV: {filename}",
@@ -2890,7 +1089,7 @@ def display_results(results: Dict):
         # Toggle button
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.markdown("### 📋 Other Ranked Candidates")
+            st.markdown('<h3 class="other-candidates-header">📋 Other Ranked Candidates</h3>', unsafe_allow_html=True)
         with col2:
             button_label = "Hide" if st.session_state.show_other_candidates else "View All"
             if st.button(button_label, key="toggle_other_candidates"):
@@ -2913,11 +1112,17 @@ def display_results(results: Dict):
                     "Match Score (%)": f"{displayed_score:.1f}",
                     "Matched Skills": len(candidate.get('matched_skills', [])),
                     "Missing Skills": len(candidate.get('missing_skills', [])),
+                    "AI Analyzed": "Yes" if candidate.get("ai_analyzed", True) else "No (semantic match only)",
                     "CV File": Path(candidate.get('file_path', '')).name
                 })
             
             df = pd.DataFrame(table_data)
             st.dataframe(df, use_container_width=True, hide_index=True)
+            if any(not candidate.get("ai_analyzed", True) for candidate in remaining_candidates):
+                st.caption(
+                    "Candidates marked 'No' were below the AI-analysis shortlist; their scores "
+                    "reflect semantic similarity to the Job Description only."
+                )
             
             st.markdown("")
             st.markdown("**View individual candidate details:**")
@@ -2927,7 +1132,8 @@ def display_results(results: Dict):
             for idx, candidate in enumerate(remaining_candidates, start_rank):
                 raw_score = candidate['match_score']
                 displayed_score = scale_score(raw_score)
-                with st.expander(f"Rank #{idx}: {candidate['candidate_name']} ({displayed_score:.1f}%)", expanded=False):
+                not_analyzed_note = "" if candidate.get("ai_analyzed", True) else " - not AI-analyzed"
+                with st.expander(f"Rank #{idx}: {candidate['candidate_name']} ({displayed_score:.1f}%){not_analyzed_note}", expanded=False):
                     score = displayed_score
                     
                     # Brief summary
@@ -2953,7 +1159,7 @@ def display_results(results: Dict):
                         download_url = f"{API_BASE_URL}/download-cv/{session_id}/{filename}"
                         
                         try:
-                            response = requests.get(download_url, timeout=30)
+                            response = get_http_session().get(download_url, timeout=30)
                             if response.status_code == 200:
                                 st.download_button(
                                     label=f"📥 Download CV: {filename}",
@@ -3076,11 +1282,7 @@ def main():
         st.markdown("---")
         
         # Logout button
-        if st.button("🚪 Logout", use_container_width=True, type="secondary"):
-            st.session_state.clear()
-            st.session_state.page = "login"
-            st.session_state.authenticated = False
-            st.rerun()
+        st.button("🚪 Logout", use_container_width=True, type="secondary", on_click=_logout)
     
     # Job Description Input Mode Selection
     st.markdown('<div class="jd-mode-section">', unsafe_allow_html=True)
@@ -3180,31 +1382,20 @@ def main():
         
         # Generate button
         if st.button("✨ Generate Job Description", type="primary", use_container_width=True):
-            # Validate required fields before generation
-            if not job_title or not job_title.strip():
-                st.error("❌ Please fill in all required fields (marked with *). Job Title is required.")
-            elif not experience or not experience.strip():
-                st.error("❌ Please fill in all required fields (marked with *). Experience is required.")
-            elif not domain or not domain.strip():
-                st.error("❌ Please fill in all required fields (marked with *). Domain is required.")
-            elif not seniority or not seniority.strip():
-                st.error("❌ Please fill in all required fields (marked with *). Seniority Level is required.")
-            elif not location or not location.strip():
-                st.error("❌ Please fill in all required fields (marked with *). Location is required.")
-            else:
-                with st.spinner("Generating professional job description..."):
-                    generated_jd = generate_job_description(
-                        job_title=job_title.strip(),
-                        experience=experience.strip(),
-                        domain=domain.strip(),
-                        seniority=seniority.strip(),
-                        location=location.strip(),
-                        key_skills=key_skills.strip() if key_skills else ""
-                    )
-                    
-                    if generated_jd:
-                        st.session_state.generated_jd = generated_jd
-                        st.success("Job description generated successfully!")
+            # generate_job_description reports all missing required fields at once
+            with st.spinner("Generating professional job description..."):
+                generated_jd = generate_job_description(
+                    job_title=(job_title or "").strip(),
+                    experience=(experience or "").strip(),
+                    domain=(domain or "").strip(),
+                    seniority=(seniority or "").strip(),
+                    location=(location or "").strip(),
+                    key_skills=key_skills.strip() if key_skills else ""
+                )
+                
+                if generated_jd:
+                    st.session_state.generated_jd = generated_jd
+                    st.success("Job description generated successfully!")
         
         # Display generated JD and allow editing
         if st.session_state.generated_jd:
@@ -3320,7 +1511,7 @@ def main():
             if st.button("🗑️ Clear Session & Start New", use_container_width=True):
                 # Cleanup session via API
                 try:
-                    requests.delete(f"{API_BASE_URL}/session/{st.session_state.session_id}")
+                    get_http_session().delete(f"{API_BASE_URL}/session/{st.session_state.session_id}")
                 except:
                     pass
                 
@@ -0,0 +1,1745 @@
+"""
+Theme Configuration and Precomputed CSS for the Streamlit UI
+Stylesheets are built once at import; Streamlit keeps imported modules loaded
+across reruns, so re-applying a theme is a dict lookup. The bulk of the CSS is
+theme-independent and references CSS custom properties, so switching themes
+only changes a small variables block
+"""
+
+import re
+from sys import intern
+from types import MappingProxyType
+from typing import List
+
+# Centralized theme configuration (raw palettes, frozen into THEME_CONFIG below)
+_RAW_THEME_CONFIG = {
+    "dark": {
+        "app_bg": "linear-gradient(135deg, #0f1419 0%, #1a1f2e 50%, #0f1419 100%)",
+        "sidebar_bg": "linear-gradient(180deg, #1a1f2e 0%, #0f1419 100%)",
+        "text_primary": "#e8eaed",
+        "text_secondary": "#9aa0a6",
+        "text_muted": "#9aa0a6",
+        "input_bg": "#1e293b",
+        "input_border": "#3d4043",
+        "input_text": "#e8eaed",
+        "card_bg": "linear-gradient(135deg, #1e293b 0%, #0f172a 100%)",
+        "card_border": "#334155",
+        "expander_header_bg": "#1e293b",
+        "expander_content_bg": "#0f172a",
+        "info_bg": "#1e293b",
+        "success_bg": "#1e293b",
+        "warning_bg": "#1e293b",
+        "error_bg": "#1e293b",
+        "dataframe_bg": "#1e293b",
+        "dataframe_text": "#e0e0e0",
+        "radio_bg": "#1e293b",
+        "radio_border": "#334155",
+        "uploader_bg": "#1e293b",
+        "uploader_border": "#3d4043",
+        "multiselect_bg": "#1e293b",
+        "multiselect_border": "#3d4043",
+        "multiselect_text": "#e8eaed",
+        "accent": "#0a66c2",
+        "accent_hover": "#004182",
+        "accent_light": "#3b82f6",
+        "score_high": "#10b981",
+        "score_medium": "#f59e0b",
+        "score_low": "#ef4444",
+        "border": "#3d4043",
+        "icon_color": "#9aa0a6",
+        "surface": "#1e293b",
+        "background": "#0f1419",
+        "button_disabled_bg": "#3d4043",
+        "button_disabled_text": "#9aa0a6",
+        "tooltip_bg": "#1e293b",
+        "tooltip_text": "#e8eaed",
+    },
+    "light": {
+        "app_bg": "#FFFFFF",
+        "sidebar_bg": "#F1F5F9",
+        "text_primary": "#111827",
+        "text_secondary": "#4B5563",
+        "text_muted": "#6B7280",
+        "input_bg": "#FFFFFF",
+        "input_border": "#D1D5DB",
+        "input_text": "#111827",
+        "card_bg": "#FFFFFF",
+        "card_border": "#D1D5DB",
+        "expander_header_bg": "#FFFFFF",
+        "expander_content_bg": "#FFFFFF",
+        "info_bg": "#FFFFFF",
+        "success_bg": "#FFFFFF",
+        "warning_bg": "#FFFFFF",
+        "error_bg": "#FFFFFF",
+        "dataframe_bg": "#FFFFFF",
+        "dataframe_text": "#111827",
+        "radio_bg": "#FFFFFF",
+        "radio_border": "#D1D5DB",
+        "uploader_bg": "#FFFFFF",
+        "uploader_border": "#D1D5DB",
+        "multiselect_bg": "#FFFFFF",
+        "multiselect_border": "#D1D5DB",
+        "multiselect_text": "#111827",
+        "accent": "#2563EB",
+        "accent_hover": "#1d4ed8",
+        "accent_light": "#3b82f6",
+        "score_high": "#10b981",
+        "score_medium": "#f59e0b",
+        "score_low": "#ef4444",
+        "border": "#D1D5DB",
+        "icon_color": "#4B5563",
+        "surface": "#F9FAFB",
+        "background": "#FFFFFF",
+        "button_disabled_bg": "#E5E7EB",
+        "button_disabled_text": "#6B7280",
+        "tooltip_bg": "#111827",
+        "tooltip_text": "#FFFFFF",
+    }
+}
+
+# Read-only palettes with interned color strings; shared safely across sessions
+# and guarantees the precomputed stylesheets can never go stale via mutation
+THEME_CONFIG = MappingProxyType({
+    name: MappingProxyType({key: intern(value) for key, value in colors.items()})
+    for name, colors in _RAW_THEME_CONFIG.items()
+})
+del _RAW_THEME_CONFIG
+
+
+# Static stylesheet shared by every theme; all theme-dependent values are
+# CSS custom properties defined per theme in a small :root block
+_BASE_CSS_SOURCE = """
+    /* Import professional font */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+    
+    /* Main background */
+    .stApp {
+        background: var(--app-bg);
+    }
+
+    /* Typography - single font stack (listed widgets set their own font, and
+       form controls do not inherit it, so they are named explicitly) */
+    .stApp,
+    [data-testid="stSidebar"],
+    h1,
+    h2,
+    h3,
+    p,
+    div,
+    span,
+    label,
+    [data-testid="stWidgetLabel"],
+    [data-testid="stWidgetLabel"] p,
+    .stTextArea > div > div > textarea,
+    .stTextInput > div > div > input,
+    .stSelectbox > div > div > select,
+    .stButton > button,
+    [data-testid="stMetricValue"],
+    [data-testid="stMetricLabel"],
+    .streamlit-expanderHeader,
+    .streamlit-expanderContent,
+    .stInfo,
+    .stSuccess,
+    .stWarning,
+    .stError,
+    [data-testid="stFileUploader"],
+    .stMultiSelect > div > div {
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    }
+
+    .stMultiSelect [data-baseweb="tag"],
+    .stMultiSelect [data-baseweb="tag"] *,
+    .stMultiSelect input {
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif !important;
+    }
+
+    /* Streamlit top header bar (fixed height keeps parity between dark & light) */
+    header[data-testid="stHeader"] {
+        height: 64px !important;
+        padding-top: 0 !important;
+        margin-top: 0 !important;
+        background-color: var(--background) !important;
+        box-shadow: none !important;
+        border-bottom: 1px solid var(--border) !important;
+    }
+
+    /* ==================================================
+    BASEWEB SELECT & MULTISELECT
+    ================================================== */
+
+    /* Select / Multiselect main input */
+    div[data-baseweb="select"] {
+        background-color: var(--input-bg) !important;
+        color: var(--input-text) !important;
+        border: 1px solid var(--input-border) !important;
+    }
+
+    /* Ensure text inside select is correct */
+    div[data-baseweb="select"] *,
+    div[data-baseweb="select"] > div,
+    div[data-baseweb="select"] > div > div {
+        color: var(--input-text) !important;
+        background-color: var(--input-bg) !important;
+    }
+
+    /* Dropdown popup container (the popover itself is styled under DROPDOWN OPTIONS MENU) */
+    div[data-baseweb="popover"] > div,
+    div[data-baseweb="popover"] [role="listbox"] {
+        background-color: var(--input-bg) !important;
+        border: 1px solid var(--input-border) !important;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08) !important;
+    }
+    
+    /* Dropdown container inner elements */
+    div[data-baseweb="popover"] > div *,
+    div[data-baseweb="popover"] [role="listbox"] > * {
+        background-color: var(--input-bg) !important;
+    }
+
+    /* Dropdown listbox (option items are styled under DROPDOWN OPTIONS MENU) */
+    div[data-baseweb="popover"] [role="listbox"],
+    div[data-baseweb="popover"] [role="listbox"] li {
+        background-color: var(--input-bg) !important;
+        color: var(--input-text) !important;
+    }
+    
+    /* Dropdown option text content - comprehensive override */
+    div[data-baseweb="popover"] li *,
+    div[data-baseweb="popover"] [role="option"] *,
+    div[data-baseweb="popover"] [role="listbox"] *,
+    div[data-baseweb="popover"] [role="listbox"] li *,
+    div[data-baseweb="popover"] li span,
+    div[data-baseweb="popover"] [role="option"] span,
+    div[data-baseweb="popover"] li div,
+    div[data-baseweb="popover"] [role="option"] div {
+        color: var(--input-text) !important;
+        background-color: transparent !important;
+    }
+
+    /* Selected option (other than list items, see DROPDOWN OPTIONS MENU) */
+    div[data-baseweb="popover"] [aria-selected="true"],
+    div[data-baseweb="popover"] [aria-selected="true"] * {
+        background-color: var(--accent) !important;
+        color: white !important;
+    }
+
+    /* Dropdown arrow */
+    div[data-baseweb="select"] svg {
+        fill: var(--icon-color) !important;
+        color: var(--icon-color) !important;
+    }
+
+    /* Multiselect container and inner elements */
+    .stMultiSelect [data-baseweb="select"] > div,
+    .stMultiSelect [data-baseweb="select"] > div > div,
+    .stMultiSelect [data-baseweb="select"] > div > div > div {
+        background-color: var(--multiselect-bg) !important;
+        color: var(--multiselect-text) !important;
+    }
+
+
+
+
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background: var(--sidebar-bg);
+    }
+    
+    /* Headers - professional styling */
+    h1, h2, h3 {
+        color: var(--text-primary) !important;
+        font-weight: 600;
+        letter-spacing: -0.02em;
+    }
+    
+    /* Body text */
+    p, div, span {
+        color: var(--text-primary);
+    }
+    
+    /* Labels - ensure visibility in both themes */
+    label,
+    [data-testid="stWidgetLabel"],
+    [data-testid="stWidgetLabel"] p {
+        color: var(--text-primary) !important;
+    }
+    
+        /* Placeholder text */
+        input::placeholder,
+        textarea::placeholder,
+        div[data-baseweb="select"] input::placeholder {
+            color: var(--text-muted) !important;
+            opacity: 1 !important;
+        }
+        
+        /* BaseWeb select placeholder */
+        div[data-baseweb="select"] [placeholder],
+        .stMultiSelect input::placeholder {
+            color: var(--text-muted) !important;
+            opacity: 1 !important;
+        }
+    
+    /* Text areas - professional styling */
+    .stTextArea > div > div > textarea {
+        background-color: var(--input-bg);
+        color: var(--input-text);
+        border: 1px solid var(--input-border);
+        border-radius: 6px;
+        padding: 12px;
+        font-size: 0.95rem;
+    }
+    
+    .stTextArea > div > div > textarea:focus {
+        border-color: var(--accent);
+        box-shadow: 0 0 0 2px rgba(10, 102, 194, 0.15);
+        outline: none;
+    }
+    
+    /* Text inputs - professional styling */
+    .stTextInput > div > div > input {
+        background-color: var(--input-bg);
+        color: var(--input-text);
+        border: 1px solid var(--input-border);
+        border-radius: 6px;
+        font-size: 0.95rem;
+    }
+    
+    .stTextInput > div > div > input:focus {
+        border-color: var(--accent);
+        box-shadow: 0 0 0 2px rgba(10, 102, 194, 0.15);
+        outline: none;
+    }
+    
+    /* Select boxes - professional styling */
+    .stSelectbox > div > div > select {
+        background-color: var(--input-bg) !important;
+        color: var(--input-text) !important;
+        border: 1px solid var(--input-border) !important;
+        border-radius: 6px;
+        font-size: 0.95rem;
+    }
+    
+    /* Selectbox dropdown arrow - theme-aware */
+    .stSelectbox svg,
+    .stSelectbox [data-baseweb="select"] svg {
+        fill: var(--icon-color) !important;
+        color: var(--icon-color) !important;
+        opacity: 1 !important;
+    }
+    
+    /* Selectbox label and text */
+    .stSelectbox label,
+    .stSelectbox [data-baseweb="select"] {
+        color: var(--text-primary) !important;
+    }
+    
+    /* Selectbox selected value */
+    .stSelectbox [data-baseweb="select"] > div,
+    .stSelectbox [data-baseweb="select"] > div > div {
+        color: var(--input-text) !important;
+        background-color: var(--input-bg) !important;
+    }
+    
+    /* Selectbox selected value text */
+    .stSelectbox [data-baseweb="select"] > div *,
+    .stSelectbox [data-baseweb="select"] > div > div * {
+        color: var(--input-text) !important;
+    }
+    
+    /* Premium Buttons - LinkedIn/Workday style */
+    .stButton > button {
+        background: var(--accent) !important;
+        color: white !important;
+        border: none;
+        border-radius: 6px;
+        padding: 0.75rem 2rem;
+        font-weight: 600;
+        font-size: 0.95rem;
+        transition: all 0.2s ease;
+        box-shadow: 0 2px 4px rgba(10, 102, 194, 0.2);
+    }
+    
+    /* Ensure button text and inner elements are white */
+    .stButton > button *,
+    .stButton > button span,
+    .stButton > button div {
+        color: white !important;
+        background-color: transparent !important;
+    }
+    
+    .stButton > button:hover {
+        background: var(--accent-hover) !important;
+        color: white !important;
+        transform: translateY(-1px);
+        box-shadow: 0 4px 8px rgba(10, 102, 194, 0.3);
+    }
+    
+    .stButton > button:hover * {
+        color: white !important;
+        background-color: transparent !important;
+    }
+    
+    .stButton > button:disabled {
+        background: var(--button-disabled-bg) !important;
+        color: var(--button-disabled-text) !important;
+        cursor: not-allowed;
+        transform: none;
+        box-shadow: none;
+    }
+    
+    .stButton > button:disabled * {
+        color: var(--button-disabled-text) !important;
+        background-color: transparent !important;
+    }
+    
+    /* Metrics - professional styling */
+    [data-testid="stMetricValue"] {
+        color: var(--accent) !important;
+        font-size: 2rem;
+        font-weight: 600;
+        background-color: transparent !important;
+    }
+    
+    [data-testid="stMetricLabel"] {
+        color: var(--text-secondary) !important;
+        font-size: 0.9rem;
+        background-color: transparent !important;
+    }
+    
+    /* Expanders - professional styling */
+    .streamlit-expanderHeader {
+        background-color: var(--expander-header-bg) !important;
+        color: var(--text-primary) !important;
+        border-radius: 6px;
+        padding: 1rem;
+        border: 1px solid var(--input-border) !important;
+        font-weight: 500;
+    }
+    
+    /* Expander header nested elements - transparent background, inherit text */
+    .streamlit-expanderHeader *,
+    .streamlit-expanderHeader > *,
+    .streamlit-expanderHeader div,
+    .streamlit-expanderHeader span,
+    .streamlit-expanderHeader p,
+    .streamlit-expanderHeader label {
+        background: transparent !important;
+        border: none !important;
+        box-shadow: none !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Dark expander headers - white text */
+    .streamlit-expanderHeader[style*="background"][style*="#0f"],
+    .streamlit-expanderHeader[style*="background"][style*="#1a"],
+    .streamlit-expanderHeader[style*="background"][style*="#1e"],
+    .streamlit-expanderHeader[style*="background-color"][style*="#0f"],
+    .streamlit-expanderHeader[style*="background-color"][style*="#1a"],
+    .streamlit-expanderHeader[style*="background-color"][style*="#1e"] {
+        color: white !important;
+    }
+    
+    .streamlit-expanderHeader[style*="background"][style*="#0f"] *,
+    .streamlit-expanderHeader[style*="background"][style*="#1a"] *,
+    .streamlit-expanderHeader[style*="background"][style*="#1e"] *,
+    .streamlit-expanderHeader[style*="background-color"][style*="#0f"] *,
+    .streamlit-expanderHeader[style*="background-color"][style*="#1a"] *,
+    .streamlit-expanderHeader[style*="background-color"][style*="#1e"] * {
+        color: white !important;
+        background-color: transparent !important;
+    }
+    
+    /* Expander arrow/chevron - theme-aware */
+    .streamlit-expanderHeader svg,
+    .streamlit-expanderHeader [data-testid="stExpanderToggleIcon"],
+    [data-testid="stExpanderToggleIcon"] {
+        fill: var(--icon-color) !important;
+        color: var(--icon-color) !important;
+        opacity: 1 !important;
+        stroke: var(--icon-color) !important;
+    }
+    
+    .streamlit-expanderContent {
+        background-color: var(--expander-content-bg) !important;
+        border-radius: 0 0 6px 6px;
+        padding: 1.5rem;
+        line-height: 1.6;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Nested wrappers and text in expander content - transparent background */
+    .streamlit-expanderContent div,
+    .streamlit-expanderContent span,
+    .streamlit-expanderContent p,
+    .streamlit-expanderContent label {
+        background: transparent !important;
+        border: none !important;
+        box-shadow: none !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Exclude actual inputs and buttons - they need their own styling */
+    .streamlit-expanderContent input[type="text"],
+    .streamlit-expanderContent input[type="number"],
+    .streamlit-expanderContent textarea,
+    .streamlit-expanderContent button,
+    .streamlit-expanderContent [data-testid="stButton"] > button,
+    .streamlit-expanderContent [data-testid="stDownloadButton"] > button {
+        background-color: var(--input-bg) !important;
+    }
+    
+    /* Sidebar expander arrows */
+    [data-testid="stSidebar"] .streamlit-expanderHeader svg {
+        fill: var(--icon-color) !important;
+        color: var(--icon-color) !important;
+        opacity: 1 !important;
+    }
+    
+    /* Alert boxes (info/success/warning/error) - professional styling - FLAT like button */
+    .stInfo, .stSuccess, .stWarning, .stError {
+        border: 1px solid var(--card-border) !important;
+        border-radius: 6px;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Per-type background and accent border */
+    .stInfo {
+        background-color: var(--info-bg) !important;
+        border-left: 3px solid var(--accent) !important;
+    }
+    
+    .stSuccess {
+        background-color: var(--success-bg) !important;
+        border-left: 3px solid #0d7377 !important;
+    }
+    
+    .stWarning {
+        background-color: var(--warning-bg) !important;
+        border-left: 3px solid #f59e0b !important;
+    }
+    
+    .stError {
+        background-color: var(--error-bg) !important;
+        border-left: 3px solid #d93025 !important;
+    }
+    
+    /* Nested wrappers and text - transparent background, inherit text color */
+    .stInfo div, .stInfo span, .stInfo p, .stInfo label,
+    .stSuccess div, .stSuccess span, .stSuccess p, .stSuccess label,
+    .stWarning div, .stWarning span, .stWarning p, .stWarning label,
+    .stError div, .stError span, .stError p, .stError label {
+        background: transparent !important;
+        border: none !important;
+        box-shadow: none !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Exclude actual inputs and buttons - they need their own styling */
+    .stInfo input[type="text"], .stInfo input[type="number"], .stInfo textarea, .stInfo button,
+    .stInfo [data-testid="stButton"] > button, .stInfo [data-testid="stDownloadButton"] > button,
+    .stSuccess input[type="text"], .stSuccess input[type="number"], .stSuccess textarea, .stSuccess button,
+    .stSuccess [data-testid="stButton"] > button, .stSuccess [data-testid="stDownloadButton"] > button,
+    .stWarning input[type="text"], .stWarning input[type="number"], .stWarning textarea, .stWarning button,
+    .stWarning [data-testid="stButton"] > button, .stWarning [data-testid="stDownloadButton"] > button,
+    .stError input[type="text"], .stError input[type="number"], .stError textarea, .stError button,
+    .stError [data-testid="stButton"] > button, .stError [data-testid="stDownloadButton"] > button {
+        background-color: var(--input-bg) !important;
+    }
+    
+    /* Dataframes */
+    .dataframe,
+    .dataframe *,
+    .dataframe th,
+    .dataframe td,
+    .dataframe thead,
+    .dataframe tbody {
+        background-color: var(--dataframe-bg) !important;
+        color: var(--dataframe-text) !important;
+    }
+    
+    /* File uploader - professional styling */
+    [data-testid="stFileUploader"] {
+        background-color: var(--uploader-bg) !important;
+        border-radius: 6px;
+        padding: 1rem;
+        border: 2px dashed var(--uploader-border) !important;
+    }
+    
+    /* File uploader inner section */
+    [data-testid="stFileUploader"] section,
+    [data-testid="stFileUploader"] > div,
+    [data-testid="stFileUploader"] > div > div,
+    [data-testid="stFileUploader"] section *,
+    [data-testid="stFileUploader"] > div * {
+        background-color: var(--uploader-bg) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Progress bar */
+    .stProgress > div > div > div {
+        background-color: var(--accent-light);
+    }
+    
+    /* Main content area */
+    .main .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+    }
+    
+    /* Custom card styling */
+    .enterprise-card {
+        background: var(--card-bg) !important;
+        border: 1px solid var(--card-border) !important;
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
+        color: var(--text-primary) !important;
+    }
+    
+    /* Text inside enterprise cards - no background override */
+    .enterprise-card p,
+    .enterprise-card div:not([class*="st"]):not([data-testid]),
+    .enterprise-card span:not([class*="st"]):not([data-testid]) {
+        color: var(--text-primary) !important;
+        background-color: transparent !important;
+    }
+    
+    /* Exclude inputs and buttons from background inheritance */
+    .enterprise-card input,
+    .enterprise-card button,
+    .enterprise-card [data-testid="stButton"],
+    .enterprise-card [data-testid="stDownloadButton"],
+    .enterprise-card [data-testid="stNumberInput"] {
+        background-color: var(--input-bg) !important;
+    }
+    
+    /* Score badges */
+    .score-high {
+        color: var(--score-high);
+        font-weight: 700;
+        font-size: 1.2rem;
+    }
+    
+    .score-medium {
+        color: var(--score-medium);
+        font-weight: 700;
+        font-size: 1.2rem;
+    }
+    
+    .score-low {
+        color: var(--score-low);
+        font-weight: 700;
+        font-size: 1.2rem;
+    }
+
+    
+    /* Multiselect - professional styling to match theme */
+    .stMultiSelect > div > div {
+        background-color: var(--multiselect-bg) !important;
+        border: 1px solid var(--multiselect-border) !important;
+        border-radius: 6px;
+    }
+    
+    /* Multiselect tags container */
+    .stMultiSelect [data-baseweb="select"] > div,
+    .stMultiSelect [data-baseweb="select"] > div > div {
+        background-color: var(--multiselect-bg) !important;
+        color: var(--multiselect-text) !important;
+    }
+    
+    /* Multiselect dropdown arrow - theme-aware */
+    .stMultiSelect svg,
+    .stMultiSelect [data-baseweb="select"] svg {
+        fill: var(--icon-color) !important;
+        color: var(--icon-color) !important;
+        opacity: 1 !important;
+    }
+    
+    /* Multiselect label */
+    .stMultiSelect label {
+        color: var(--text-primary) !important;
+    }
+    
+    /* Selected items (tags/chips) - dark background with white text */
+    .stMultiSelect [data-baseweb="tag"],
+    .stMultiSelect [data-baseweb="tag"] * {
+        background-color: #111827 !important;
+        color: white !important;
+        border: none !important;
+        border-radius: 4px !important;
+        padding: 4px 8px !important;
+        font-size: 0.875rem !important;
+        font-weight: 500 !important;
+    }
+    
+    .stMultiSelect [data-baseweb="tag"]:hover {
+        background-color: #1f2937 !important;
+    }
+    
+    /* Remove button (X) in tags */
+    .stMultiSelect [data-baseweb="tag"] [role="button"],
+    .stMultiSelect [data-baseweb="tag"] button,
+    .stMultiSelect [data-baseweb="tag"] svg {
+        color: white !important;
+        fill: white !important;
+        opacity: 0.9 !important;
+    }
+    
+    .stMultiSelect [data-baseweb="tag"] [role="button"]:hover,
+    .stMultiSelect [data-baseweb="tag"] button:hover {
+        opacity: 1 !important;
+        background-color: rgba(255, 255, 255, 0.2) !important;
+        border-radius: 3px !important;
+    }
+    
+    /* Alternative selectors for multiselect tags */
+    .stMultiSelect span[data-testid="stMarkdownContainer"] span,
+    .stMultiSelect div[style*="background"] {
+        background-color: #111827 !important;
+        color: white !important;
+    }
+    
+    /* Target any chip-like elements in multiselect */
+    .stMultiSelect > div > div > div > div[style*="rgb"] {
+        background-color: #111827 !important;
+        color: white !important;
+    }
+    
+    /* Ensure no white backgrounds inside chips */
+    /* Multiselect dropdown */
+    .stMultiSelect [data-baseweb="select"] {
+        background-color: var(--multiselect-bg) !important;
+        color: var(--multiselect-text) !important;
+        border: 1px solid var(--multiselect-border) !important;
+        border-radius: 6px !important;
+    }
+    
+    /* Multiselect input */
+    .stMultiSelect input {
+        background-color: var(--multiselect-bg) !important;
+        color: var(--multiselect-text) !important;
+    }
+    
+    
+    /* Style for selected option chips/tags - dark background with white text */
+    div[data-baseweb="select"] [data-baseweb="tag"],
+    div[data-baseweb="select"] span[style*="background-color: rgb"],
+    .stMultiSelect div[style*="background-color: rgb(255"] {
+        background-color: #111827 !important;
+        color: white !important;
+        border-color: #111827 !important;
+    }
+    
+    /* Ensure chip inner elements have no white backgrounds */
+    div[data-baseweb="select"] [data-baseweb="tag"] *,
+    div[data-baseweb="select"] [data-baseweb="tag"] span,
+    div[data-baseweb="select"] [data-baseweb="tag"] div {
+        background-color: transparent !important;
+        color: white !important;
+    }
+
+    /* ============================================
+       DROPDOWN OPTIONS MENU
+       ============================================ */
+    
+    /* Selectbox dropdown menu/popover */
+    div[data-baseweb="popover"] {
+        background-color: var(--input-bg) !important;
+        border: 1px solid var(--input-border) !important;
+        border-radius: 6px !important;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1) !important;
+    }
+    
+    /* Dropdown option items */
+    div[data-baseweb="popover"] ul,
+    div[data-baseweb="popover"] li,
+    div[data-baseweb="popover"] [role="option"] {
+        background-color: var(--input-bg) !important;
+        color: var(--input-text) !important;
+    }
+    
+    /* Dropdown option hover state */
+    div[data-baseweb="popover"] [role="option"]:hover,
+    div[data-baseweb="popover"] li:hover,
+    div[data-baseweb="popover"] [role="listbox"] li:hover {
+        background-color: var(--surface) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Dropdown option hover state text */
+    div[data-baseweb="popover"] [role="option"]:hover *,
+    div[data-baseweb="popover"] li:hover *,
+    div[data-baseweb="popover"] [role="listbox"] li:hover * {
+        color: var(--text-primary) !important;
+    }
+    
+    /* Dropdown option selected state */
+    div[data-baseweb="popover"] [role="option"][aria-selected="true"],
+    div[data-baseweb="popover"] li[aria-selected="true"],
+    div[data-baseweb="popover"] [role="listbox"] li[aria-selected="true"],
+    div[data-baseweb="popover"] [role="option"][aria-selected="true"] *,
+    div[data-baseweb="popover"] li[aria-selected="true"] *,
+    div[data-baseweb="popover"] [role="listbox"] li[aria-selected="true"] * {
+        background-color: var(--accent) !important;
+        color: white !important;
+    }
+    
+    section[data-testid="stSidebar"] {
+    background-color: #f1f5f9 !important;
+    border-right: 1px solid #e5e7eb !important;
+    box-shadow: 4px 0 12px rgba(0, 0, 0, 0.06) !important;
+   }
+
+    
+    /* Sidebar text */
+    [data-testid="stSidebar"] p,
+    [data-testid="stSidebar"] div,
+    [data-testid="stSidebar"] span,
+    [data-testid="stSidebar"] label {
+        color: var(--text-primary) !important;
+    }
+    
+    /* Sidebar expander content */
+    [data-testid="stSidebar"] .streamlit-expanderContent {
+        background-color: var(--expander-content-bg) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* ============================================
+       ADDITIONAL FIXES
+       ============================================ */
+    
+    /* Download buttons and action buttons */
+    [data-testid="stDownloadButton"] > button,
+    [data-testid="stDownloadButton"] > button *,
+    a[download],
+    a[href*="download"] {
+        background-color: var(--accent) !important;
+        color: white !important;
+    }
+    
+    /* Number input */
+    .stNumberInput > div > div > input {
+        background-color: var(--input-bg) !important;
+        color: var(--input-text) !important;
+        border: 1px solid var(--input-border) !important;
+    }
+    
+    /* Number input label - ensure visibility */
+    .stNumberInput label,
+    .stNumberInput [data-testid="stWidgetLabel"],
+    .stNumberInput [data-testid="stWidgetLabel"] * {
+        color: var(--text-primary) !important;
+        background: transparent !important;
+    }
+    
+    /* Number input container - remove white boxes */
+    .stNumberInput > div,
+    .stNumberInput > div > div {
+        background: transparent !important;
+    }
+    
+    /* Number input on dark backgrounds - white text */
+    [style*="background"][style*="#0f"] .stNumberInput label,
+    [style*="background"][style*="#1a"] .stNumberInput label,
+    [style*="background"][style*="#1e"] .stNumberInput label,
+    [style*="background-color"][style*="#0f"] .stNumberInput label,
+    [style*="background-color"][style*="#1a"] .stNumberInput label,
+    [style*="background-color"][style*="#1e"] .stNumberInput label {
+        color: white !important;
+    }
+    
+    /* File uploader text */
+    [data-testid="stFileUploader"] label,
+    [data-testid="stFileUploader"] p,
+    [data-testid="stFileUploader"] span,
+    [data-testid="stFileUploader"] div,
+    [data-testid="stFileUploader"] button,
+    [data-testid="stFileUploader"] button * {
+        color: var(--text-primary) !important;
+        background-color: transparent !important;
+    }
+    
+    /* File uploader helper text */
+    [data-testid="stFileUploader"] small,
+    [data-testid="stFileUploader"] [class*="caption"] {
+        color: var(--text-secondary) !important;
+    }
+    
+    /* Result sections and cards - ensure readable text in light mode */
+    [data-testid="stVerticalBlock"],
+    [data-testid="stHorizontalBlock"],
+    [data-testid="stMarkdownContainer"],
+    [class*="result"],
+    [class*="candidate"],
+    [class*="ranking"] {
+        background-color: var(--background) !important;
+        color: var(--text-primary) !important;
+    }
+    
+    /* Text elements only; everything else inherits the block color above.
+       :where() keeps the specificity of the old "block *" selectors. */
+    [data-testid="stVerticalBlock"] :where(p, span, label, li, h1, h2, h3, h4, h5, h6, strong, em, small),
+    [data-testid="stHorizontalBlock"] :where(p, span, label, li, h1, h2, h3, h4, h5, h6, strong, em, small),
+    [data-testid="stMarkdownContainer"] :where(p, span, label, li, h1, h2, h3, h4, h5, h6, strong, em, small) {
+        color: var(--text-primary) !important;
+    }
+    
+    /* ============================================
+       TOOLTIP STYLING (GLOBAL FIX)
+       ============================================ */
+    
+    /* BaseWeb tooltip container - comprehensive selectors */
+    div[data-baseweb="tooltip"],
+    [data-baseweb="tooltip"],
+    [data-baseweb="popover"][role="tooltip"],
+    div[role="tooltip"],
+    [role="tooltip"] {
+        background-color: var(--tooltip-bg) !important;
+        color: var(--tooltip-text) !important;
+        border: 1px solid var(--border) !important;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.2) !important;
+    }
+    
+    /* Tooltip text content - all nested elements */
+    div[data-baseweb="tooltip"] *,
+    [data-baseweb="tooltip"] *,
+    [data-baseweb="popover"][role="tooltip"] *,
+    div[role="tooltip"] *,
+    [role="tooltip"] *,
+    div[data-baseweb="tooltip"] span,
+    [data-baseweb="tooltip"] span,
+    [data-baseweb="popover"][role="tooltip"] span,
+    div[role="tooltip"] span,
+    [role="tooltip"] span,
+    div[data-baseweb="tooltip"] p,
+    [data-baseweb="tooltip"] p,
+    [data-baseweb="popover"][role="tooltip"] p,
+    div[role="tooltip"] p,
+    [role="tooltip"] p {
+        color: var(--tooltip-text) !important;
+        background-color: transparent !important;
+    }
+    
+    /* Streamlit-specific tooltip selectors */
+    [data-testid="stTooltip"],
+    [data-testid="stTooltip"] *,
+    [data-testid="stTooltip"] span,
+    [data-testid="stTooltip"] p {
+        color: var(--tooltip-text) !important;
+        background-color: var(--tooltip-bg) !important;
+    }
+    
+    /* Tooltip arrow/pointer styling */
+    div[data-baseweb="tooltip"]::before,
+    [data-baseweb="tooltip"]::before,
+    [data-baseweb="popover"][role="tooltip"]::before,
+    div[role="tooltip"]::before,
+    [role="tooltip"]::before {
+        border-color: var(--border) transparent transparent transparent !important;
+    }
+    
+    /* Alternative tooltip selectors for BaseWeb classes */
+    [class*="tooltip"],
+    [class*="Tooltip"],
+    [class*="Popover"][role="tooltip"] {
+        background-color: var(--tooltip-bg) !important;
+        color: var(--tooltip-text) !important;
+    }
+    
+    [class*="tooltip"] *,
+    [class*="Tooltip"] *,
+    [class*="Popover"][role="tooltip"] * {
+        color: var(--text-primary) !important;
+    }
+    
+    /* Ensure tooltip has high z-index and is visible */
+    div[data-baseweb="tooltip"],
+    [data-baseweb="tooltip"],
+    [role="tooltip"] {
+        z-index: 9999 !important;
+        opacity: 1 !important;
+    }
+    
+    /* Success toast animation - professional and subtle */
+    .stSuccess {
+        animation: slideInDown 0.3s ease-out;
+        position: relative;
+        z-index: 999;
+    }
+    
+    @keyframes slideInDown {
+        from {
+            transform: translateY(-20px);
+            opacity: 0;
+        }
+        to {
+            transform: translateY(0);
+            opacity: 1;
+        }
+    }
+"""
+
+# Additional rules applied only in light mode
+_LIGHT_EXTRA_CSS_SOURCE = """
+    /* ============================================
+       LIGHT MODE ONLY FIXES
+       ============================================ */
+    
+    /* TASK 1: Fix 'Other Ranked Candidates' header bar (Light Mode Only) */
+    /* The header is rendered with this class in display_results */
+    .other-candidates-header {
+        background-color: #F9FAFB !important;
+        border: 1px solid #E5E7EB !important;
+        border-radius: 6px;
+        padding: 0.5rem 1rem;
+        color: #111827 !important;
+    }
+    
+    /* TASK 2: Fix Matched Skills / Missing Skills boxes (Light Mode Only) */
+    /* Outlined cards for st.info and st.warning in results section */
+    [data-testid="stExpander"] .stInfo,
+    [data-testid="stExpander"] .stWarning {
+        background-color: #FFFFFF !important;
+        border-radius: 6px;
+        padding: 1rem;
+        color: #111827 !important;
+    }
+    
+    [data-testid="stExpander"] .stInfo {
+        border: 1px solid #2563EB !important;
+        border-left: 1px solid #2563EB !important;
+    }
+    
+    [data-testid="stExpander"] .stWarning {
+        border: 1px solid #F59E0B !important;
+        border-left: 1px solid #F59E0B !important;
+    }
+    
+    [data-testid="stExpander"] .stInfo *,
+    [data-testid="stExpander"] .stWarning * {
+        background-color: transparent !important;
+        color: #111827 !important;
+    }
+    
+    
+    
+    /* TASK 4: Fix Candidate expander headers (Light Mode Only) */
+    /* Candidate result expander headers - light background */
+    /* Target expanders in the main area (not sidebar expanders) */
+    :is(section.main, [data-testid="stMain"]) [data-testid="stExpander"] .streamlit-expanderHeader {
+        background-color: #FFFFFF !important;
+        border: 1px solid #E5E7EB !important;
+        color: #111827 !important;
+        border-radius: 6px;
+        padding: 1rem;
+        font-weight: 600;
+    }
+    
+    :is(section.main, [data-testid="stMain"]) [data-testid="stExpander"] .streamlit-expanderHeader * {
+        background-color: transparent !important;
+        color: #111827 !important;
+    }
+    
+    /* Candidate expander chevron icon */
+    :is(section.main, [data-testid="stMain"]) [data-testid="stExpander"] .streamlit-expanderHeader svg,
+    :is(section.main, [data-testid="stMain"]) [data-testid="stExpander"] [data-testid="stExpanderToggleIcon"] {
+        fill: #374151 !important;
+        color: #374151 !important;
+        stroke: #374151 !important;
+    }
+
+    /* Fix light mode icon (sun) */
+section[data-testid="stSidebar"] img {
+    background: transparent !important;
+    border-radius: 8px !important;
+}
+
+
+    /* ===============================
+       1. SIDEBAR OPEN / CLOSE ARROW
+       =============================== */
+
+    /* OPEN sidebar button (>>) */
+    button[data-testid="collapsedControl"] {
+        background: #ffffff !important;
+        border: 1px solid #d1d5db !important;
+        border-radius: 8px !important;
+        box-shadow: 0 1px 4px rgba(0, 0, 0, 0.08) !important;
+        opacity: 1 !important;
+    }
+
+    button[data-testid="collapsedControl"]:hover {
+        background-color: #f9fafb !important;
+    }
+
+    /* Arrow icon inside the open button */
+    button[data-testid="collapsedControl"] svg {
+        fill: #111827 !important;
+        stroke: #111827 !important;
+        color: #111827 !important;
+        opacity: 1 !important;
+    }
+
+    /* CLOSE sidebar button (<<) */
+    button[data-testid="stSidebarCollapseButton"] svg,
+    button[data-testid="stSidebarCollapseButton"] svg path {
+        fill: #111827 !important;
+        stroke: #111827 !important;
+        opacity: 1 !important;
+    }
+
+    /* ===============================
+       2. OTHER RANKED CANDIDATES TABLE
+       =============================== */
+
+    /* Table wrapper */
+    [data-testid="stDataFrame"] {
+        background-color: #ffffff !important;
+        border: 1px solid #e5e7eb !important;
+        border-radius: 8px !important;
+    }
+
+    /* Header */
+    [data-testid="stDataFrame"] thead th {
+        background-color: #f9fafb !important;
+        color: #111827 !important;
+        border-bottom: 1px solid #e5e7eb !important;
+    }
+
+    /* Rows */
+    [data-testid="stDataFrame"] tbody td {
+        background-color: #ffffff !important;
+        color: #111827 !important;
+        border-bottom: 1px solid #e5e7eb !important;
+    }
+
+    /* Kill dark BaseWeb layers */
+    [data-testid="stDataFrame"] * {
+        background-color: transparent !important;
+        color: #111827 !important;
+    }
+
+    /* Hover */
+    [data-testid="stDataFrame"] tbody tr:hover td {
+        background-color: #f3f4f6 !important;
+    }
+
+    
+
+
+
+/* =========================================
+   LIGHT MODE – DATAFRAME FULLSCREEN (MODAL)
+   ========================================= */
+
+/* Fullscreen modal background */
+[data-baseweb="modal"] {
+    background-color: rgba(255, 255, 255, 0.98) !important;
+}
+
+/* Modal content wrapper */
+[data-baseweb="modal"] [data-testid="stDataFrame"] {
+    background-color: #ffffff !important;
+    border-radius: 8px !important;
+}
+
+/* Table header in fullscreen */
+[data-baseweb="modal"] thead tr th {
+    background-color: #f9fafb !important;
+    color: #111827 !important;
+    border-bottom: 1px solid #e5e7eb !important;
+}
+
+/* Table rows in fullscreen */
+[data-baseweb="modal"] tbody tr td {
+    background-color: #ffffff !important;
+    color: #111827 !important;
+    border-bottom: 1px solid #e5e7eb !important;
+}
+
+/* Remove dark base layers */
+[data-baseweb="modal"] * {
+    background-color: transparent !important;
+    color: #111827 !important;
+}
+
+/* Hover effect */
+[data-baseweb="modal"] tbody tr:hover td {
+    background-color: #f3f4f6 !important;
+}
+
+/* =========================================
+   LIGHT MODE – SIDEBAR VISUAL SEPARATION
+   ========================================= */
+
+/* Sidebar background */
+section[data-testid="stSidebar"] {
+    background-color: #f8fafc !important;   /* slightly off-white */
+    border-right: 1px solid #e5e7eb !important;
+}
+
+/* Inner sidebar content */
+section[data-testid="stSidebar"] > div {
+    background-color: #f8fafc !important;
+}
+
+/* Add subtle depth so it doesn't merge */
+section[data-testid="stSidebar"] {
+    box-shadow: 2px 0 6px rgba(0, 0, 0, 0.04) !important;
+}
+
+/* Sidebar text */
+section[data-testid="stSidebar"] * {
+    color: #111827 !important;
+}
+
+/* Sidebar buttons/cards */
+section[data-testid="stSidebar"] button,
+section[data-testid="stSidebar"] [role="button"] {
+    background-color: #ffffff !important;
+    border: 1px solid #e5e7eb !important;
+}
+
+
+    /* ===============================
+       FIX EXPANDER HEADER – LIGHT MODE
+       =============================== */
+
+    [data-testid="stExpander"] summary {
+        background-color: #ffffff !important;
+        color: #111827 !important;
+        border: 1px solid #e5e7eb !important;
+        border-radius: 6px !important;
+        padding: 12px 16px !important;
+        font-weight: 600 !important;
+    }
+
+    /* Remove dark inner bars */
+    [data-testid="stExpander"] summary * {
+        background: transparent !important;
+        color: #111827 !important;
+    }
+
+    /* Arrow icon */
+    [data-testid="stExpander"] svg {
+        fill: #374151 !important;
+        color: #374151 !important;
+    }
+
+    /* Hover */
+    [data-testid="stExpander"] summary:hover {
+        background-color: #f9fafb !important;
+    }
+
+    /* ===============================
+       FIX OTHER RANKED CANDIDATES TABLE
+       =============================== */
+
+    section[data-testid="stDataFrame"] {
+        background-color: #ffffff !important;
+        border: 1px solid #e5e7eb !important;
+        border-radius: 8px !important;
+    }
+
+    section[data-testid="stDataFrame"] * {
+        color: #111827 !important;
+        background-color: transparent !important;
+    }
+
+
+    /* ========= SIDEBAR BACKGROUND ========= */
+    section[data-testid="stSidebar"] {
+        background-color: #f8fafc !important;
+        border-right: 1px solid #e5e7eb !important;
+        box-shadow: 2px 0 6px rgba(0,0,0,0.05) !important;
+    }
+
+  
+/* =====================================================
+   LIGHT MODE – FIX ALL INFO / WARNING INNER WHITE BOXES
+   ===================================================== */
+
+
+    /* ================================
+       BASE ALERT CONTAINERS
+       ================================ */
+    .stAlert {
+        border-radius: 8px !important;
+        box-shadow: none !important;
+    }
+
+    /* Selected / Matched Skills (Info) */
+    .stAlert.stInfo {
+        background-color: #dbeafe !important;  /* light blue */
+        border: none !important;
+    }
+
+    /* Missing Skills (Warning) */
+    .stAlert.stWarning {
+        background-color: #fef3c7 !important;  /* light yellow */
+        border: 1px solid #f59e0b !important;
+    }
+
+     /* =========================================
+       4. TEXT CURSOR / CARET VISIBILITY
+       ========================================= */
+    
+    /* Text input caret */
+    .stTextInput input,
+    .stTextInput input[type="text"],
+    .stTextInput input[type="password"],
+    .stTextArea textarea {
+        caret-color: #000000 !important;
+    }
+    
+    /* Number input caret */
+    .stNumberInput input,
+    .stNumberInput input[type="number"] {
+        caret-color: #000000 !important;
+    }
+    
+    /* Chat input caret (if exists) */
+    .stChatInput input,
+    .stChatInput textarea {
+        caret-color: #000000 !important;
+    }
+    
+    /* Expander content inputs */
+    [data-testid="stExpander"] .stTextInput input,
+    [data-testid="stExpander"] .stTextArea textarea {
+        caret-color: #000000 !important;
+    }
+
+    
+
+    /* ================================
+       REMOVE ALL INNER WHITE LAYERS
+       ================================ */
+    .stAlert > div,
+    .stAlert > div > div,
+    .stAlert > div > div > div,
+    .stAlert .stMarkdown,
+    .stAlert .stMarkdownContainer {
+        background-color: transparent !important;
+        padding: 0 !important;
+        margin: 0 !important;
+        box-shadow: none !important;
+    }
+
+    /* ================================
+       TEXT VISIBILITY
+       ================================ */
+    .stAlert p,
+    .stAlert span,
+    .stAlert div {
+        background: transparent !important;
+        color: #111827 !important;
+    }
+
+   
+
+    /* =====================================================
+       LIGHT MODE FIXES REMOVE DARK BASEWEB LAYERS
+       ===================================================== */
+    
+    /* Number input box */
+    .stNumberInput input {
+        background-color: #ffffff !important;
+        color: #111827 !important;
+        border: 1px solid #d1d5db !important;
+    }
+
+    /* Number input + / - buttons */
+    .stNumberInput button,
+    .stNumberInput button * {
+        background-color: transparent !important;
+        color: #374151 !important;
+    }
+
+    /* “Showing additional candidates…” info text */
+    [data-testid="stMarkdownContainer"] p {
+        background-color: transparent !important;
+        color: #111827 !important;
+    }
+
+    /* Remove any remaining dark containers */
+    [data-testid="stVerticalBlock"],
+    [data-testid="stHorizontalBlock"] {
+        background-color: transparent !important;
+    }
+     
+    /* =====================================================
+   LIGHT MODE – FORCE REMOVE DARK BASEWEB CONTAINERS
+   ===================================================== */
+
+/* 1️⃣ “Showing additional candidates…” text block */
+[data-testid="stMarkdownContainer"] {
+    background-color: transparent !important;
+}
+
+[data-testid="stMarkdownContainer"],
+[data-testid="stMarkdownContainer"] :where(p, span, label, li, h1, h2, h3, h4, h5, h6, strong, em, small) {
+    color: #111827 !important;
+}
+
+/* 2️⃣ Remove any leftover dark ranking containers */
+[class*="ranking"],
+[class*="candidate"],
+[data-testid="stVerticalBlock"] > div {
+    background-color: transparent !important;
+}
+
+/* =====================================================
+   LIGHT MODE – FORCE OVERRIDE INLINE DARK BACKGROUNDS
+   ===================================================== */
+
+/* Candidate expander header – FORCE white */
+[data-testid="stExpander"] .streamlit-expanderHeader,
+[data-testid="stExpander"] .streamlit-expanderHeader[style],
+[data-testid="stExpander"] .streamlit-expanderHeader > div[style] {
+    background-color: #ffffff !important;
+    color: #111827 !important;
+    border: 1px solid #e5e7eb !important;
+    border-radius: 6px !important;
+}
+
+/* Remove inner dark BaseWeb bars and inline dark backgrounds */
+[data-testid="stExpander"] .streamlit-expanderHeader > div,
+[data-testid="stExpander"] .streamlit-expanderHeader > div > div,
+[data-testid="stExpander"] .streamlit-expanderHeader *[style*="background"] {
+    background-color: transparent !important;
+}
+
+/* Text inside header */
+[data-testid="stExpander"] .streamlit-expanderHeader *,
+[data-testid="stExpander"] .streamlit-expanderHeader span {
+    background: transparent !important;
+    color: #111827 !important;
+}
+
+/* Prevent hover from being the only fix */
+[data-testid="stExpander"] .streamlit-expanderHeader:hover,
+[data-testid="stExpander"] .streamlit-expanderHeader:hover * {
+    background-color: #ffffff !important;
+    color: #111827 !important;
+}
+
+/* Other Ranked Candidates header block */
+[data-testid="stVerticalBlock"] h3,
+[data-testid="stVerticalBlock"] h3 + div {
+    background-color: transparent !important;
+    color: #111827 !important;
+}
+
+/* =====================================================
+   FINAL FIX – BASEWEB EXPANDER BUTTON (BLACK BAR)
+   ===================================================== */
+
+/* Expander toggle button itself */
+button[data-testid="stExpanderToggle"] {
+    background-color: #f9fafb !important;
+    color: #111827 !important;
+    border: 1px solid #e5e7eb !important;
+    border-radius: 6px !important;
+}
+
+/* Inner BaseWeb container inside the button */
+button[data-testid="stExpanderToggle"] > div,
+button[data-testid="stExpanderToggle"] div[style] {
+    background-color: transparent !important;
+}
+
+/* Text inside expander button */
+button[data-testid="stExpanderToggle"] span,
+button[data-testid="stExpanderToggle"] p,
+button[data-testid="stExpanderToggle"] div {
+    color: #111827 !important;
+    background: transparent !important;
+}
+
+/* Prevent hover-only behavior */
+button[data-testid="stExpanderToggle"]:hover {
+    background-color: #f3f4f6 !important;
+}
+
+/* Chevron icon */
+button[data-testid="stExpanderToggle"] svg {
+    color: #374151 !important;
+    fill: #374151 !important;
+}
+
+.safe-expander summary {
+    background: #ffffff;
+    border: 1px solid #e5e7eb;
+    border-radius: 6px;
+    padding: 12px 16px;
+    font-weight: 600;
+    color: #111827;
+    cursor: pointer;
+    list-style: none;
+}
+
+/* Arrow for safe expander */
+.safe-expander summary {
+    position: relative;
+    padding-left: 28px;
+}
+
+/* Arrow icon */
+.safe-expander summary::before {
+    content: "▸";
+    position: absolute;
+    left: 10px;
+    top: 50%;
+    transform: translateY(-50%);
+    font-size: 14px;
+    color: #374151;
+    transition: transform 0.2s ease;
+}
+
+/* Rotate arrow when open */
+.safe-expander details[open] summary::before {
+    transform: translateY(-50%) rotate(90deg);
+}
+
+
+.safe-expander summary::-webkit-details-marker {
+    display: none;
+}
+
+.safe-expander details {
+    margin-bottom: 1rem;
+}
+
+.safe-expander details[open] summary {
+    background: #f9fafb;
+}
+"""
+
+
+# Stylesheet for the authentication pages, emitted after the theme stylesheet
+# (whose :root block defines the variables used here)
+_AUTH_CSS_SOURCE = """
+    /* Import professional font */
+    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+    
+    /* Main background */
+    .stApp {
+        background: var(--app-bg);
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    }
+
+    /* Headers */
+    h1, h2, h3 {
+        color: var(--text-primary) !important;
+        font-weight: 600;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    }
+    
+    /* Body text */
+    p, div, span {
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+        color: var(--text-primary);
+    }
+    
+    /* Labels */
+    label {
+        color: var(--text-primary) !important;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    }
+    
+    /* Text inputs */
+    .stTextInput > div > div > input {
+        background-color: var(--input-bg);
+        color: var(--input-text);
+        border: 1px solid var(--input-border);
+        border-radius: 6px;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    }
+    
+    /* Buttons */
+    .stButton > button {
+        background: var(--accent) !important;
+        color: white !important;
+        border: none;
+        border-radius: 6px;
+        padding: 0.75rem 2rem;
+        font-weight: 600;
+        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    }
+    
+    .stButton > button:hover {
+        background: var(--accent-hover) !important;
+    }
+    
+    /* Title block and divider (stand-ins for separate "---" rules) */
+    .auth-title {
+        border-bottom: 1px solid var(--border);
+        padding-bottom: 1rem;
+        margin-bottom: 1rem;
+    }
+    
+    .auth-divider {
+        border-top: 1px solid var(--border);
+        padding-top: 1rem;
+        margin-top: 1rem;
+    }
+    
+    /* Narrow centered column for the auth forms */
+    section.main > .block-container,
+    [data-testid="stMainBlockContainer"] {
+        max-width: 640px;
+        margin-left: auto;
+        margin-right: auto;
+    }
+    
+    /* Hide sidebar completely */
+    [data-testid="stSidebar"] { display: none; }
+"""
+
+# Auth pages other than signup/forgot also hide the sidebar page navigation
+_AUTH_HIDE_NAV_CSS_SOURCE = """
+    [data-testid="stSidebarNav"] { display: none; }
+"""
+
+
+def _build_theme_vars_css(colors) -> str:
+    """
+    Build the :root custom property block for one theme palette
+    
+    Args:
+        colors: Palette from THEME_CONFIG
+        
+    Returns:
+        :root rule defining --<color-name> variables
+    """
+    declarations = "".join(
+        f"--{key.replace('_', '-')}:{value};" for key, value in colors.items()
+    )
+    return f":root{{{declarations}}}"
+
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE = re.compile(r"\s+")
+# Whitespace around these is never significant. ":" is only stripped after,
+# never before, since "a :hover" (descendant) differs from "a:hover".
+_CSS_PUNCTUATION = re.compile(r"\s*([{};,>])\s*|(:)\s+")
+
+
+def _minify_css(css: str) -> str:
+    """
+    Strip comments and insignificant whitespace from a stylesheet
+    
+    Args:
+        css: Pretty-printed CSS
+        
+    Returns:
+        Minified CSS
+    """
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_WHITESPACE.sub(" ", css)
+    css = _CSS_PUNCTUATION.sub(lambda m: m.group(1) or m.group(2), css)
+    return _dedupe_css_rules(css.replace(";}", "}").strip())
+
+
+def _split_css_rules(css: str) -> List[str]:
+    """
+    Split minified CSS into top-level rules and statements
+    
+    Args:
+        css: Minified CSS
+        
+    Returns:
+        List of rules (nested blocks such as @keyframes stay in one piece)
+    """
+    rules = []
+    depth = 0
+    start = 0
+    quote = None
+    for i, char in enumerate(css):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}" or (char == ";" and depth == 0):
+            if char == "}":
+                depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+    rules.append(css[start:])
+    return rules
+
+
+def _dedupe_css_rules(css: str) -> str:
+    """
+    Drop exact duplicate rules, keeping the last occurrence
+    
+    A repeated identical rule only wins the cascade at its last position,
+    so removing the earlier copies never changes the computed styles.
+    
+    Args:
+        css: Minified CSS
+        
+    Returns:
+        CSS with each distinct rule emitted once
+    """
+    seen = set()
+    kept = []
+    for rule in reversed(_split_css_rules(css)):
+        if rule not in seen:
+            seen.add(rule)
+            kept.append(rule)
+    return "".join(reversed(kept))
+
+
+# Everything is rendered and minified once when the module is first imported.
+# Each theme gets a single stylesheet; the base rules come first because the
+# @import they start with is ignored anywhere but the top of a stylesheet.
+_BASE_CSS = _minify_css(_BASE_CSS_SOURCE)
+_LIGHT_EXTRA_CSS = _minify_css(_LIGHT_EXTRA_CSS_SOURCE)
+_PRECOMPUTED_CSS = {
+    name: "<style>" + _dedupe_css_rules(
+        _BASE_CSS + _build_theme_vars_css(colors) + (_LIGHT_EXTRA_CSS if name == "light" else "")
+    ) + "</style>"
+    for name, colors in THEME_CONFIG.items()
+}
+_PRECOMPUTED_AUTH_CSS = {
+    hide_nav: "<style>" + _minify_css(_AUTH_CSS_SOURCE + (_AUTH_HIDE_NAV_CSS_SOURCE if hide_nav else "")) + "</style>"
+    for hide_nav in (True, False)
+}
+del _BASE_CSS_SOURCE, _LIGHT_EXTRA_CSS_SOURCE, _BASE_CSS, _LIGHT_EXTRA_CSS
+del _AUTH_CSS_SOURCE, _AUTH_HIDE_NAV_CSS_SOURCE
+
+
+def get_theme_css(theme: str) -> str:
+    """
+    Get the complete stylesheet for a theme
+    Uses centralized THEME_CONFIG for consistent colors
+    
+    Args:
+        theme: "dark" or "light"
+        
+    Returns:
+        <style> block for the selected theme
+    """
+    return _PRECOMPUTED_CSS.get(theme, _PRECOMPUTED_CSS["dark"])
+
+
+def get_auth_css(hide_nav: bool = True) -> str:
+    """
+    Get the authentication page CSS (sidebar hidden)
+    Theme colors come from the variables defined by get_theme_css
+    
+    Args:
+        hide_nav: Also hide the sidebar page navigation
+        
+    Returns:
+        <style> block for the auth pages
+    """
+    return _PRECOMPUTED_AUTH_CSS[bool(hide_nav)]
@@ -5,8 +5,13 @@ Utils package for HR AI Agent
 from .loaders import DocumentLoader
 from .splitter import CVTextSplitter
 from .security import SessionManager, SecurityValidator
+from .cache import LRUCache, content_hash
+from .tokens import count_tokens, middle_trim
 
-__all__ = ['DocumentLoader', 'CVTextSplitter', 'SessionManager', 'SecurityValidator']
+__all__ = [
+    'DocumentLoader', 'CVTextSplitter', 'SessionManager', 'SecurityValidator', 'LRUCache', 'content_hash',
+    'count_tokens', 'middle_trim'
+]
 
 
 
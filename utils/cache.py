@@ -0,0 +1,57 @@
+"""
+Small in-process caches keyed by content hash
+Used to avoid repeating embedding/LLM work for the same Job Description
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """
+    Compute a compact, stable hash of text content
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        128-bit blake2b hex digest
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """
+    Minimal least-recently-used cache with a fixed number of entries
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Initialize LRU cache
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return cached value (marking it recently used) or None"""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value, evicting the least recently used entry if full"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -53,6 +53,19 @@ class SessionManager:
         """
         return self.base_temp_dir / session_id
     
+    def path_for(self, session_id: str, filename: str) -> Path:
+        """
+        Get destination path for a file inside a session directory
+        
+        Args:
+            session_id: Session identifier
+            filename: Original filename
+            
+        Returns:
+            Path to the file within the session directory
+        """
+        return self.get_session_dir(session_id) / filename
+    
     def save_file(self, session_id: str, filename: str, file_content: bytes) -> Path:
         """
         Save file to session directory
@@ -65,8 +78,7 @@ class SessionManager:
         Returns:
             Path to saved file
         """
-        session_dir = self.get_session_dir(session_id)
-        file_path = session_dir / filename
+        file_path = self.path_for(session_id, filename)
         with open(file_path, 'wb') as f:
             f.write(file_content)
         logger.info(f"Saved file {filename} to session {session_id}")
@@ -0,0 +1,73 @@
+"""
+Token Counting and Budget Trimming
+Shared tiktoken helpers for keeping LLM inputs within a token budget
+"""
+
+from functools import lru_cache
+import tiktoken
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Marks where the middle of an over-budget text was removed
+TRIM_MARKER = "\n...\n"
+
+
+@lru_cache(maxsize=8)
+def get_encoding(model_name: str = "gpt-4.1") -> tiktoken.Encoding:
+    """
+    Get the tokenizer for a model (falls back for models unknown to tiktoken)
+
+    Args:
+        model_name: OpenAI model name
+
+    Returns:
+        tiktoken encoding
+    """
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str, encoding: tiktoken.Encoding = None) -> int:
+    """
+    Count the tokens in text
+
+    Args:
+        text: Text to count
+        encoding: Tokenizer (default: gpt-4.1's)
+
+    Returns:
+        Number of tokens
+    """
+    encoding = encoding or get_encoding()
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def middle_trim(text: str, max_tokens: int, encoding: tiktoken.Encoding = None) -> str:
+    """
+    Trim text to a token budget by dropping the middle
+
+    CVs and JDs keep contact details and summaries at the top and recent
+    experience or requirements near the end, so both ends are kept.
+
+    Args:
+        text: Text to trim
+        max_tokens: Token budget
+        encoding: Tokenizer (default: gpt-4.1's)
+
+    Returns:
+        The text unchanged if within budget, else its first and last max_tokens / 2 tokens
+    """
+    # Cheap upper bound: byte-level BPE tokens cover at least one UTF-8 byte each
+    # (not one character: CJK and emoji can take several tokens per character)
+    if len(text) <= max_tokens and len(text.encode("utf-8", "surrogatepass")) <= max_tokens:
+        return text
+    encoding = encoding or get_encoding()
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    head = max_tokens // 2
+    tail = max_tokens - head
+    return encoding.decode(tokens[:head]) + TRIM_MARKER + encoding.decode(tokens[-tail:])